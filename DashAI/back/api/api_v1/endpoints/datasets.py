@@ -15,10 +15,10 @@ from DashAI.back.api.api_v1.schemas.datasets_params import (
 )
 from DashAI.back.api.utils import parse_params
 from DashAI.back.dataloaders.classes.dashai_dataset import (
-    DashAIDataset,
     get_columns_spec,
     get_dataset_info,
-    load_dataset,
+    get_dataset_manifest,
+    invalidate_dataset_cache,
     save_dataset,
     split_dataset,
     split_indexes,
@@ -135,8 +135,7 @@ async def get_sample(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Dataset not found",
                 )
-            dataset: DashAIDataset = load_dataset(f"{file_path}/dataset")
-            sample = dataset["train"].sample(n=10)
+            sample = get_dataset_manifest(f"{file_path}/dataset")["sample"]
         except exc.SQLAlchemyError as e:
             logger.exception(e)
             raise HTTPException(
@@ -386,6 +385,7 @@ async def delete_dataset(
             ) from e
 
     try:
+        invalidate_dataset_cache(f"{dataset.file_path}/dataset")
         shutil.rmtree(dataset.file_path, ignore_errors=True)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -1,4 +1,6 @@
+import json
 import logging
+import shutil
 from typing import Union
 
 from fastapi import APIRouter, Depends, Response, status
@@ -13,7 +15,9 @@ from DashAI.back.api.api_v1.schemas.experiments_params import (
 )
 from DashAI.back.dataloaders.classes.dashai_dataset import (
     get_column_names_from_indexes,
+    get_experiment_splits_path,
     load_dataset,
+    save_experiment_splits,
 )
 from DashAI.back.dependencies.database.models import Dataset, Experiment
 from DashAI.back.dependencies.registry import ComponentRegistry
@@ -209,7 +213,6 @@ async def create_experiment(
             db.add(experiment)
             db.commit()
             db.refresh(experiment)
-            return experiment
         except exc.SQLAlchemyError as e:
             log.exception(e)
             raise HTTPException(
@@ -217,6 +220,18 @@ async def create_experiment(
                 detail="Internal database error",
             ) from e
 
+        try:
+            save_experiment_splits(
+                datasetdict,
+                json.loads(params.splits),
+                get_experiment_splits_path(dataset.file_path, experiment.id),
+            )
+        except Exception as e:
+            # The jobs of the experiment try to save them again, and fail if the
+            # splits are not valid.
+            log.exception(e)
+        return experiment
+
 
 @router.delete("/{experiment_id}")
 @inject
@@ -246,8 +261,14 @@ async def delete_experiment(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Experiment not found",
                 )
+            dataset = db.get(Dataset, experiment.dataset_id)
             db.delete(experiment)
             db.commit()
+            if dataset:
+                shutil.rmtree(
+                    get_experiment_splits_path(dataset.file_path, experiment_id),
+                    ignore_errors=True,
+                )
             return Response(status_code=status.HTTP_204_NO_CONTENT)
         except exc.SQLAlchemyError as e:
             log.exception(e)
@@ -1,18 +1,32 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Union
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import Any, Dict, List, Tuple, Union
 
 import pandas as pd
+import pyarrow as pa
 from datasets import Dataset
 from fastapi import APIRouter, Depends, UploadFile, status
 from fastapi.exceptions import HTTPException
+from fastapi.responses import FileResponse
 from kink import di, inject
 from sqlalchemy import exc
 from sqlalchemy.orm import sessionmaker
 
-from DashAI.back.api.api_v1.schemas.predict_params import PredictParams
+from DashAI.back.api.api_v1.schemas.predict_params import (
+    BulkPredictParams,
+    PredictParams,
+    PredictRowsParams,
+)
+from DashAI.back.core.enums.status import PredictionStatus
 from DashAI.back.dataloaders.classes.dashai_dataset import to_dashai_dataset
 from DashAI.back.dataloaders.classes.dataloader import BaseDataLoader
-from DashAI.back.dependencies.database.models import Experiment, Run
+from DashAI.back.dependencies.database.models import Experiment, Prediction, Run
+from DashAI.back.dependencies.model_cache import ModelCache
+from DashAI.back.dependencies.prediction_batcher import PredictionBatcher
 from DashAI.back.dependencies.registry import ComponentRegistry
 from DashAI.back.models.base_model import BaseModel
 
@@ -22,6 +36,40 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _get_run_and_experiment(
+    run_id: int, session_factory: sessionmaker
+) -> Tuple[Run, Experiment]:
+    """Get a run and its experiment from the database.
+
+    Raises
+    ------
+    HTTPException
+        If the run or its experiment do not exist in the database.
+    """
+    with session_factory() as db:
+        try:
+            run: Run = db.get(Run, run_id)
+            if not run:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Run not found"
+                )
+
+            exp: Experiment = db.get(Experiment, run.experiment_id)
+            if not exp:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Experiment not found"
+                )
+
+        except exc.SQLAlchemyError as e:
+            logger.exception(e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal database error",
+            ) from e
+
+    return run, exp
+
+
 @router.get("/")
 @inject
 async def get_prediction():
@@ -46,6 +94,7 @@ async def predict(
     component_registry: ComponentRegistry = Depends(lambda: di["component_registry"]),
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
     config: Dict[str, Any] = Depends(lambda: di["config"]),
+    model_cache: ModelCache = Depends(lambda: di["model_cache"]),
 ) -> List[Any]:
     """Predict using a particular model.
 
@@ -64,6 +113,8 @@ async def predict(
         The generated session can be used to access and query the database.
     config: Dict[str, Any]
         Application settings.
+    model_cache : ModelCache
+        Cache of the trained models of the runs.
 
     Returns
     -------
@@ -78,6 +129,163 @@ async def predict(
         If experiment_id assoc. with the run does not exist in the database.
         If dataset_id assoc. with the experiment does not exist in the database.
     """
+    run, exp = _get_run_and_experiment(params.run_id, session_factory)
+
+    # Loading the model reads its files, so it is done outside the event loop.
+    model = component_registry[run.model_name]["class"]
+    trained_model: BaseModel = await asyncio.get_running_loop().run_in_executor(
+        None, model_cache.get, run.id, run.run_path, model
+    )
+
+    # Load Dataset using Dataloader
+    tmp_parent = config["DATASETS_PATH"] / "tmp_predict"
+    tmp_parent.mkdir(parents=True, exist_ok=True)
+    # Each request gets its own directory, so predictions of the same run can be
+    # made more than once and at the same time.
+    tmp_path = pathlib.Path(
+        tempfile.mkdtemp(prefix=f"{params.run_id}_", dir=tmp_parent)
+    )
+    logger.debug("Created a new dataset path: %s", tmp_path)
+
+    try:
+        dataloader: BaseDataLoader = component_registry["JSONDataLoader"]["class"]()
+        raw_dataset = dataloader.load_data(
+            filepath_or_buffer=input_file,
+            temp_path=str(tmp_path),
+            params={"data_key": "data"},
+        )
+        # TODO Extract this Code to DashAIDataset
+        input_df = pd.DataFrame(raw_dataset["train"])
+        input_df = input_df.reindex(columns=exp.input_columns)
+        raw_dataset["train"] = Dataset.from_pandas(input_df)
+        # ---------------------------------------
+        dataset = to_dashai_dataset(raw_dataset)
+
+        y_pred = trained_model.predict(dataset["train"])
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+    return y_pred.tolist()
+
+
+@router.post("/rows/")
+@inject
+async def predict_rows(
+    params: PredictRowsParams,
+    component_registry: ComponentRegistry = Depends(lambda: di["component_registry"]),
+    session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
+    model_cache: ModelCache = Depends(lambda: di["model_cache"]),
+    prediction_batcher: PredictionBatcher = Depends(lambda: di["prediction_batcher"]),
+) -> List[Any]:
+    """Predict the rows sent in the request body using a particular model.
+
+    Unlike the file upload endpoint, the rows are converted to an in memory Arrow
+    table, so nothing is written to disk.
+
+    Parameters
+    ----------
+    params : PredictRowsParams
+        Id of the run to be used to predict and the rows to predict, each one
+        a dict from the input columns of the experiment to their values.
+    component_registry : ComponentRegistry
+        Registry containing the current app available components.
+    session_factory : Callable[..., ContextManager[Session]]
+        A factory that creates a context manager that handles a SQLAlchemy session.
+        The generated session can be used to access and query the database.
+    model_cache : ModelCache
+        Cache of the trained models of the runs.
+    prediction_batcher : PredictionBatcher
+        Batcher that predicts the rows together with the ones of concurrent
+        requests to the same run.
+
+    Returns
+    -------
+    List
+        A list with the predictions given by the run, one for each row.
+
+    Raises
+    ------
+    HTTPException
+        If run_id does not exist in the database.
+        If experiment_id assoc. with the run does not exist in the database.
+        If a row lacks an input column of the experiment.
+        If the values of a column can not be converted to a single type.
+    """
+    run, exp = _get_run_and_experiment(params.run_id, session_factory)
+
+    for index, row in enumerate(params.data):
+        missing_columns = [column for column in exp.input_columns if column not in row]
+        if missing_columns:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Row {index} lacks the input columns {missing_columns}",
+            )
+    try:
+        table = pa.Table.from_pydict(
+            {
+                column: [row[column] for row in params.data]
+                for column in exp.input_columns
+            }
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid rows: {e}",
+        ) from e
+
+    # Loading the model reads its files, so it is done outside the event loop.
+    model = component_registry[run.model_name]["class"]
+    trained_model: BaseModel = await asyncio.get_running_loop().run_in_executor(
+        None, model_cache.get, run.id, run.run_path, model
+    )
+    y_pred = await prediction_batcher.predict(trained_model, table)
+
+    return y_pred if isinstance(y_pred, list) else y_pred.tolist()
+
+
+@router.post("/bulk/", status_code=status.HTTP_201_CREATED)
+@inject
+async def upload_bulk_prediction(
+    input_file: UploadFile,
+    params: BulkPredictParams = Depends(),
+    session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
+    config: Dict[str, Any] = Depends(lambda: di["config"]),
+):
+    """Store a CSV or Parquet file to be predicted by a PredictionJob.
+
+    The file is copied to disk in chunks, so it can be larger than the memory.
+
+    Parameters
+    ----------
+    input_file: UploadFile
+        CSV or Parquet file with the input columns of the experiment of the run.
+    params : BulkPredictParams
+        Id of the run to be used to predict and format of the file with the
+        predictions, "parquet" or "csv".
+    session_factory : Callable[..., ContextManager[Session]]
+        A factory that creates a context manager that handles a SQLAlchemy session.
+        The generated session can be used to access and query the database.
+    config: Dict[str, Any]
+        Application settings.
+
+    Returns
+    -------
+    dict
+        Dict with the new prediction.
+
+    Raises
+    ------
+    HTTPException
+        If the file is not a CSV or Parquet file.
+        If run_id does not exist in the database.
+    """
+    extension = os.path.splitext(input_file.filename or "")[1].lower()
+    if extension not in (".csv", ".parquet"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The file must be a CSV or Parquet file",
+        )
+
     with session_factory() as db:
         try:
             run: Run = db.get(Run, params.run_id)
@@ -86,11 +294,72 @@ async def predict(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Run not found"
                 )
 
-            exp: Experiment = db.get(Experiment, run.experiment_id)
-            if not exp:
+            prediction = Prediction(
+                run_id=params.run_id, output_format=params.output_format
+            )
+            db.add(prediction)
+            db.flush()
+
+            prediction_path = config["RUNS_PATH"] / "predictions" / str(prediction.id)
+            prediction_path.mkdir(parents=True, exist_ok=True)
+            prediction.input_path = str(prediction_path / f"input{extension}")
+            with open(prediction.input_path, "wb") as file:
+                shutil.copyfileobj(input_file.file, file)
+
+            db.commit()
+            db.refresh(prediction)
+            return prediction
+
+        except exc.SQLAlchemyError as e:
+            logger.exception(e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal database error",
+            ) from e
+        except OSError as e:
+            logger.exception(e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to save the file",
+            ) from e
+
+
+@router.get("/bulk/{prediction_id}")
+@inject
+async def get_bulk_prediction(
+    prediction_id: int,
+    session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
+):
+    """Return a bulk prediction, with its status and progress.
+
+    Parameters
+    ----------
+    prediction_id : int
+        Id of the prediction.
+    session_factory : Callable[..., ContextManager[Session]]
+        A factory that creates a context manager that handles a SQLAlchemy session.
+        The generated session can be used to access and query the database.
+
+    Returns
+    -------
+    dict
+        Dict with the prediction. processed_rows is the number of rows predicted
+        so far, and total_rows the number of rows of the file, if it is known.
+
+    Raises
+    ------
+    HTTPException
+        If the prediction does not exist in the database.
+    """
+    with session_factory() as db:
+        try:
+            prediction = db.get(Prediction, prediction_id)
+            if not prediction:
                 raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Experiment not found"
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Prediction not found",
                 )
+            return prediction
 
         except exc.SQLAlchemyError as e:
             logger.exception(e)
@@ -99,38 +368,52 @@ async def predict(
                 detail="Internal database error",
             ) from e
 
-    model = component_registry[run.model_name]["class"]
-    trained_model: BaseModel = model.load(run.run_path)
 
-    # Load Dataset using Dataloader
-    tmp_path = config["DATASETS_PATH"] / "tmp_predict" / str(params.run_id)
+@router.get("/bulk/{prediction_id}/file")
+@inject
+async def get_bulk_prediction_file(
+    prediction_id: int,
+    session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
+):
+    """Download the file with the predictions of a finished bulk prediction.
 
-    try:
-        logger.debug("Trying to create a new dataset path: %s", tmp_path)
-        tmp_path.mkdir(parents=True, exist_ok=False)
-    except FileExistsError as e:
-        logger.exception(e)
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="A dataset with this name already exists",
-        ) from e
+    Parameters
+    ----------
+    prediction_id : int
+        Id of the prediction.
+    session_factory : Callable[..., ContextManager[Session]]
+        A factory that creates a context manager that handles a SQLAlchemy session.
+        The generated session can be used to access and query the database.
 
-    dataloader: BaseDataLoader = component_registry["JSONDataLoader"]["class"]()
-    raw_dataset = dataloader.load_data(
-        filepath_or_buffer=input_file,
-        temp_path=str(tmp_path),
-        params={"data_key": "data"},
-    )
-    # TODO Extract this Code to DashAIDataset
-    input_df = pd.DataFrame(raw_dataset["train"])
-    input_df = input_df.reindex(columns=exp.input_columns)
-    raw_dataset["train"] = Dataset.from_pandas(input_df)
-    # ---------------------------------------
-    dataset = to_dashai_dataset(raw_dataset)
+    Returns
+    -------
+    FileResponse
+        The Parquet or CSV file with the predictions.
 
-    y_pred = trained_model.predict(dataset["train"])
+    Raises
+    ------
+    HTTPException
+        If the prediction does not exist in the database or it is not finished.
+    """
+    with session_factory() as db:
+        try:
+            prediction = db.get(Prediction, prediction_id)
+        except exc.SQLAlchemyError as e:
+            logger.exception(e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Internal database error",
+            ) from e
 
-    return y_pred.tolist()
+    if not prediction or prediction.status != PredictionStatus.FINISHED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Prediction file not found",
+        )
+    return FileResponse(
+        prediction.output_path,
+        filename=os.path.basename(prediction.output_path),
+    )
 
 
 @router.delete("/")
@@ -11,6 +11,7 @@ from sqlalchemy.orm import sessionmaker
 
 from DashAI.back.api.api_v1.schemas.runs_params import RunParams
 from DashAI.back.dependencies.database.models import Experiment, Run, RunStatus
+from DashAI.back.dependencies.model_cache import ModelCache
 
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
@@ -209,6 +210,7 @@ async def upload_run(
 async def delete_run(
     run_id: int,
     session_factory: sessionmaker = Depends(lambda: di["session_factory"]),
+    model_cache: ModelCache = Depends(lambda: di["model_cache"]),
 ):
     """Delete the run associated with the provided ID from the database.
 
@@ -219,6 +221,8 @@ async def delete_run(
     session_factory : Callable[..., ContextManager[Session]]
         A factory that creates a context manager that handles a SQLAlchemy session.
         The generated session can be used to access and query the database.
+    model_cache : ModelCache
+        Cache of the trained models of the runs.
 
     Returns
     -------
@@ -239,8 +243,12 @@ async def delete_run(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Run not found"
                 )
             db.delete(run)
+            model_cache.invalidate(run_id)
             if run.status == RunStatus.FINISHED:
                 os.remove(run.run_path)
+                predictions_path = (run.artifacts or {}).get("predictions_path")
+                if predictions_path and os.path.exists(predictions_path):
+                    os.remove(predictions_path)
             db.commit()
             return Response(status_code=status.HTTP_204_NO_CONTENT)
         except exc.SQLAlchemyError as e:
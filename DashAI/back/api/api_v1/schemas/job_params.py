@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -6,5 +6,7 @@ from pydantic import BaseModel, ConfigDict
 class JobParams(BaseModel):
     model_config = ConfigDict(extra="allow")
 
-    job_type: Literal["ModelJob", "ExplainerJob"]
+    job_type: Literal["ModelJob", "ExplainerJob", "PredictionJob"]
     kwargs: dict
+    priority: Optional[int] = None
+    estimated_cost: Optional[float] = None
@@ -1,5 +1,17 @@
-from pydantic import BaseModel
+from typing import Any, Dict, List, Literal
+
+from pydantic import BaseModel, Field
 
 
 class PredictParams(BaseModel):
     run_id: int
+
+
+class PredictRowsParams(BaseModel):
+    run_id: int
+    data: List[Dict[str, Any]] = Field(min_length=1)
+
+
+class BulkPredictParams(BaseModel):
+    run_id: int
+    output_format: Literal["parquet", "csv"] = "parquet"
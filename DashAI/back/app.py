@@ -1,5 +1,6 @@
 """FastAPI Application module."""
 
+import asyncio
 import logging
 import pathlib
 from typing import Literal, Union
@@ -14,6 +15,7 @@ from DashAI.back.api.front_api import router as app_router
 from DashAI.back.container import build_container
 from DashAI.back.dependencies.config_builder import build_config_dict
 from DashAI.back.dependencies.database.models import Base
+from DashAI.back.dependencies.job_queues.job_queue import job_queue_loop
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +43,8 @@ def create_app(
     2. Set the logging level for all subpackages.
     3. Initialize the dependency injection container and wires the subpackages.
     4. Create the local paths where the files are stored.
-    5. Initialize the SQlite database.
+    5. Initialize the SQlite database and recover the unfinished jobs, which
+    are executed when the application starts.
     6. Initialize the FastAPI application and mount the API routers.
 
     Parameters
@@ -82,6 +85,9 @@ def create_app(
     logger.debug("5. Creating database.")
     Base.metadata.create_all(bind=container["engine"])
 
+    logger.debug("Recovering unfinished jobs.")
+    recovered_jobs = container["job_queue"].recover()
+
     logger.debug("6. Initializing FastAPI application.")
     app = FastAPI(title="DashAI")
     api_v0 = FastAPI(title="DashAI API v0")
@@ -103,6 +109,16 @@ def create_app(
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if recovered_jobs > 0:
+
+        async def run_recovered_jobs() -> None:
+            """Execute the recovered jobs once the application starts."""
+            app.state.recovered_jobs_loop = asyncio.create_task(
+                job_queue_loop(stop_when_queue_empties=True)
+            )
+
+        app.add_event_handler("startup", run_recovered_jobs)
+    app.add_event_handler("shutdown", container["job_executor"].shutdown)
     app.container = container
     logger.debug("Application successfully created.")
 
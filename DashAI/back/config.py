@@ -13,3 +13,11 @@ class DefaultSettings(BaseSettings):
     DATASETS_PATH: str = "datasets"
     RUNS_PATH: str = "runs"
     EXPLANATIONS_PATH: str = "explanations"
+
+    JOB_QUEUE: str = "sqlite"
+    JOB_EXECUTOR: str = "thread"
+    MAX_CONCURRENT_JOBS: int = 1
+
+    MODEL_CACHE_SIZE: int = 2_000_000_000
+    PREDICTION_BATCH_SIZE: int = 1
+    PREDICTION_BATCH_DELAY: float = 0.01
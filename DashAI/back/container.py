@@ -2,6 +2,7 @@ import logging
 from typing import Dict
 
 from kink import Container, di
+from sqlalchemy.orm import sessionmaker
 
 from DashAI.back.dataloaders import (
     CSVDataLoader,
@@ -10,7 +11,18 @@ from DashAI.back.dataloaders import (
     JSONDataLoader,
 )
 from DashAI.back.dependencies.database import setup_sqlite_db
-from DashAI.back.dependencies.job_queues import SimpleJobQueue
+from DashAI.back.dependencies.job_executors import (
+    BaseJobExecutor,
+    ProcessJobExecutor,
+    ThreadJobExecutor,
+)
+from DashAI.back.dependencies.job_queues import (
+    BaseJobQueue,
+    SimpleJobQueue,
+    SQLiteJobQueue,
+)
+from DashAI.back.dependencies.model_cache import ModelCache
+from DashAI.back.dependencies.prediction_batcher import PredictionBatcher
 from DashAI.back.dependencies.registry import ComponentRegistry
 from DashAI.back.explainability import (
     FitKernelShap,
@@ -18,7 +30,7 @@ from DashAI.back.explainability import (
     PartialDependence,
     PermutationFeatureImportance,
 )
-from DashAI.back.job import ExplainerJob, ModelJob
+from DashAI.back.job import ExplainerJob, ModelJob, PredictionJob
 from DashAI.back.metrics import F1, Accuracy, Bleu, Precision, Recall
 from DashAI.back.models import (
     SVC,
@@ -82,6 +94,7 @@ INITIAL_COMPONENTS = [
     # Jobs
     ExplainerJob,
     ModelJob,
+    PredictionJob,
     # Explainers
     KernelShap,
     PartialDependence,
@@ -91,9 +104,63 @@ INITIAL_COMPONENTS = [
 ]
 
 
-def build_container(config: Dict[str, str]) -> Container:
+def _build_job_queue(
+    config: Dict[str, str], session_factory: sessionmaker
+) -> BaseJobQueue:
+    """Create the job queue selected in the configuration.
+
+    Parameters
+    ----------
+    config : Dict[str, str]
+        A dictionary containing configuration settings.
+    session_factory : sessionmaker
+        The app database session factory.
+
+    Returns
+    -------
+    BaseJobQueue
+        The app job queue.
     """
-    Creates a dependency injection container for the application.
+    if config["JOB_QUEUE"] == "sqlite":
+        return SQLiteJobQueue(session_factory=session_factory)
+    if config["JOB_QUEUE"] == "simple":
+        return SimpleJobQueue()
+    raise ValueError(
+        f"JOB_QUEUE should be 'sqlite' or 'simple', got {config['JOB_QUEUE']}."
+    )
+
+
+def _build_job_executor(config: Dict[str, str]) -> BaseJobExecutor:
+    """Create the job executor selected in the configuration.
+
+    Parameters
+    ----------
+    config : Dict[str, str]
+        A dictionary containing configuration settings.
+
+    Returns
+    -------
+    BaseJobExecutor
+        The app job executor.
+    """
+    if config["JOB_EXECUTOR"] == "thread":
+        return ThreadJobExecutor(max_workers=config["MAX_CONCURRENT_JOBS"])
+    if config["JOB_EXECUTOR"] == "process":
+        return ProcessJobExecutor(
+            config=config, max_workers=config["MAX_CONCURRENT_JOBS"]
+        )
+    raise ValueError(
+        "JOB_EXECUTOR should be 'thread' or 'process', "
+        f"got {config['JOB_EXECUTOR']}."
+    )
+
+
+def build_worker_container(config: Dict[str, str]) -> Container:
+    """
+    Creates the dependency injection container of a job worker process.
+
+    Worker processes only run jobs, so they get the services used by the jobs
+    and neither the job queue, the job executor nor the prediction batcher.
 
     Parameters
     ----------
@@ -103,13 +170,12 @@ def build_container(config: Dict[str, str]) -> Container:
     Returns
     -------
     Container
-        A dependency injection container instance populated with
-        essential services. These services include:
+        A dependency injection container instance populated with:
             * 'config': The provided configuration dictionary.
             * Engine: The created SQLAlchemy engine for the SQLite database.
             * sessionmaker: A session factory for creating database sessions.
             * ComponentRegistry: The app component registry.
-            * BaseJobQueue: The app job queue.
+            * ModelCache: The cache of the trained models of the runs.
     """
     engine, session_factory = setup_sqlite_db(config)
 
@@ -117,6 +183,40 @@ def build_container(config: Dict[str, str]) -> Container:
     di["engine"] = engine
     di["session_factory"] = session_factory
     di["component_registry"] = ComponentRegistry(initial_components=INITIAL_COMPONENTS)
-    di["job_queue"] = SimpleJobQueue()
+    di["model_cache"] = ModelCache(max_size=config["MODEL_CACHE_SIZE"])
+
+    return di
+
+
+def build_container(config: Dict[str, str]) -> Container:
+    """
+    Creates a dependency injection container for the application.
+
+    Parameters
+    ----------
+    config : Dict[str, str]
+        A dictionary containing configuration settings.
+
+    Returns
+    -------
+    Container
+        A dependency injection container instance populated with
+        essential services. These services include:
+            * 'config': The provided configuration dictionary.
+            * Engine: The created SQLAlchemy engine for the SQLite database.
+            * sessionmaker: A session factory for creating database sessions.
+            * ComponentRegistry: The app component registry.
+            * BaseJobQueue: The app job queue.
+            * BaseJobExecutor: The app job executor.
+            * ModelCache: The cache of the trained models of the runs.
+            * PredictionBatcher: The batcher of concurrent prediction requests.
+    """
+    build_worker_container(config)
+    di["job_queue"] = _build_job_queue(config, di["session_factory"])
+    di["job_executor"] = _build_job_executor(config)
+    di["prediction_batcher"] = PredictionBatcher(
+        max_batch_size=config["PREDICTION_BATCH_SIZE"],
+        max_delay=config["PREDICTION_BATCH_DELAY"],
+    )
 
     return di
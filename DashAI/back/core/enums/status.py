@@ -15,3 +15,16 @@ class RunStatus(Enum):
     STARTED = 2
     FINISHED = 3
     ERROR = 4
+
+
+class PredictionStatus(Enum):
+    NOT_STARTED = 0
+    DELIVERED = 1
+    STARTED = 2
+    FINISHED = 3
+    ERROR = 4
+
+
+class JobStatus(Enum):
+    PENDING = 0
+    STARTED = 1
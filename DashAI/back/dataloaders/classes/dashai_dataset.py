@@ -1,24 +1,49 @@
 """DashAI Dataset implementation."""
 
+import contextlib
 import json
 import os
 import pathlib
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Literal, Tuple, Union
 
 import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 from beartype import beartype
 from datasets import (
     ClassLabel,
     Dataset,
     DatasetDict,
+    Features,
     Value,
     concatenate_datasets,
     load_from_disk,
 )
-from datasets.table import Table
+from datasets.fingerprint import Hasher
+from datasets.table import InMemoryTable, Table
 from sklearn.model_selection import train_test_split
 
+SPLIT_NAMES = ("train", "test", "validation")
+# File with the metadata of a saved dataset, and number of rows in its sample.
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_SAMPLE_SIZE = 10
+# Maximum number of opened datasets kept by load_dataset.
+DATASET_CACHE_SIZE = 8
+
+_dataset_cache: "OrderedDict[str, Tuple[Tuple[int, ...], Dict[str, Table]]]" = (
+    OrderedDict()
+)
+_dataset_cache_lock = threading.Lock()
+# Maximum number of ClassLabel features kept by get_class_label.
+CLASS_LABEL_CACHE_SIZE = 128
+
+_class_label_cache: "OrderedDict[Tuple[str, str], ClassLabel]" = OrderedDict()
+_class_label_cache_lock = threading.Lock()
+
 
 class DashAIDataset(Dataset):
     """DashAI dataset wrapper for Huggingface datasets with extra metadata."""
@@ -92,14 +117,19 @@ class DashAIDataset(Dataset):
                     f"Error while changing column types: column '{column}' does not "
                     "exist in dataset."
                 )
-        new_features = self.features.copy()
+        class_labels = {
+            column: get_class_label(self, column)
+            for column in column_types
+            if column_types[column] == "Categorical"
+        }
+        dataset = encode_class_labels(self, class_labels)
+        new_features = dataset.features.copy()
         for column in column_types:
             if column_types[column] == "Categorical":
-                names = list(set(self[column]))
-                new_features[column] = ClassLabel(names=names)
+                new_features[column] = class_labels[column]
             elif column_types[column] == "Numerical":
                 new_features[column] = Value("float32")
-        dataset = self.cast(new_features)
+        dataset = dataset.cast(new_features)
         return dataset
 
     @beartype
@@ -173,12 +203,128 @@ class DashAIDataset(Dataset):
         return sample
 
 
+@beartype
+def get_class_label(dataset: Dataset, column: str) -> ClassLabel:
+    """Get a ClassLabel feature with the values of a column as class names.
+
+    The names are the unique values of the column in ascending order, so the
+    same values always get the same labels. They are computed with Arrow, and
+    cached by the fingerprint of the dataset.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        Dataset with the column.
+    column : str
+        Name of the column.
+
+    Returns
+    -------
+    ClassLabel
+        The feature with the class names of the column.
+    """
+    key = (dataset._fingerprint, column)
+    with _class_label_cache_lock:
+        if key in _class_label_cache:
+            _class_label_cache.move_to_end(key)
+            return _class_label_cache[key]
+
+    values = dataset.data.column(column)
+    # Views of a table, e.g. the splits of an experiment, have their rows in the
+    # indices mapping.
+    if dataset._indices is not None:
+        values = values.take(dataset._indices.column(0))
+    names = pc.unique(values).drop_null()
+    names = names.take(pc.array_sort_indices(names))
+    class_label = ClassLabel(names=names.to_pylist())
+
+    with _class_label_cache_lock:
+        _class_label_cache[key] = class_label
+        while len(_class_label_cache) > CLASS_LABEL_CACHE_SIZE:
+            _class_label_cache.popitem(last=False)
+    return class_label
+
+
+@beartype
+def encode_class_labels(
+    dataset: Dataset, class_labels: Dict[str, ClassLabel]
+) -> Dataset:
+    """Replace the text values of some columns by their labels.
+
+    The labels of all the rows are computed with Arrow, so casting the columns
+    to their ClassLabel afterwards does not look them up one row at a time.
+    Columns that are not text are kept, since casting them already is columnar.
+    The columns are replaced in the underlying Arrow table, because the
+    concatenated tables of the experiment splits do not support it.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        Dataset with the columns.
+    class_labels : Dict[str, ClassLabel]
+        ClassLabel feature of each column, whose names are the values of the
+        column.
+
+    Returns
+    -------
+    Dataset
+        Dataset of the same class with the text columns encoded as int64.
+    """
+    table = dataset.data.table
+    features = dataset.features.copy()
+    for column, class_label in class_labels.items():
+        values = table.column(column)
+        if not (
+            pa.types.is_string(values.type) or pa.types.is_large_string(values.type)
+        ):
+            continue
+        labels = pc.index_in(
+            values, value_set=pa.array(class_label.names, type=values.type)
+        )
+        table = table.set_column(
+            table.column_names.index(column),
+            pa.field(column, pa.int64()),
+            labels.cast(pa.int64()),
+        )
+        features[column] = Value("int64")
+
+    if table is dataset.data.table:
+        return dataset
+    info = dataset.info.copy()
+    info.features = features
+    return type(dataset)(
+        InMemoryTable(table), info=info, indices_table=dataset._indices
+    )
+
+
+def _dataset_version(dataset_path: str) -> Tuple[int, ...]:
+    """Last modification times of the files written when a dataset is saved.
+
+    Every split gets a new state.json each time it is saved, so a dataset saved
+    again in the same path gets a new version. Other files written in the
+    dataset directory, e.g. the manifest or the cache files of the casts, do not
+    change it.
+    """
+    version = [os.stat(os.path.join(dataset_path, "dataset_dict.json")).st_mtime_ns]
+    with os.scandir(dataset_path) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            state_path = os.path.join(entry.path, "state.json")
+            if entry.is_dir() and os.path.exists(state_path):
+                version.append(os.stat(state_path).st_mtime_ns)
+    return tuple(version)
+
+
 @beartype
 def load_dataset(dataset_path: str) -> DatasetDict:
     """Load a DashAI dataset from its path.
 
          This process cast each split into a DashAIdataset object.
 
+    The last opened datasets are kept in a process-wide cache, so loading them
+    again does not read their files. Each call gets new DashAIDataset objects
+    over the same Arrow tables, which are never modified in place, so the
+    callers can change the returned datasets.
+
     Parameters
     ----------
     dataset_path : str
@@ -189,12 +335,42 @@ def load_dataset(dataset_path: str) -> DatasetDict:
     DatasetDict
         The loaded dataset.
     """
-    dataset = load_from_disk(dataset_path=dataset_path)
+    dataset_path = os.path.abspath(dataset_path)
+    version = _dataset_version(dataset_path)
+    with _dataset_cache_lock:
+        cached = _dataset_cache.get(dataset_path)
+        if cached is not None and cached[0] == version:
+            _dataset_cache.move_to_end(dataset_path)
+            tables = cached[1]
+        else:
+            tables = None
+
+    if tables is None:
+        dataset = load_from_disk(dataset_path=dataset_path)
+        tables = {split: dataset[split].data for split in dataset}
+        with _dataset_cache_lock:
+            _dataset_cache[dataset_path] = (version, tables)
+            _dataset_cache.move_to_end(dataset_path)
+            while len(_dataset_cache) > DATASET_CACHE_SIZE:
+                _dataset_cache.popitem(last=False)
+
+    return DatasetDict({split: DashAIDataset(table) for split, table in tables.items()})
 
-    for split in dataset:
-        dataset[split] = DashAIDataset(dataset[split].data)
 
-    return dataset
+@beartype
+def invalidate_dataset_cache(dataset_path: str) -> None:
+    """Remove a dataset from the cache of load_dataset.
+
+    It must be called before the files of the dataset are changed or deleted,
+    so the memory maps of its files are released.
+
+    Parameters
+    ----------
+    dataset_path : str
+        Path where the dataset is stored.
+    """
+    with _dataset_cache_lock:
+        _dataset_cache.pop(os.path.abspath(dataset_path), None)
 
 
 @beartype
@@ -210,6 +386,7 @@ def save_dataset(datasetdict: DatasetDict, path: Union[str, pathlib.Path]) -> No
         Path where the dtaaset will be stored.
 
     """
+    invalidate_dataset_cache(str(path))
     splits = []
     for split in datasetdict:
         splits.append(split)
@@ -227,6 +404,104 @@ def save_dataset(datasetdict: DatasetDict, path: Union[str, pathlib.Path]) -> No
             ensure_ascii=False,
         )
 
+    _write_manifest(datasetdict, str(path))
+
+
+def _column_statistics(column: pa.ChunkedArray) -> Dict[str, object]:
+    """Compute the number of nulls, and the minimum, maximum and mean of the
+    numerical columns."""
+    statistics = {"null_count": column.null_count}
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        min_max = pc.min_max(column)
+        statistics["min"] = min_max["min"].as_py()
+        statistics["max"] = min_max["max"].as_py()
+        statistics["mean"] = pc.mean(column).as_py()
+    return statistics
+
+
+def _write_manifest(datasetdict: DatasetDict, dataset_path: str) -> Dict:
+    """Write the manifest with the metadata of a dataset saved in dataset_path.
+
+    The manifest has the number of rows of each split, the features, statistics
+    of each column over all the splits and a sample with the first rows of the
+    train split.
+    """
+    train = datasetdict["train"]
+    statistics = {}
+    for column in train.column_names:
+        chunks = []
+        for split in datasetdict.values():
+            # Views of a table, e.g. the splits of an experiment, have their rows
+            # in the indices mapping.
+            data = split.flatten_indices() if split._indices is not None else split
+            chunks.extend(data.data.column(column).chunks)
+        statistics[column] = _column_statistics(
+            pa.chunked_array(chunks, type=train.data.schema.field(column).type)
+        )
+
+    manifest = {
+        "splits": {
+            split: {"num_rows": dataset.num_rows}
+            for split, dataset in datasetdict.items()
+        },
+        "features": train.features.to_dict(),
+        "statistics": statistics,
+        "sample": train[:MANIFEST_SAMPLE_SIZE],
+    }
+    # The values of the sample that are not JSON, e.g. images, are rendered as
+    # strings.
+    content = json.dumps(manifest, ensure_ascii=False, default=str)
+
+    # The manifest is written to a temporary file and then moved, so readers
+    # never find it half written.
+    manifest_path = os.path.join(dataset_path, MANIFEST_FILENAME)
+    with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as manifest_file:
+        manifest_file.write(content)
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+    return json.loads(content)
+
+
+@beartype
+def get_dataset_manifest(dataset_path: str) -> Dict:
+    """Get the metadata of a saved dataset without loading its data.
+
+    The manifest is written by save_dataset. Datasets saved without one, or
+    whose manifest was invalidated, get it written the first time it is
+    requested.
+
+    Parameters
+    ----------
+    dataset_path : str
+        Path where the dataset is stored.
+
+    Returns
+    -------
+    Dict
+        Dict with the number of rows of each split ("splits"), the features
+        ("features"), the statistics of each column ("statistics") and the
+        first rows of the train split ("sample").
+    """
+    try:
+        with open(
+            os.path.join(dataset_path, MANIFEST_FILENAME), encoding="utf-8"
+        ) as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        return _write_manifest(load_dataset(dataset_path), dataset_path)
+
+
+@beartype
+def invalidate_dataset_manifest(dataset_path: str) -> None:
+    """Remove the manifest of a dataset whose data changed.
+
+    Parameters
+    ----------
+    dataset_path : str
+        Path where the dataset is stored.
+    """
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(os.path.join(dataset_path, MANIFEST_FILENAME))
+
 
 @beartype
 def check_split_values(
@@ -259,8 +534,8 @@ def split_indexes(
     val_size: float,
     seed: Union[int, None] = None,
     shuffle: bool = True,
-) -> Tuple[List, List, List]:
-    """Generate lists with train, test and validation indexes.
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Generate arrays with train, test and validation indexes.
 
     The algorithm for splitting the dataset is as follows:
 
@@ -297,13 +572,13 @@ def split_indexes(
 
     Returns
     -------
-    Tuple[List, List, List]
-        Train, Test and Validation indexes.
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Train, Test and Validation indexes, as int64 arrays.
     """
 
     # Generate shuffled indexes
     np.random.seed(seed)
-    indexes = np.arange(total_rows)
+    indexes = np.arange(total_rows, dtype=np.int64)
 
     test_val = test_size + val_size
     val_proportion = test_size / test_val
@@ -319,15 +594,49 @@ def split_indexes(
         random_state=seed,
         shuffle=shuffle,
     )
-    return list(train_indexes), list(test_indexes), list(val_indexes)
+    return train_indexes, test_indexes, val_indexes
+
+
+def _normalize_indexes(indexes: Union[List, np.ndarray], total_rows: int) -> np.ndarray:
+    """Sort the indexes of some rows, removing the repeated and out of range ones."""
+    indexes = np.unique(np.asarray(indexes, dtype=np.int64))
+    return indexes[(indexes >= 0) & (indexes < total_rows)]
+
+
+def _take_rows(table: Table, indexes: Union[List, np.ndarray]) -> Table:
+    """Get the rows of a table at the given indexes, in ascending order.
+
+    Repeated and out of range indexes are ignored. A contiguous range of rows is
+    sliced without copying the data, any other selection is gathered by Arrow
+    in a single pass over the table.
+
+    Parameters
+    ----------
+    table : Table
+        Table with the rows of the dataset.
+    indexes : Union[List, np.ndarray]
+        Indexes of the rows to get.
+
+    Returns
+    -------
+    Table
+        Table with the selected rows.
+    """
+    indexes = _normalize_indexes(indexes, len(table))
+
+    if len(indexes) == 0:
+        return table.slice(0, 0)
+    if indexes[-1] - indexes[0] + 1 == len(indexes):
+        return table.slice(int(indexes[0]), len(indexes))
+    return InMemoryTable(table.table.take(pa.array(indexes)))
 
 
 @beartype
 def split_dataset(
     dataset: Dataset,
-    train_indexes: List,
-    test_indexes: List,
-    val_indexes: List,
+    train_indexes: Union[List, np.ndarray],
+    test_indexes: Union[List, np.ndarray],
+    val_indexes: Union[List, np.ndarray],
 ) -> DatasetDict:
     """Split the dataset in train, test and validation subsets.
 
@@ -335,11 +644,11 @@ def split_dataset(
     ----------
     dataset : DatasetDict
         A HuggingFace DatasetDict containing the dataset to be split.
-    train_indexes : List
+    train_indexes : Union[List, np.ndarray]
         Train split indexes.
-    test_indexes : List
+    test_indexes : Union[List, np.ndarray]
         Test split indexes.
-    val_indexes : List
+    val_indexes : Union[List, np.ndarray]
         Validation split indexes.
 
 
@@ -349,27 +658,14 @@ def split_dataset(
         The split dataset.
     """
 
-    # Get the number of records
-    n = len(dataset)
-
-    # Convert the indexes into boolean masks
-    train_mask = np.isin(np.arange(n), train_indexes)
-    test_mask = np.isin(np.arange(n), test_indexes)
-    val_mask = np.isin(np.arange(n), val_indexes)
-
     # Get the underlying table
     table = dataset.data
 
-    # Create separate tables for each split
-    train_table = table.filter(pa.array(train_mask))
-    test_table = table.filter(pa.array(test_mask))
-    val_table = table.filter(pa.array(val_mask))
-
     separate_dataset_dict = DatasetDict(
         {
-            "train": Dataset(train_table),
-            "test": Dataset(test_table),
-            "validation": Dataset(val_table),
+            "train": Dataset(_take_rows(table, train_indexes)),
+            "test": Dataset(_take_rows(table, test_indexes)),
+            "validation": Dataset(_take_rows(table, val_indexes)),
         }
     )
 
@@ -507,8 +803,9 @@ def get_columns_spec(dataset_path: str) -> Dict[str, Dict]:
     Dict
         Dict with the columns and types
     """
-    dataset = load_dataset(dataset_path=dataset_path)
-    dataset_features = dataset["train"].features
+    dataset_features = Features.from_dict(
+        get_dataset_manifest(dataset_path)["features"]
+    )
     column_types = {}
     for column in dataset_features:
         if dataset_features[column]._type == "Value":
@@ -545,13 +842,20 @@ def update_columns_spec(dataset_path: str, columns: Dict) -> DatasetDict:
 
     # load the dataset from where its stored
     dataset_dict = load_from_disk(dataset_path=dataset_path)
+    invalidate_dataset_cache(dataset_path)
+    invalidate_dataset_manifest(dataset_path)
     for split in dataset_dict:
         # copy the features with the columns ans types
         new_features = dataset_dict[split].features
+        class_labels = {
+            column: get_class_label(dataset_dict[split], column)
+            for column in columns
+            if columns[column].type == "ClassLabel"
+        }
+        dataset_dict[split] = encode_class_labels(dataset_dict[split], class_labels)
         for column in columns:
             if columns[column].type == "ClassLabel":
-                names = list(set(dataset_dict[split][column]))
-                new_features[column] = ClassLabel(names=names)
+                new_features[column] = class_labels[column]
             elif columns[column].type == "Value":
                 new_features[column] = Value(columns[column].dtype)
 
@@ -578,15 +882,16 @@ def get_dataset_info(dataset_path: str) -> object:
     object
         Dictionary with the information of the dataset
     """
-    dataset = load_dataset(dataset_path=dataset_path)
-    total_rows = sum(split.num_rows for split in dataset.values())
-    total_columns = len(dataset["train"].features)
+    manifest = get_dataset_manifest(dataset_path)
+    splits = manifest["splits"]
+    total_rows = sum(split["num_rows"] for split in splits.values())
+    total_columns = len(manifest["features"])
     dataset_info = {
         "total_rows": total_rows,
         "total_columns": total_columns,
-        "train_size": dataset["train"].num_rows,
-        "test_size": dataset["test"].num_rows,
-        "val_size": dataset["validation"].num_rows,
+        "train_size": splits["train"]["num_rows"],
+        "test_size": splits["test"]["num_rows"],
+        "val_size": splits["validation"]["num_rows"],
     }
     return dataset_info
 
@@ -612,21 +917,181 @@ def update_dataset_splits(
     concatenated_dataset = concatenate_datasets(
         [datasetdict["train"], datasetdict["test"], datasetdict["validation"]]
     )
-    n = len(concatenated_dataset)
-    if is_random:
-        check_split_values(
-            new_splits["train"], new_splits["test"], new_splits["validation"]
-        )
-        train_indexes, test_indexes, val_indexes = split_indexes(
-            n, new_splits["train"], new_splits["test"], new_splits["validation"]
-        )
-    else:
-        train_indexes = new_splits["train"]
-        test_indexes = new_splits["test"]
-        val_indexes = new_splits["validation"]
+    train_indexes, test_indexes, val_indexes = _new_split_indexes(
+        len(concatenated_dataset), new_splits, is_random
+    )
     return split_dataset(
         dataset=concatenated_dataset,
         train_indexes=train_indexes,
         test_indexes=test_indexes,
         val_indexes=val_indexes,
     )
+
+
+def _new_split_indexes(
+    total_rows: int, new_splits: object, is_random: bool
+) -> Tuple[Union[List, np.ndarray], ...]:
+    """Get the train, test and validation indexes of a new splits configuration."""
+    if is_random:
+        check_split_values(
+            new_splits["train"], new_splits["test"], new_splits["validation"]
+        )
+        return split_indexes(
+            total_rows,
+            new_splits["train"],
+            new_splits["test"],
+            new_splits["validation"],
+            seed=new_splits.get("seed"),
+            shuffle=new_splits.get("shuffle", True),
+        )
+    return new_splits["train"], new_splits["test"], new_splits["validation"]
+
+
+@beartype
+def get_experiment_splits_path(dataset_path: str, experiment_id: int) -> str:
+    """Get the path where the split indexes of an experiment are stored.
+
+    Parameters
+    ----------
+    dataset_path : str
+        Path of the dataset of the experiment.
+    experiment_id : int
+        Id of the experiment.
+
+    Returns
+    -------
+    str
+        Path of the directory with the indexes of each split.
+    """
+    return os.path.join(dataset_path, "splits", f"experiment_{experiment_id}")
+
+
+@beartype
+def save_experiment_splits(
+    datasetdict: DatasetDict, splits: Dict, splits_path: str
+) -> None:
+    """Store the rows assigned to each split by an experiment.
+
+    The indexes of the rows of the concatenated train, test and validation
+    splits are saved as int64 arrays in a .npy file per split, so the jobs of
+    the experiment do not have to split the dataset again. Nothing is saved if
+    the experiment keeps the splits of the dataset or they are already saved.
+
+    Parameters
+    ----------
+    datasetdict : DatasetDict
+        Dataset of the experiment.
+    splits : Dict
+        Splits configuration of the experiment, with the train, test and
+        validation proportions or indexes, is_random and has_changed.
+    splits_path : str
+        Path of the directory where the indexes are saved.
+    """
+    if not splits["has_changed"] or os.path.isdir(splits_path):
+        return
+
+    total_rows = sum(len(datasetdict[split]) for split in SPLIT_NAMES)
+    indexes = _new_split_indexes(total_rows, splits, splits["is_random"])
+
+    # The indexes are written in a temporary directory and then moved, so the
+    # directory is complete whenever it exists.
+    os.makedirs(os.path.dirname(splits_path), exist_ok=True)
+    temp_path = tempfile.mkdtemp(dir=os.path.dirname(splits_path))
+    try:
+        for split, rows in zip(SPLIT_NAMES, indexes):
+            np.save(
+                os.path.join(temp_path, f"{split}.npy"),
+                _normalize_indexes(rows, total_rows),
+            )
+        os.rename(temp_path, splits_path)
+    except OSError:
+        # Other job of the experiment saved them first.
+        if not os.path.isdir(splits_path):
+            raise
+    finally:
+        shutil.rmtree(temp_path, ignore_errors=True)
+
+
+def _concatenate_splits(datasetdict: DatasetDict) -> Tuple[InMemoryTable, np.ndarray]:
+    """Concatenate the train, test and validation splits without copying rows.
+
+    The Arrow tables of the splits are concatenated only once each, since the
+    splits of a dataset usually are views of the same table, and concatenating
+    Arrow tables only collects their chunks.
+
+    Parameters
+    ----------
+    datasetdict : DatasetDict
+        Dataset with the train, test and validation splits.
+
+    Returns
+    -------
+    Tuple[InMemoryTable, np.ndarray]
+        The concatenated table and, for each row of the concatenated splits,
+        the index of that row in the table.
+    """
+    tables = []
+    offsets = {}
+    rows = []
+    for split in SPLIT_NAMES:
+        dataset = datasetdict[split]
+        table = dataset.data.table
+        if id(table) not in offsets:
+            offsets[id(table)] = sum(len(t) for t in tables)
+            tables.append(table)
+        if dataset._indices is None:
+            split_rows = np.arange(len(table))
+        else:
+            split_rows = dataset._indices.column(0).to_numpy()
+        rows.append(split_rows.astype(np.int64) + offsets[id(table)])
+    table = pa.concat_tables(tables, promote_options="default")
+    return InMemoryTable(table), np.concatenate(rows)
+
+
+@beartype
+def load_experiment_splits(
+    datasetdict: DatasetDict, splits: Dict, splits_path: str
+) -> DatasetDict:
+    """Get the splits of the dataset used by an experiment.
+
+    The splits are views of the concatenated train, test and validation splits
+    through an indices mapping, so the rows of the dataset are not copied. The
+    views share an in-memory table, instead of the ConcatenationTable of
+    concatenate_datasets, so their columns can be edited afterwards. The
+    indexes are saved first if the experiment has not saved them yet.
+
+    Parameters
+    ----------
+    datasetdict : DatasetDict
+        Dataset of the experiment.
+    splits : Dict
+        Splits configuration of the experiment.
+    splits_path : str
+        Path of the directory where the indexes are saved.
+
+    Returns
+    -------
+    DatasetDict
+        The dataset with the splits of the experiment.
+    """
+    if not splits["has_changed"]:
+        return datasetdict
+
+    save_experiment_splits(datasetdict, splits, splits_path)
+    table, rows = _concatenate_splits(datasetdict)
+    info = datasetdict["train"].info.copy()
+    fingerprints = [datasetdict[split]._fingerprint for split in SPLIT_NAMES]
+    new_datasetdict = DatasetDict()
+    for split in SPLIT_NAMES:
+        indexes = np.load(os.path.join(splits_path, f"{split}.npy"))
+        new_datasetdict[split] = DashAIDataset(
+            table,
+            info=info.copy(),
+            indices_table=InMemoryTable(
+                pa.table({"indices": pa.array(rows[indexes], type=pa.uint64())})
+            ),
+            # The same splits of the same dataset get the same fingerprint, so
+            # the caches keyed by it are shared by the jobs of the experiment.
+            fingerprint=Hasher.hash((fingerprints, split, indexes)),
+        )
+    return new_datasetdict
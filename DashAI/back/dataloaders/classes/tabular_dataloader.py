@@ -1,7 +1,11 @@
 from typing import List, Tuple, Union
 
-from datasets import ClassLabel, DatasetDict
+from datasets import DatasetDict
 
+from DashAI.back.dataloaders.classes.dashai_dataset import (
+    encode_class_labels,
+    get_class_label,
+)
 from DashAI.back.dataloaders.classes.dataloader import BaseDataLoader
 
 
@@ -66,8 +70,12 @@ class TabularDataLoader(BaseDataLoader):
                     label = class_column
                 else:
                     label = dataset[split].column_names[class_column]
+                class_label = get_class_label(dataset[split], label)
+                dataset[split] = encode_class_labels(
+                    dataset[split], {label: class_label}
+                )
                 new_features = dataset[split].features.copy()
-                new_features[label] = ClassLabel(names=list(set(dataset[split][label])))
+                new_features[label] = class_label
                 dataset[split] = dataset[split].cast(new_features)
         return dataset, label
 
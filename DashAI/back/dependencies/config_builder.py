@@ -38,6 +38,19 @@ def build_config_dict(
             * 'RUNS_PATH': The path to the runs directory (relative to LOCAL_PATH).
             * 'FRONT_BUILD_PATH': The absolute path to the front-end build directory.
             * 'LOGGING_LEVEL': The configured logging level.
+            * 'JOB_QUEUE': The job queue implementation, "sqlite" to persist the
+                jobs in the app database or "simple" to keep them in memory.
+            * 'JOB_EXECUTOR': The kind of pool used to run the jobs, "thread" or
+                "process".
+            * 'MAX_CONCURRENT_JOBS': The maximum number of jobs running at the
+                same time.
+            * 'MODEL_CACHE_SIZE': The maximum size in bytes of the trained models
+                kept loaded to answer predictions.
+            * 'PREDICTION_BATCH_SIZE': The number of rows of concurrent prediction
+                requests to a run that are predicted together, 1 to predict each
+                request on its own.
+            * 'PREDICTION_BATCH_DELAY': The maximum time in seconds a prediction
+                request waits for other requests to be predicted together.
     """
 
     config = DefaultSettings().model_dump()
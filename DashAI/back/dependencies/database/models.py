@@ -2,11 +2,16 @@ import logging
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String
+from sqlalchemy import JSON, DateTime, Enum, Float, ForeignKey, Index, String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from DashAI.back.core.enums.status import ExplainerStatus, RunStatus
+from DashAI.back.core.enums.status import (
+    ExplainerStatus,
+    JobStatus,
+    PredictionStatus,
+    RunStatus,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -192,3 +197,67 @@ class LocalExplainer(Base):
     def set_status_as_error(self) -> None:
         """Update the status of the local explainer to error."""
         self.status = ExplainerStatus.ERROR
+
+
+class Prediction(Base):
+    __tablename__ = "prediction"
+    """
+    Table to store all the information about a bulk prediction of a run.
+    """
+    id: Mapped[int] = mapped_column(primary_key=True)
+    run_id: Mapped[int] = mapped_column(nullable=False)
+    input_path: Mapped[str] = mapped_column(String, nullable=True)
+    output_path: Mapped[str] = mapped_column(String, nullable=True)
+    output_format: Mapped[str] = mapped_column(String, nullable=False)
+    # progress
+    processed_rows: Mapped[int] = mapped_column(nullable=False, default=0)
+    total_rows: Mapped[int] = mapped_column(nullable=True)
+    created: Mapped[DateTime] = mapped_column(DateTime, default=datetime.now)
+    status: Mapped[Enum] = mapped_column(
+        Enum(PredictionStatus), nullable=False, default=PredictionStatus.NOT_STARTED
+    )
+    delivery_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
+    start_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
+    end_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
+
+    def set_status_as_delivered(self) -> None:
+        """Update the status of the prediction to delivered and set delivery_time
+        to now."""
+        self.status = PredictionStatus.DELIVERED
+        self.delivery_time = datetime.now()
+
+    def set_status_as_started(self) -> None:
+        """Update the status of the prediction to started and set start_time
+        to now."""
+        self.status = PredictionStatus.STARTED
+        self.start_time = datetime.now()
+
+    def set_status_as_finished(self) -> None:
+        """Update the status of the prediction to finished and set end_time
+        to now."""
+        self.status = PredictionStatus.FINISHED
+        self.end_time = datetime.now()
+
+    def set_status_as_error(self) -> None:
+        """Update the status of the prediction to error."""
+        self.status = PredictionStatus.ERROR
+
+
+class Job(Base):
+    __tablename__ = "job"
+    """
+    Table to store the jobs waiting in the job queue or running.
+    """
+    id: Mapped[int] = mapped_column(primary_key=True)
+    job_type: Mapped[str] = mapped_column(String, nullable=False)
+    kwargs: Mapped[JSON] = mapped_column(JSON, nullable=False)
+    priority: Mapped[int] = mapped_column(nullable=False, default=0)
+    job_group: Mapped[str] = mapped_column(String, nullable=True)
+    estimated_cost: Mapped[float] = mapped_column(Float, nullable=True)
+    status: Mapped[Enum] = mapped_column(
+        Enum(JobStatus), nullable=False, default=JobStatus.PENDING
+    )
+    created: Mapped[DateTime] = mapped_column(DateTime, default=datetime.now)
+    start_time: Mapped[DateTime] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (Index("ix_job_status_priority", "status", "priority", "id"),)
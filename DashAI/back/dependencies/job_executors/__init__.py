@@ -0,0 +1,7 @@
+from DashAI.back.dependencies.job_executors.base_job_executor import BaseJobExecutor
+from DashAI.back.dependencies.job_executors.process_job_executor import (
+    ProcessJobExecutor,
+)
+from DashAI.back.dependencies.job_executors.thread_job_executor import (
+    ThreadJobExecutor,
+)
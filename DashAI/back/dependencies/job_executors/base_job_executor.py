@@ -0,0 +1,79 @@
+"""Base Job Executor abstract class."""
+
+import asyncio
+from abc import ABCMeta, abstractmethod
+from typing import Awaitable, Optional
+
+from DashAI.back.job.base_job import BaseJob  # noqa
+
+
+class BaseJobExecutor(metaclass=ABCMeta):
+    """Abstract class for all Job Executors.
+
+    A job executor runs the jobs extracted from the job queue outside the asyncio
+    event loop, so the API keeps answering requests while the jobs are running.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        """Constructor of the BaseJobExecutor class.
+
+        Parameters
+        ----------
+        max_workers: int
+            Maximum number of jobs that can be executed at the same time.
+        """
+        if max_workers < 1:
+            raise ValueError(
+                f"max_workers should be greater or equal than 1, got {max_workers}."
+            )
+        self.max_workers = max_workers
+        self._free_workers: Optional[asyncio.Semaphore] = None
+        self._free_workers_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def free_workers(self) -> asyncio.Semaphore:
+        """Get the semaphore of the workers that are not running a job.
+
+        Every job queue loop of the running event loop shares the same semaphore,
+        so together they never run more than max_workers jobs. Must be called from
+        a running event loop.
+
+        Returns
+        -------
+        asyncio.Semaphore
+            A semaphore with a slot for each free worker.
+        """
+        loop = asyncio.get_running_loop()
+        if self._free_workers_loop is not loop:
+            self._free_workers = asyncio.Semaphore(self.max_workers)
+            self._free_workers_loop = loop
+        return self._free_workers
+
+    @abstractmethod
+    def submit(self, job: BaseJob) -> Awaitable[None]:
+        """Schedule the execution of a job.
+
+        Must be called from a running event loop.
+
+        Parameters
+        ----------
+        job: Job
+            Job to execute.
+
+        Returns
+        ----------
+        Awaitable
+            An awaitable that finishes when the job finishes, raising the same
+            exceptions that the job run raises.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def shutdown(self, wait: bool = True) -> None:
+        """Release the resources used by the executor.
+
+        Parameters
+        ----------
+        wait: bool
+            If True, waits until the running jobs finish.
+        """
+        raise NotImplementedError
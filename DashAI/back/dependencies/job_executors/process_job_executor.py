@@ -0,0 +1,66 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Dict, Type
+
+from kink import di
+
+from DashAI.back.dependencies.job_executors.base_job_executor import BaseJobExecutor
+from DashAI.back.job.base_job import BaseJob
+
+
+def _initialize_worker(config: Dict[str, Any]) -> None:
+    """Build the services used by the jobs inside a worker process.
+
+    Parameters
+    ----------
+    config : Dict[str, Any]
+        The application configuration dictionary.
+    """
+    from DashAI.back.container import build_worker_container
+
+    build_worker_container(config=config)
+
+
+def _run_job(job_class: Type[BaseJob], job_kwargs: Dict[str, Any]) -> None:
+    """Rebuild a job inside a worker process and run it.
+
+    The database session of the job can not be sent to another process, so a new
+    session is created from the worker session factory.
+
+    Parameters
+    ----------
+    job_class : Type[BaseJob]
+        Class of the job to run.
+    job_kwargs : Dict[str, Any]
+        Parameters of the job, without the database session.
+    """
+    with di["session_factory"]() as db:
+        job = job_class(**job_kwargs, db=db)
+        job.run()
+
+
+class ProcessJobExecutor(BaseJobExecutor):
+    """JobExecutor implementation using a pool of processes.
+
+    Each worker process builds its own database session factory, component
+    registry and model cache, so jobs are fully isolated from the application
+    process (and from the GIL).
+    """
+
+    def __init__(self, config: Dict[str, Any], max_workers: int = 1) -> None:
+        super().__init__(max_workers=max_workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(config,),
+        )
+
+    def submit(self, job: BaseJob) -> Awaitable[None]:
+        loop = asyncio.get_running_loop()
+        job_kwargs = {key: value for key, value in job.kwargs.items() if key != "db"}
+        return loop.run_in_executor(self._executor, _run_job, type(job), job_kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
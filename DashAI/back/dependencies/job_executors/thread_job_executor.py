@@ -0,0 +1,29 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable
+
+from DashAI.back.dependencies.job_executors.base_job_executor import BaseJobExecutor
+from DashAI.back.job.base_job import BaseJob
+
+
+class ThreadJobExecutor(BaseJobExecutor):
+    """JobExecutor implementation using a pool of threads.
+
+    Jobs share the memory of the application process, so it is the lightest
+    executor. Most of the training and inference libraries release the GIL, then
+    several jobs can still run in parallel.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        super().__init__(max_workers=max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="DashAIJob",
+        )
+
+    def submit(self, job: BaseJob) -> Awaitable[None]:
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, job.run)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -107,6 +107,31 @@ class BaseJobQueue(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def task_done(self, job: BaseJob) -> None:  # noqa: B027
+        """Indicate that a job extracted from the queue finished its execution,
+        successfully or not.
+
+        Queues that do not keep track of the running jobs can ignore this call.
+
+        Parameters
+        ----------
+        job: Job
+            The finished job.
+        """
+
+    def recover(self) -> int:
+        """Put back in the queue the jobs that were running when the application
+        stopped, so they are executed again.
+
+        Queues that do not persist the jobs have nothing to recover.
+
+        Returns
+        ----------
+        int
+            The number of recovered jobs.
+        """
+        return 0
+
 
 class JobQueueError(Exception):
     """Exception raised when a method of the job queue fails."""
@@ -1,8 +1,11 @@
+import asyncio
 import logging
+from typing import Set
 
 from kink import inject
 from sqlalchemy import exc
 
+from DashAI.back.dependencies.job_executors import BaseJobExecutor
 from DashAI.back.dependencies.job_queues import BaseJobQueue
 from DashAI.back.job.base_job import BaseJob, JobError
 
@@ -10,28 +13,86 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+async def _execute_job(
+    job: BaseJob,
+    job_queue: BaseJobQueue,
+    job_executor: BaseJobExecutor,
+) -> None:
+    """Run a job in the job executor, log its errors and notify the queue when
+    the job finishes.
+
+    Jobs that fail with an unexpected error are marked as failed. The after_run
+    hook of the job is called here, in the application process.
+
+    Parameters
+    ----------
+    job : BaseJob
+        The job to execute.
+    job_queue : BaseJobQueue
+        The queue from which the job was extracted.
+    job_executor : BaseJobExecutor
+        The current app job executor.
+    """
+    try:
+        await job_executor.submit(job)
+    except exc.SQLAlchemyError as e:
+        logger.exception(e)
+    except JobError as e:
+        logger.exception(e)
+    except Exception as e:
+        logger.exception(e)
+        try:
+            job.set_status_as_error()
+        except Exception as status_error:
+            logger.exception(status_error)
+    finally:
+        try:
+            job.after_run()
+        except Exception as e:
+            logger.exception(e)
+        job_queue.task_done(job)
+
+
 @inject
 async def job_queue_loop(
     stop_when_queue_empties: bool,
     job_queue: BaseJobQueue = lambda di: di["job_queue"],
+    job_executor: BaseJobExecutor = lambda di: di["job_executor"],
 ):
     """Loop function to execute all the pending jobs in the job queue.
     If the the param stop_when_queue_empties is True, the loop returns when
-    the queue empties, else it waits until  new jobs come in.
+    the queue empties and the running jobs finish, else it waits until new jobs
+    come in.
+
+    The jobs are executed by the job executor, outside the event loop, and at most
+    job_executor.max_workers jobs run at the same time, even if other loops are
+    running, since they share the free workers of the executor. A job is extracted
+    from the queue only when there is a free worker to run it, so it can still be
+    cancelled while it waits.
 
     Parameters
     ----------
     job_queue : BaseJobQueue
         The current app job queue.
+    job_executor : BaseJobExecutor
+        The current app job executor.
     stop_when_queue_empties: bool
         boolean to set the while loop condition.
 
     """
-    while not job_queue.is_empty() if stop_when_queue_empties else True:
-        try:
-            job: BaseJob = await job_queue.async_get()
-            job.run()
-        except exc.SQLAlchemyError as e:
-            logger.exception(e)
-        except JobError as e:
-            logger.exception(e)
+    free_workers = job_executor.free_workers()
+    running_jobs: Set[asyncio.Task] = set()
+
+    while True:
+        await free_workers.acquire()
+        if stop_when_queue_empties and job_queue.is_empty():
+            free_workers.release()
+            break
+
+        job: BaseJob = await job_queue.async_get()
+        running_job = asyncio.create_task(_execute_job(job, job_queue, job_executor))
+        running_jobs.add(running_job)
+        running_job.add_done_callback(running_jobs.discard)
+        running_job.add_done_callback(lambda _: free_workers.release())
+
+    await asyncio.gather(*running_jobs)
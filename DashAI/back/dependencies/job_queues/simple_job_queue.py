@@ -1,6 +1,9 @@
+import asyncio
+import heapq
+import itertools
 import uuid
-from asyncio import Queue
-from typing import Any, Coroutine, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
 from DashAI.back.dependencies.job_queues.base_job_queue import (
     BaseJobQueue,
@@ -8,57 +11,91 @@ from DashAI.back.dependencies.job_queues.base_job_queue import (
 )
 from DashAI.back.job.base_job import BaseJob
 
+# (estimated cost, insertion sequence, job id)
+_HeapEntry = Tuple[float, int, int]
 
-class SimpleJobQueue(BaseJobQueue):
-    """JobQueue implementation using asyncio Queue."""
-
-    queue: Queue = Queue()
-
-    def _search_and_split(
-        self, job_id: int
-    ) -> Tuple[List[BaseJob], BaseJob, List[BaseJob]]:
-        """Split the queue using the job with id job_id as a pivot.
 
-        Parameters
-        ----------
-        job_id: int
-            Id of the Job used to split the queue.
+class SimpleJobQueue(BaseJobQueue):
+    """JobQueue implementation that keeps the jobs in memory.
+
+    The jobs are extracted by priority. The jobs with the same priority are
+    extracted taking the groups of the jobs in round-robin, and the jobs of a
+    group are extracted from the cheapest to the most expensive one, in insertion
+    order if they have the same estimated cost. Jobs without estimated cost go
+    after the jobs with one.
+
+    The jobs are indexed by their id and each group keeps its jobs in a heap, so
+    put and get take logarithmic time. Cancelled jobs are removed from the index
+    and lazily discarded from the heaps.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: Dict[int, BaseJob] = {}
+        self._job_groups: Dict[int, Tuple[int, Optional[str]]] = {}
+        self._groups: Dict[int, "OrderedDict[Optional[str], List[_HeapEntry]]"] = {}
+        self._group_sizes: Dict[Tuple[int, Optional[str]], int] = {}
+        self._sequence = itertools.count()
+        self._job_added: Optional[asyncio.Event] = None
+        self._job_added_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_job_added_event(self) -> asyncio.Event:
+        """Return the event used to wake up the consumers waiting in async_get.
+
+        An asyncio event can only be awaited in one event loop, so a new event is
+        created if the queue is consumed from a different loop.
 
         Returns
         ----------
-        tuple(List Job, Job, List Job)
-            A tuple containg the first part of the queue,
-            the pivot Job and the second part of the queue.
-
-        Raises
-        ----------
-        JobQueueError
-            If the queue is empty.
-        JobQueueError
-            If there is not job with job_id in the queue.
+        asyncio.Event
+            The event for the running event loop.
         """
-        first_part = []
-        target_job: BaseJob = self.queue.get_nowait()
-        while target_job.id != job_id and not self.is_empty():
-            first_part.append(target_job)
-            target_job = self.queue.get_nowait()
-
-        if target_job.id != job_id:
-            for job in [*first_part, target_job]:
-                self.queue.put_nowait(job)
-            raise JobQueueError(
-                f"Error trying to get job {job_id}: the job is not in the queue."
-            )
-
-        second_part = []
-        while not self.is_empty():
-            second_part.append(self.queue.get_nowait())
-
-        return (first_part, target_job, second_part)
+        loop = asyncio.get_running_loop()
+        if self._job_added is None or self._job_added_loop is not loop:
+            self._job_added = asyncio.Event()
+            self._job_added_loop = loop
+        return self._job_added
+
+    def _notify_job_added(self) -> None:
+        """Wake up the consumers waiting in async_get."""
+        if self._job_added is not None and not self._job_added_loop.is_closed():
+            # put can be called outside the event loop thread.
+            self._job_added_loop.call_soon_threadsafe(self._job_added.set)
+
+    def _next_heap(self) -> List[_HeapEntry]:
+        """Return the heap of the next group to serve, with a valid job on top."""
+        groups = self._groups[max(self._groups)]
+        heap = next(iter(groups.values()))
+        while heap[0][2] not in self._jobs:
+            heapq.heappop(heap)
+        return heap
+
+    def _remove(self, job_id: int) -> BaseJob:
+        """Remove a job from the index, dropping its group if it becomes empty."""
+        job = self._jobs.pop(job_id)
+        priority, group = self._job_groups.pop(job_id)
+        self._group_sizes[(priority, group)] -= 1
+        if self._group_sizes[(priority, group)] == 0:
+            del self._group_sizes[(priority, group)]
+            del self._groups[priority][group]
+            if not self._groups[priority]:
+                del self._groups[priority]
+        return job
 
     def put(self, job: BaseJob) -> int:
         job.id = uuid.uuid4().int
-        self.queue.put_nowait(job)
+        priority, group = job.priority, job.get_group()
+        cost = job.estimated_cost
+        self._jobs[job.id] = job
+        self._job_groups[job.id] = (priority, group)
+        self._group_sizes[(priority, group)] = (
+            self._group_sizes.get((priority, group), 0) + 1
+        )
+        heap = self._groups.setdefault(priority, OrderedDict()).setdefault(group, [])
+        heapq.heappush(
+            heap,
+            (float("inf") if cost is None else cost, next(self._sequence), job.id),
+        )
+        self._notify_job_added()
         return job.id
 
     def get(self, job_id: Optional[int] = None) -> BaseJob:
@@ -67,16 +104,26 @@ class SimpleJobQueue(BaseJobQueue):
                 f"Error trying to get job {job_id}: the async queue is empty."
             )
 
-        if job_id:
-            (first_part, target_job, second_part) = self._search_and_split(job_id)
-            for job in [*first_part, *second_part]:
-                self.queue.put_nowait(job)
-            return target_job
-        else:
-            return self.queue.get_nowait()
+        if job_id is None:
+            job_id = heapq.heappop(self._next_heap())[2]
+            priority, group = self._job_groups[job_id]
+            job = self._remove(job_id)
+            if group in self._groups.get(priority, {}):
+                # The served group waits for the turn of the other groups.
+                self._groups[priority].move_to_end(group)
+            return job
+        if job_id not in self._jobs:
+            raise JobQueueError(
+                f"Error trying to get job {job_id}: the job is not in the queue."
+            )
+        return self._remove(job_id)
 
     async def async_get(self) -> Coroutine[Any, Any, BaseJob]:
-        return await self.queue.get()
+        while self.is_empty():
+            job_added = self._get_job_added_event()
+            job_added.clear()
+            await job_added.wait()
+        return self.get()
 
     def peek(self, job_id: Optional[int] = None) -> BaseJob:
         if self.is_empty():
@@ -84,27 +131,18 @@ class SimpleJobQueue(BaseJobQueue):
                 f"Error trying to get job {job_id}: the async queue is empty."
             )
 
-        if job_id:
-            (first_part, target_job, second_part) = self._search_and_split(job_id)
-            for job in [*first_part, target_job, *second_part]:
-                self.queue.put_nowait(job)
-            return job
-        else:
-            target_job: BaseJob = self.queue.get_nowait()
-            tmp_queue = Queue()
-            tmp_queue.put_nowait(target_job)
-            while not self.is_empty():
-                tmp_queue.put_nowait(self.queue.get_nowait())
-            self.queue = tmp_queue
-            return target_job
+        if job_id is None:
+            return self._jobs[self._next_heap()[0][2]]
+        try:
+            return self._jobs[job_id]
+        except KeyError as e:
+            raise JobQueueError(
+                f"Error trying to get job {job_id}: the job is not in the queue."
+            ) from e
 
     def is_empty(self) -> bool:
-        return self.queue.empty()
+        return not self._jobs
 
     def to_list(self) -> List[BaseJob]:
-        job_list = []
-        while not self.is_empty():
-            job_list.append(self.queue.get_nowait())
-        for job in job_list:
-            self.queue.put_nowait(job)
-        return job_list
+        # Stable sort, the jobs with the same priority keep the insertion order.
+        return sorted(self._jobs.values(), key=lambda job: -job.priority)
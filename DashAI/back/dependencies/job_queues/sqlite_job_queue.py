@@ -0,0 +1,283 @@
+import asyncio
+import itertools
+import logging
+from datetime import datetime
+from typing import Any, Coroutine, Dict, List, Optional
+
+from kink import inject
+from sqlalchemy import Select, delete, exc, func, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from DashAI.back.core.enums.status import JobStatus
+from DashAI.back.dependencies.database.models import Job
+from DashAI.back.dependencies.job_queues.base_job_queue import (
+    BaseJobQueue,
+    JobQueueError,
+)
+from DashAI.back.dependencies.registry import ComponentRegistry
+from DashAI.back.job.base_job import BaseJob
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteJobQueue(BaseJobQueue):
+    """JobQueue implementation that persists the jobs in the app database.
+
+    The queued jobs survive application restarts. An extracted job is marked as
+    started instead of being deleted, and it is deleted only when its execution
+    finishes, so the jobs that were running when the application stopped can be
+    recovered and executed again.
+
+    Jobs are stored as their type and their JSON serializable parameters. The
+    database session of a job is not stored, the extracted jobs get a new one
+    that is closed when the job is marked as done.
+
+    The jobs are extracted by priority. Among the jobs with the greatest priority,
+    the next job is the cheapest job of the least recently served group, so the
+    groups share the workers in round-robin.
+    """
+
+    def __init__(self, session_factory: sessionmaker, poll_interval: float = 0.5):
+        """Constructor of the SQLiteJobQueue class.
+
+        Parameters
+        ----------
+        session_factory : sessionmaker
+            Factory of sessions of the database where the jobs are stored.
+        poll_interval : float
+            Seconds between two checks of the queue while async_get waits for a job.
+        """
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        # Round-robin state, the groups never served go first.
+        self._served_groups: Dict[Optional[str], int] = {}
+        self._served_count = itertools.count()
+
+    @staticmethod
+    def _pending_jobs() -> Select:
+        """Query of the pending jobs in extraction order."""
+        return (
+            select(Job)
+            .where(Job.status == JobStatus.PENDING)
+            .order_by(Job.priority.desc(), Job.id)
+        )
+
+    def _next_pending_row(self, db: Session) -> Optional[Job]:
+        """Select the next job to extract.
+
+        Parameters
+        ----------
+        db : Session
+            Session of the jobs database.
+
+        Returns
+        -------
+        Optional[Job]
+            The row of the next job, None if there are no pending jobs.
+        """
+        pending = Job.status == JobStatus.PENDING
+        top_priority = select(func.max(Job.priority)).where(pending).scalar_subquery()
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=Job.job_group,
+                order_by=(Job.estimated_cost.asc().nulls_last(), Job.id),
+            )
+            .label("rank")
+        )
+        candidates = (
+            select(Job.id, Job.job_group, rank)
+            .where(pending, Job.priority == top_priority)
+            .subquery()
+        )
+        group_heads = db.execute(
+            select(candidates.c.id, candidates.c.job_group)
+            .where(candidates.c.rank == 1)
+            .order_by(candidates.c.id)
+        ).all()
+        if not group_heads:
+            return None
+        job_id, _ = min(
+            group_heads, key=lambda head: self._served_groups.get(head.job_group, -1)
+        )
+        return db.get(Job, job_id)
+
+    @inject
+    def _build_job(
+        self,
+        job_row: Job,
+        with_session: bool = False,
+        component_registry: ComponentRegistry = lambda di: di["component_registry"],
+    ) -> BaseJob:
+        """Create a job object from its database row.
+
+        Parameters
+        ----------
+        job_row : Job
+            The stored job.
+        with_session : bool
+            If True, the job gets a new database session, so it can be executed.
+        component_registry : ComponentRegistry
+            Registry containing the current app available components.
+
+        Returns
+        -------
+        BaseJob
+            The job object.
+        """
+        job_kwargs = dict(job_row.kwargs)
+        if with_session:
+            job_kwargs["db"] = self.session_factory()
+        job: BaseJob = component_registry[job_row.job_type]["class"](**job_kwargs)
+        job.id = job_row.id
+        return job
+
+    def _get_pending_row(self, job_id: Optional[int]) -> Job:
+        """Retrieve the row of a pending job.
+
+        Parameters
+        ----------
+        job_id : Optional[int]
+            id of the job, if it is None the next pending job is retrieved.
+
+        Returns
+        -------
+        Job
+            The row of the job.
+
+        Raises
+        ------
+        JobQueueError
+            If the queue is empty or there is no pending job with job_id.
+        """
+        with self.session_factory() as db:
+            if job_id is None:
+                job_row = self._next_pending_row(db)
+            else:
+                job_row = db.scalars(
+                    self._pending_jobs().where(Job.id == job_id)
+                ).first()
+
+        if job_row is None:
+            if job_id is None:
+                raise JobQueueError(
+                    f"Error trying to get job {job_id}: the queue is empty."
+                )
+            raise JobQueueError(
+                f"Error trying to get job {job_id}: the job is not in the queue."
+            )
+        return job_row
+
+    def _claim(self) -> Optional[BaseJob]:
+        """Atomically mark the next pending job as started and return it.
+
+        Returns
+        -------
+        Optional[BaseJob]
+            The claimed job, None if there are no pending jobs.
+        """
+        with self.session_factory() as db:
+            while True:
+                job_row = self._next_pending_row(db)
+                if job_row is None:
+                    return None
+                # The status check makes the update fail if another consumer
+                # claimed the job first.
+                result = db.execute(
+                    update(Job)
+                    .where(Job.id == job_row.id, Job.status == JobStatus.PENDING)
+                    .values(status=JobStatus.STARTED, start_time=datetime.now())
+                )
+                db.commit()
+                if result.rowcount == 1:
+                    self._served_groups[job_row.job_group] = next(self._served_count)
+                    return self._build_job(job_row, with_session=True)
+
+    def put(self, job: BaseJob) -> int:
+        job_kwargs = {key: value for key, value in job.kwargs.items() if key != "db"}
+        try:
+            with self.session_factory() as db:
+                job_row = Job(
+                    job_type=type(job).__name__,
+                    kwargs=job_kwargs,
+                    priority=job.priority,
+                    job_group=job.get_group(),
+                    estimated_cost=job.estimated_cost,
+                )
+                db.add(job_row)
+                db.commit()
+                db.refresh(job_row)
+        except exc.SQLAlchemyError as e:
+            logger.exception(e)
+            raise JobQueueError("Error trying to store the job in the queue.") from e
+        # Like the stored job, the queued job does not keep the session, the
+        # extracted jobs get a new one.
+        job.kwargs = job_kwargs
+        job.id = job_row.id
+        return job.id
+
+    def get(self, job_id: Optional[int] = None) -> BaseJob:
+        if job_id is None:
+            job = self._claim()
+            if job is None:
+                raise JobQueueError(
+                    f"Error trying to get job {job_id}: the queue is empty."
+                )
+            return job
+
+        job_row = self._get_pending_row(job_id)
+        with self.session_factory() as db:
+            result = db.execute(
+                delete(Job).where(Job.id == job_id, Job.status == JobStatus.PENDING)
+            )
+            db.commit()
+        if result.rowcount == 0:
+            raise JobQueueError(
+                f"Error trying to get job {job_id}: the job is not in the queue."
+            )
+        return self._build_job(job_row)
+
+    async def async_get(self) -> Coroutine[Any, Any, BaseJob]:
+        loop = asyncio.get_running_loop()
+        while True:
+            # The queries block, they run outside the event loop.
+            job = await loop.run_in_executor(None, self._claim)
+            if job is not None:
+                return job
+            await asyncio.sleep(self.poll_interval)
+
+    def peek(self, job_id: Optional[int] = None) -> BaseJob:
+        return self._build_job(self._get_pending_row(job_id))
+
+    def is_empty(self) -> bool:
+        with self.session_factory() as db:
+            pending_jobs = db.scalar(
+                select(func.count(Job.id)).where(Job.status == JobStatus.PENDING)
+            )
+        return pending_jobs == 0
+
+    def to_list(self) -> List[BaseJob]:
+        with self.session_factory() as db:
+            job_rows = db.scalars(self._pending_jobs()).all()
+        return [self._build_job(job_row) for job_row in job_rows]
+
+    def task_done(self, job: BaseJob) -> None:
+        # The session was created by the queue when the job was extracted.
+        job_session = job.kwargs.pop("db", None)
+        if job_session is not None:
+            job_session.close()
+        with self.session_factory() as db:
+            db.execute(delete(Job).where(Job.id == job.id))
+            db.commit()
+
+    def recover(self) -> int:
+        with self.session_factory() as db:
+            result = db.execute(
+                update(Job)
+                .where(Job.status == JobStatus.STARTED)
+                .values(status=JobStatus.PENDING, start_time=None)
+            )
+            db.commit()
+        if result.rowcount:
+            logger.info("Recovered %d unfinished jobs.", result.rowcount)
+        return result.rowcount
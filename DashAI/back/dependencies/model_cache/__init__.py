@@ -0,0 +1 @@
+from DashAI.back.dependencies.model_cache.model_cache import ModelCache
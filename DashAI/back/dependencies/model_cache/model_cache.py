@@ -0,0 +1,120 @@
+"""Cache of the trained models of the runs."""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Tuple, Type
+
+from DashAI.back.models.base_model import BaseModel
+
+
+class _CachedModel(NamedTuple):
+    version: Tuple[int, int]
+    model: BaseModel
+    size: int
+
+
+def _saved_version(run_path: str) -> Tuple[int, int]:
+    """Get the last modification time and the size of a saved model.
+
+    The models are saved in a file (scikit-learn) or in a directory of files
+    (Hugging Face), so both are considered.
+
+    Parameters
+    ----------
+    run_path : str
+        Path where the model of the run was saved.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The last modification time in nanoseconds and the size in bytes.
+    """
+    if not os.path.isdir(run_path):
+        stat = os.stat(run_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    mtime, size = os.stat(run_path).st_mtime_ns, 0
+    for directory, _, filenames in os.walk(run_path):
+        for filename in filenames:
+            stat = os.stat(os.path.join(directory, filename))
+            mtime, size = max(mtime, stat.st_mtime_ns), size + stat.st_size
+    return mtime, size
+
+
+class ModelCache:
+    """LRU cache of the trained models of the runs.
+
+    A cached model is reloaded when its run is trained again, since the saved
+    model changes. The size of the saved models is used as an estimate of the
+    memory they use, and the least recently used models are evicted when the
+    total size is over the limit.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Constructor of the ModelCache class.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum total size in bytes of the cached models.
+        """
+        if max_size < 0:
+            raise ValueError(f"max_size should be non-negative, got {max_size}.")
+        self.max_size = max_size
+        self.size = 0
+        self._models: "OrderedDict[int, _CachedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, run_id: int, run_path: str, model_class: Type[BaseModel]):
+        """Get the trained model of a run, loading it if it is not cached.
+
+        Parameters
+        ----------
+        run_id : int
+            Id of the run.
+        run_path : str
+            Path where the model of the run was saved.
+        model_class : Type[BaseModel]
+            Class of the model of the run.
+
+        Returns
+        -------
+        BaseModel
+            The trained model. It is shared by every caller, so it must not be
+            modified.
+        """
+        version = _saved_version(run_path)
+        with self._lock:
+            cached = self._models.get(run_id)
+            if cached is not None and cached.version == version:
+                self._models.move_to_end(run_id)
+                return cached.model
+
+        # Loading may take seconds, so it is done without holding the lock.
+        model = model_class.load(run_path)
+        cached = _CachedModel(version=version, model=model, size=version[1])
+        with self._lock:
+            self._remove(run_id)
+            if cached.size <= self.max_size:
+                self._models[run_id] = cached
+                self.size += cached.size
+                while self.size > self.max_size:
+                    self._remove(next(iter(self._models)))
+        return model
+
+    def invalidate(self, run_id: int) -> None:
+        """Remove the model of a run from the cache.
+
+        Parameters
+        ----------
+        run_id : int
+            Id of the run.
+        """
+        with self._lock:
+            self._remove(run_id)
+
+    def _remove(self, run_id: int) -> None:
+        cached = self._models.pop(run_id, None)
+        if cached is not None:
+            self.size -= cached.size
@@ -0,0 +1,3 @@
+from DashAI.back.dependencies.prediction_batcher.prediction_batcher import (
+    PredictionBatcher,
+)
@@ -0,0 +1,132 @@
+"""Coalescing of concurrent prediction requests."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+from datasets.table import InMemoryTable
+
+from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
+from DashAI.back.models.base_model import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class _Batch:
+    """Requests waiting to be predicted together by the same model."""
+
+    def __init__(self, model: BaseModel) -> None:
+        self.model = model
+        self.requests: List[Tuple[pa.Table, asyncio.Future]] = []
+        self.num_rows = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class PredictionBatcher:
+    """Gather concurrent prediction requests for a model into one predict call.
+
+    The rows of the requests that arrive within max_delay seconds of the first
+    one are predicted together, unless they reach max_batch_size rows earlier.
+    A max_batch_size of 1 disables the batching, since every request is then
+    predicted as soon as it arrives.
+
+    It must be used from the asyncio event loop. The predict calls run in the
+    default executor of the loop, so new requests keep being gathered meanwhile.
+    """
+
+    def __init__(self, max_batch_size: int = 1, max_delay: float = 0.01) -> None:
+        """Constructor of the PredictionBatcher class.
+
+        Parameters
+        ----------
+        max_batch_size : int
+            Number of rows that triggers the prediction of a batch.
+        max_delay : float
+            Maximum time in seconds a request waits for other requests.
+        """
+        if max_batch_size < 1:
+            raise ValueError(
+                f"max_batch_size should be greater or equal than 1, "
+                f"got {max_batch_size}."
+            )
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        # The batches are identified by their model, since a re-trained run gets
+        # a new model.
+        self._batches: Dict[int, _Batch] = {}
+
+    async def predict(self, model: BaseModel, table: pa.Table) -> Any:
+        """Predict the rows of a table, together with other concurrent requests.
+
+        Parameters
+        ----------
+        model : BaseModel
+            Trained model used to predict.
+        table : pa.Table
+            Rows to predict.
+
+        Returns
+        -------
+        Any
+            The predictions of the rows of the table.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._batches.get(id(model))
+        if batch is None:
+            batch = self._batches[id(model)] = _Batch(model)
+            batch.timer = loop.call_later(self.max_delay, self._flush, batch)
+        batch.requests.append((table, future))
+        batch.num_rows += table.num_rows
+        if batch.num_rows >= self.max_batch_size:
+            self._flush(batch)
+
+        return await future
+
+    def _flush(self, batch: _Batch) -> None:
+        """Stop gathering requests for a batch and start its prediction."""
+        if self._batches.get(id(batch.model)) is not batch:
+            return
+        del self._batches[id(batch.model)]
+        batch.timer.cancel()
+        asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch: _Batch) -> None:
+        loop = asyncio.get_running_loop()
+        tables = [table for table, _ in batch.requests]
+        futures = [future for _, future in batch.requests]
+        try:
+            try:
+                # The types inferred for each request may differ, e.g. int and
+                # float or null columns.
+                table = pa.concat_tables(tables, promote_options="permissive")
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                logger.debug("Requests can not be predicted together: %s", e)
+                for table, future in batch.requests:
+                    _set_result(future, await self._predict(loop, batch.model, table))
+                return
+
+            predictions = await self._predict(loop, batch.model, table)
+            start = 0
+            for table, future in batch.requests:
+                _set_result(future, predictions[start : start + table.num_rows])
+                start += table.num_rows
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+    @staticmethod
+    async def _predict(
+        loop: asyncio.AbstractEventLoop, model: BaseModel, table: pa.Table
+    ) -> Any:
+        dataset = DashAIDataset(InMemoryTable(table))
+        return await loop.run_in_executor(None, model.predict, dataset)
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    # The request may have been cancelled while waiting.
+    if not future.done():
+        future.set_result(result)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Final, List, Tuple
+from typing import Dict, Final, List, Optional, Tuple
 
+import numpy as np
 from datasets import DatasetDict
 
 from DashAI.back.config_object import ConfigObject
@@ -11,6 +12,9 @@ class BaseGlobalExplainer(ConfigObject, ABC):
     """Base class for global explainers."""
 
     TYPE: Final[str] = "GlobalExplainer"
+    # Predictions of the model over each split, computed when the run was
+    # trained. Set by the explainer job, None if they are not available.
+    predictions: Optional[Dict[str, np.ndarray]] = None
 
     def __init__(self, model: BaseModel) -> None:
         self.model = model
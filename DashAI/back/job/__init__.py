@@ -1,3 +1,4 @@
 # flake8: noqa
 from DashAI.back.job.explainer_job import ExplainerJob
 from DashAI.back.job.model_job import ModelJob
+from DashAI.back.job.prediction_job import PredictionJob
@@ -1,13 +1,14 @@
 """Base Job abstract class."""
 
 from abc import ABCMeta, abstractmethod
-from typing import Final
+from typing import Final, Optional
 
 
 class BaseJob(metaclass=ABCMeta):
     """Abstract class for all Jobs."""
 
     TYPE: Final[str] = "Job"
+    DEFAULT_PRIORITY: int = 0
 
     def __init__(self, **kwargs):
         """Constructor of the ModelJob class.
@@ -20,11 +21,50 @@ class BaseJob(metaclass=ABCMeta):
         job_kwargs = kwargs.pop("kwargs", {})
         self.kwargs = {**kwargs, **job_kwargs}
 
+    @property
+    def priority(self) -> int:
+        """Priority of the job, the jobs with greater priority run first."""
+        priority = self.kwargs.get("priority")
+        return self.DEFAULT_PRIORITY if priority is None else priority
+
+    @property
+    def estimated_cost(self) -> Optional[float]:
+        """Hint of the cost of the job, cheaper jobs of a group run first."""
+        return self.kwargs.get("estimated_cost")
+
+    def get_group(self) -> Optional[str]:
+        """Return the group of the job.
+
+        Job queues share the workers between the groups in round-robin, so the
+        jobs of a group can not hold back the jobs of the other groups. Jobs
+        without group share the same default group.
+
+        Returns
+        -------
+        Optional[str]
+            The group key, None for the default group.
+        """
+        return None
+
     @abstractmethod
     def set_status_as_delivered(self) -> None:
         """Set the status of the job as delivered."""
         raise NotImplementedError
 
+    @abstractmethod
+    def set_status_as_error(self) -> None:
+        """Set the status of the job as error."""
+        raise NotImplementedError
+
+    def after_run(self) -> None:
+        """Update the application process after the job finishes.
+
+        It is called in the application process, whatever the job executor and
+        even if the job failed, so the jobs can update the state the process
+        keeps, which run can not reach when the job runs in another process.
+        """
+        return None
+
     @abstractmethod
     def run() -> None:
         """Run the job."""
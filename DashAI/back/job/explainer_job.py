@@ -2,7 +2,7 @@ import json
 import logging
 import os
 import pickle
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from datasets import DatasetDict
 from kink import inject
@@ -10,9 +10,10 @@ from sqlalchemy import exc
 from sqlalchemy.orm import Session
 
 from DashAI.back.dataloaders.classes.dashai_dataset import (
+    get_experiment_splits_path,
     load_dataset,
+    load_experiment_splits,
     select_columns,
-    update_dataset_splits,
 )
 from DashAI.back.dependencies.database.models import (
     Dataset,
@@ -35,6 +36,9 @@ log = logging.getLogger(__name__)
 class ExplainerJob(BaseJob):
     """ExplainerJob class to calculate explanations."""
 
+    # Explanations are requested interactively, so they run before trainings.
+    DEFAULT_PRIORITY: int = 10
+
     def set_status_as_delivered(self) -> None:
         """Set the status of the job as delivered."""
         explainer_id: int = self.kwargs["explainer_id"]
@@ -59,6 +63,44 @@ class ExplainerJob(BaseJob):
                 "Internal database error",
             ) from e
 
+    def set_status_as_error(self) -> None:
+        """Set the status of the job as error."""
+        explainer_id: int = self.kwargs["explainer_id"]
+        db: Session = self.kwargs["db"]
+        explainer_scope: str = self.kwargs["explainer_scope"]
+
+        # Discard the changes left by the failed job.
+        db.rollback()
+        if explainer_scope == "global":
+            explainer: GlobalExplainer = db.get(GlobalExplainer, explainer_id)
+        elif explainer_scope == "local":
+            explainer: LocalExplainer = db.get(LocalExplainer, explainer_id)
+        else:
+            raise JobError(f"{explainer_scope} is an invalid explainer type")
+
+        if not explainer:
+            raise JobError(f"Explainer with id {explainer_id} does not exist in DB.")
+        try:
+            explainer.set_status_as_error()
+            db.commit()
+        except exc.SQLAlchemyError as e:
+            log.exception(e)
+            raise JobError(
+                "Internal database error",
+            ) from e
+
+    def get_group(self) -> Optional[str]:
+        """Group the job with the jobs of the experiment of the explained run."""
+        db: Optional[Session] = self.kwargs.get("db")
+        explainer_class = {"global": GlobalExplainer, "local": LocalExplainer}.get(
+            self.kwargs.get("explainer_scope")
+        )
+        if db is None or explainer_class is None:
+            return None
+        explainer = db.get(explainer_class, self.kwargs["explainer_id"])
+        run: Optional[Run] = db.get(Run, explainer.run_id) if explainer else None
+        return f"experiment_{run.experiment_id}" if run else None
+
     @inject
     def _generate_global_explanation(
         self,
@@ -251,6 +293,13 @@ class ExplainerJob(BaseJob):
                 raise JobError(
                     f"Unable to instantiate {explainer_scope} explainer.",
                 ) from e
+            predictions_path = (run.artifacts or {}).get("predictions_path")
+            if predictions_path is not None:
+                try:
+                    with open(predictions_path, "rb") as file:
+                        explainer.predictions = pickle.load(file)
+                except OSError as e:
+                    log.warning("Can not load the run predictions: %s", e)
             try:
                 loaded_dataset: DatasetDict = load_dataset(
                     f"{dataset.file_path}/dataset"
@@ -268,16 +317,11 @@ class ExplainerJob(BaseJob):
                     f"Unable to find Task with name {experiment.task_name} in registry",
                 ) from e
             try:
-                splits = json.loads(experiment.splits)
-                if splits["has_changed"]:
-                    new_splits = {
-                        "train": splits["train"],
-                        "test": splits["test"],
-                        "validation": splits["validation"],
-                    }
-                    loaded_dataset = update_dataset_splits(
-                        loaded_dataset, new_splits, splits["is_random"]
-                    )
+                loaded_dataset = load_experiment_splits(
+                    loaded_dataset,
+                    json.loads(experiment.splits),
+                    get_experiment_splits_path(dataset.file_path, experiment.id),
+                )
                 prepared_dataset = task.prepare_for_task(
                     datasetdict=loaded_dataset,
                     outputs_columns=self.output_columns,
@@ -2,22 +2,27 @@ import json
 import logging
 import os
 import pickle
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+from datasets import DatasetDict
 from kink import inject
 from sqlalchemy import exc
 from sqlalchemy.orm import Session
 
 from DashAI.back.dataloaders.classes.dashai_dataset import (
     DashAIDataset,
+    get_experiment_splits_path,
     load_dataset,
+    load_experiment_splits,
     select_columns,
-    update_dataset_splits,
 )
 from DashAI.back.dependencies.database.models import Dataset, Experiment, Run
+from DashAI.back.dependencies.model_cache import ModelCache
 from DashAI.back.dependencies.registry import ComponentRegistry
 from DashAI.back.job.base_job import BaseJob, JobError
 from DashAI.back.metrics import BaseMetric
+from DashAI.back.metrics.classification_metric import ClassificationMetric
 from DashAI.back.models import BaseModel
 from DashAI.back.optimizers import BaseOptimizer
 from DashAI.back.tasks import BaseTask
@@ -46,6 +51,90 @@ class ModelJob(BaseJob):
                 "Internal database error",
             ) from e
 
+    def set_status_as_error(self) -> None:
+        """Set the status of the job as error."""
+        run_id: int = self.kwargs["run_id"]
+        db: Session = self.kwargs["db"]
+
+        # Discard the changes left by the failed job.
+        db.rollback()
+        run: Run = db.get(Run, run_id)
+        if not run:
+            raise JobError(f"Run {run_id} does not exist in DB.")
+        try:
+            run.set_status_as_error()
+            db.commit()
+        except exc.SQLAlchemyError as e:
+            log.exception(e)
+            raise JobError(
+                "Internal database error",
+            ) from e
+
+    @inject
+    def after_run(self, model_cache: ModelCache = lambda di: di["model_cache"]) -> None:
+        """Remove the previous model of the run from the cache.
+
+        The model is removed in the application process, since its cache is not
+        the one of the job when the job runs in a worker process.
+        """
+        model_cache.invalidate(self.kwargs["run_id"])
+
+    def get_group(self) -> Optional[str]:
+        """Group the job with the other jobs of the run experiment."""
+        db: Optional[Session] = self.kwargs.get("db")
+        run: Optional[Run] = db.get(Run, self.kwargs["run_id"]) if db else None
+        return f"experiment_{run.experiment_id}" if run else None
+
+    def _evaluate(
+        self,
+        model: BaseModel,
+        x: DatasetDict,
+        y: DatasetDict,
+        metrics: List[BaseMetric],
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, Dict[str, float]]]:
+        """Predict each split once and score all the metrics over the predictions.
+
+        Parameters
+        ----------
+        model : BaseModel
+            The trained model.
+        x : DatasetDict
+            The input columns of the splits.
+        y : DatasetDict
+            The output columns of the splits.
+        metrics : List[BaseMetric]
+            The metrics to score.
+
+        Returns
+        -------
+        Tuple[Dict[str, np.ndarray], Dict[str, Dict[str, float]]]
+            The predictions of the model and the metric scores of each split.
+        """
+        classification_metrics = [
+            metric for metric in metrics if issubclass(metric, ClassificationMetric)
+        ]
+        predictions = {}
+        model_metrics = {}
+        for split in ["train", "validation", "test"]:
+            predictions[split] = model.predict(x[split])
+            # The classification metrics share the labels and confusion matrix.
+            scores = (
+                ClassificationMetric.score_batch(
+                    classification_metrics, y[split], predictions[split]
+                )
+                if classification_metrics
+                else {}
+            )
+            model_metrics[split] = {
+                metric.__name__: (
+                    scores[metric.__name__]
+                    if metric.__name__ in scores
+                    else metric.score(y[split], predictions[split])
+                )
+                for metric in metrics
+            }
+        return predictions, model_metrics
+
     @inject
     def run(
         self,
@@ -108,18 +197,11 @@ class ModelJob(BaseJob):
                 ) from e
 
             try:
-                splits = json.loads(experiment.splits)
-                if splits["has_changed"]:
-                    new_splits = {
-                        "train": splits["train"],
-                        "test": splits["test"],
-                        "validation": splits["validation"],
-                    }
-                    loaded_dataset = update_dataset_splits(
-                        loaded_dataset,
-                        new_splits,
-                        splits["is_random"],
-                    )
+                loaded_dataset = load_experiment_splits(
+                    loaded_dataset,
+                    json.loads(experiment.splits),
+                    get_experiment_splits_path(dataset.file_path, experiment.id),
+                )
                 prepared_dataset = task.prepare_for_task(
                     loaded_dataset, experiment.output_columns
                 )
@@ -279,16 +361,7 @@ class ModelJob(BaseJob):
                 ) from e
 
             try:
-                model_metrics = {
-                    split: {
-                        metric.__name__: metric.score(
-                            y[split],
-                            model.predict(x[split]),
-                        )
-                        for metric in metrics
-                    }
-                    for split in ["train", "validation", "test"]
-                }
+                predictions, model_metrics = self._evaluate(model, x, y, metrics)
             except Exception as e:
                 log.exception(e)
                 raise JobError(
@@ -308,8 +381,24 @@ class ModelJob(BaseJob):
                     "Model saving failed",
                 ) from e
 
+            try:
+                predictions_path = os.path.join(
+                    config["RUNS_PATH"], f"predictions_{run.id}.pickle"
+                )
+                with open(predictions_path, "wb") as file:
+                    pickle.dump(predictions, file)
+            except Exception as e:
+                log.exception(e)
+                raise JobError(
+                    "Predictions saving failed",
+                ) from e
+
             try:
                 run.run_path = run_path
+                run.artifacts = {
+                    **(run.artifacts or {}),
+                    "predictions_path": predictions_path,
+                }
                 db.commit()
             except exc.SQLAlchemyError as e:
                 log.exception(e)
@@ -0,0 +1,275 @@
+import logging
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from datasets import Features, Value
+from datasets.table import InMemoryTable
+from kink import inject
+from sqlalchemy import exc
+from sqlalchemy.orm import Session
+
+from DashAI.back.dataloaders.classes.dashai_dataset import (
+    DashAIDataset,
+    get_dataset_manifest,
+)
+from DashAI.back.dependencies.database.models import (
+    Dataset,
+    Experiment,
+    Prediction,
+    Run,
+)
+from DashAI.back.dependencies.model_cache import ModelCache
+from DashAI.back.dependencies.registry import ComponentRegistry
+from DashAI.back.job.base_job import BaseJob, JobError
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class _PredictionWriter:
+    """Append the predictions of each batch to a Parquet or CSV file."""
+
+    def __init__(self, path: str, output_format: str) -> None:
+        self.path = path
+        self.output_format = output_format
+        self._writer = None
+
+    def write(self, predictions: Any) -> None:
+        table = _to_table(predictions)
+        if self._writer is None:
+            if self.output_format == "parquet":
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            else:
+                self._writer = pa_csv.CSVWriter(self.path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        # No rows were predicted, so the file has no columns.
+        elif self.output_format == "parquet":
+            pq.write_table(pa.table({}), self.path)
+        else:
+            open(self.path, "w").close()
+
+
+def _to_table(predictions: Any) -> pa.Table:
+    """Convert the output of predict to a table.
+
+    The probabilities of the classification models get a column per class, the
+    other outputs (e.g. translations) a single column.
+    """
+    if isinstance(predictions, np.ndarray) and predictions.ndim == 2:
+        return pa.table(
+            {f"prediction_{i}": predictions[:, i] for i in range(predictions.shape[1])}
+        )
+    if not isinstance(predictions, np.ndarray):
+        predictions = list(predictions)
+    return pa.table({"prediction": pa.array(predictions)})
+
+
+class PredictionJob(BaseJob):
+    """PredictionJob class to predict a large file with a trained run.
+
+    The input file is read in batches of rows, and the predictions of each batch
+    are appended to the output file, so the memory used does not depend on the
+    size of the file.
+    """
+
+    # Number of rows predicted at a time in the Parquet files.
+    BATCH_SIZE: int = 10_000
+    # Number of bytes predicted at a time in the CSV files.
+    CSV_BLOCK_SIZE: int = 1 << 20
+
+    def set_status_as_delivered(self) -> None:
+        """Set the status of the job as delivered."""
+        prediction_id: int = self.kwargs["prediction_id"]
+        db: Session = self.kwargs["db"]
+
+        prediction: Prediction = db.get(Prediction, prediction_id)
+        if not prediction:
+            raise JobError(f"Prediction {prediction_id} does not exist in DB.")
+        try:
+            prediction.set_status_as_delivered()
+            db.commit()
+        except exc.SQLAlchemyError as e:
+            log.exception(e)
+            raise JobError(
+                "Internal database error",
+            ) from e
+
+    def set_status_as_error(self) -> None:
+        """Set the status of the job as error."""
+        prediction_id: int = self.kwargs["prediction_id"]
+        db: Session = self.kwargs["db"]
+
+        # Discard the changes left by the failed job.
+        db.rollback()
+        prediction: Prediction = db.get(Prediction, prediction_id)
+        if not prediction:
+            raise JobError(f"Prediction {prediction_id} does not exist in DB.")
+        try:
+            prediction.set_status_as_error()
+            db.commit()
+        except exc.SQLAlchemyError as e:
+            log.exception(e)
+            raise JobError(
+                "Internal database error",
+            ) from e
+
+    def get_group(self) -> Optional[str]:
+        """Group the job with the other jobs of the experiment of the run."""
+        db: Optional[Session] = self.kwargs.get("db")
+        prediction: Optional[Prediction] = (
+            db.get(Prediction, self.kwargs["prediction_id"]) if db else None
+        )
+        run: Optional[Run] = db.get(Run, prediction.run_id) if prediction else None
+        return f"experiment_{run.experiment_id}" if run else None
+
+    def _input_column_types(
+        self, dataset_path: str, columns: List[str]
+    ) -> Dict[str, pa.DataType]:
+        """Get the types of the input columns in the dataset of the experiment.
+
+        The types are read from the dataset manifest, so the dataset is not
+        loaded. Only the columns with a Value feature get a type.
+        """
+        features = Features.from_dict(get_dataset_manifest(dataset_path)["features"])
+        return {
+            column: features[column].pa_type
+            for column in columns
+            if isinstance(features.get(column), Value)
+        }
+
+    def _read_batches(
+        self,
+        input_path: str,
+        columns: List[str],
+        column_types: Dict[str, pa.DataType],
+    ) -> Tuple[Iterator[pa.RecordBatch], Optional[int]]:
+        """Read the input columns of a CSV or Parquet file in batches.
+
+        The CSV files are read with the given column types, since otherwise
+        Arrow infers them from the first block only and a later block with other
+        values would fail to be read.
+
+        Returns
+        -------
+        Tuple[Iterator[pa.RecordBatch], Optional[int]]
+            The batches and the number of rows of the file, None if it is not
+            known before reading it.
+        """
+        if input_path.endswith(".parquet"):
+            parquet_file = pq.ParquetFile(input_path)
+            return (
+                parquet_file.iter_batches(batch_size=self.BATCH_SIZE, columns=columns),
+                parquet_file.metadata.num_rows,
+            )
+        reader = pa_csv.open_csv(
+            input_path,
+            read_options=pa_csv.ReadOptions(block_size=self.CSV_BLOCK_SIZE),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns, column_types=column_types
+            ),
+        )
+        return iter(reader), None
+
+    @inject
+    def run(
+        self,
+        component_registry: ComponentRegistry = lambda di: di["component_registry"],
+        model_cache: ModelCache = lambda di: di["model_cache"],
+    ) -> None:
+        prediction_id: int = self.kwargs["prediction_id"]
+        db: Session = self.kwargs["db"]
+
+        prediction: Prediction = db.get(Prediction, prediction_id)
+        if not prediction:
+            raise JobError(f"Prediction {prediction_id} does not exist in DB.")
+        try:
+            run: Run = db.get(Run, prediction.run_id)
+            if not run or not run.run_path:
+                raise JobError(f"Run {prediction.run_id} is not trained.")
+            experiment: Experiment = db.get(Experiment, run.experiment_id)
+            if not experiment:
+                raise JobError(f"Experiment {run.experiment_id} does not exist in DB.")
+
+            try:
+                model_class = component_registry[run.model_name]["class"]
+                model = model_cache.get(run.id, run.run_path, model_class)
+            except Exception as e:
+                log.exception(e)
+                raise JobError(f"Can not load model from path {run.run_path}") from e
+
+            dataset: Dataset = db.get(Dataset, experiment.dataset_id)
+            if not dataset:
+                raise JobError(f"Dataset {experiment.dataset_id} does not exist in DB.")
+            try:
+                column_types = self._input_column_types(
+                    f"{dataset.file_path}/dataset", experiment.input_columns
+                )
+            except Exception as e:
+                log.exception(e)
+                raise JobError(
+                    f"Can not load dataset from path {dataset.file_path}",
+                ) from e
+
+            try:
+                batches, prediction.total_rows = self._read_batches(
+                    prediction.input_path, experiment.input_columns, column_types
+                )
+                prediction.processed_rows = 0
+                prediction.set_status_as_started()
+                db.commit()
+            except exc.SQLAlchemyError as e:
+                log.exception(e)
+                raise JobError(
+                    "Connection with the database failed",
+                ) from e
+            except Exception as e:
+                log.exception(e)
+                raise JobError(
+                    f"Can not read the file {prediction.input_path}",
+                ) from e
+
+            output_path = os.path.join(
+                os.path.dirname(prediction.input_path),
+                f"predictions.{prediction.output_format}",
+            )
+            writer = _PredictionWriter(output_path, prediction.output_format)
+            try:
+                for batch in batches:
+                    table = pa.Table.from_batches([batch]).select(
+                        experiment.input_columns
+                    )
+                    writer.write(model.predict(DashAIDataset(InMemoryTable(table))))
+                    prediction.processed_rows += table.num_rows
+                    db.commit()
+            except Exception as e:
+                log.exception(e)
+                raise JobError(
+                    f"Prediction failed after {prediction.processed_rows} rows",
+                ) from e
+            finally:
+                writer.close()
+
+            try:
+                prediction.total_rows = prediction.processed_rows
+                prediction.output_path = output_path
+                prediction.set_status_as_finished()
+                db.commit()
+            except exc.SQLAlchemyError as e:
+                log.exception(e)
+                raise JobError(
+                    "Connection with the database failed",
+                ) from e
+        except Exception as e:
+            # Discard the changes left by the failed step before saving the error.
+            db.rollback()
+            prediction.set_status_as_error()
+            db.commit()
+            raise e
@@ -1,18 +1,19 @@
 """DashAI accuracy classification metric implementation."""
 
 import numpy as np
-from sklearn.metrics import accuracy_score
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.classification_metric import (
     ClassificationMetric,
-    prepare_to_metric,
+    prepare_confusion_matrix,
 )
 
 
 class Accuracy(ClassificationMetric):
     """Accuracy metric to classification tasks."""
 
+    SUPPORTS_CONFUSION_MATRIX: bool = True
+
     @staticmethod
     def score(true_labels: DashAIDataset, probs_pred_labels: np.ndarray) -> float:
         """Calculate the accuracy between true labels and predicted labels.
@@ -31,5 +32,23 @@ class Accuracy(ClassificationMetric):
         float
             Accuracy score between true labels and predicted labels
         """
-        true_labels, pred_labels = prepare_to_metric(true_labels, probs_pred_labels)
-        return accuracy_score(true_labels, pred_labels)
+        return Accuracy.score_confusion_matrix(
+            prepare_confusion_matrix(true_labels, probs_pred_labels)
+        )
+
+    @staticmethod
+    def score_confusion_matrix(matrix: np.ndarray) -> float:
+        """Calculate the accuracy from a confusion matrix.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            A square matrix where the entry (i, j) is the number of examples of
+            the class i predicted as the class j.
+
+        Returns
+        -------
+        float
+            Accuracy of the confusion matrix
+        """
+        return float(np.trace(matrix) / max(matrix.sum(), 1))
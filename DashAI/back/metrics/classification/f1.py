@@ -1,18 +1,21 @@
 """DashAI F1 clasification metric implementation."""
 
 import numpy as np
-from sklearn.metrics import f1_score
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.classification_metric import (
     ClassificationMetric,
-    prepare_to_metric,
+    average_class_scores,
+    prepare_confusion_matrix,
+    safe_divide,
 )
 
 
 class F1(ClassificationMetric):
     """F1 score to classification tasks."""
 
+    SUPPORTS_CONFUSION_MATRIX: bool = True
+
     @staticmethod
     def score(true_labels: DashAIDataset, probs_pred_labels: np.ndarray) -> float:
         """Calculate f1 score between true labels and predicted labels.
@@ -31,9 +34,26 @@ class F1(ClassificationMetric):
         float
             f1 score between true labels and predicted labels
         """
-        true_labels, pred_labels = prepare_to_metric(true_labels, probs_pred_labels)
-        multiclass = len(np.unique(true_labels)) > 2
-        if multiclass:
-            return f1_score(true_labels, pred_labels, average="macro")
-        else:
-            return f1_score(true_labels, pred_labels, average="binary")
+        return F1.score_confusion_matrix(
+            prepare_confusion_matrix(true_labels, probs_pred_labels)
+        )
+
+    @staticmethod
+    def score_confusion_matrix(matrix: np.ndarray) -> float:
+        """Calculate the f1 score from a confusion matrix.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            A square matrix where the entry (i, j) is the number of examples of
+            the class i predicted as the class j.
+
+        Returns
+        -------
+        float
+            F1 score of the confusion matrix
+        """
+        return average_class_scores(
+            safe_divide(2 * np.diag(matrix), matrix.sum(axis=0) + matrix.sum(axis=1)),
+            matrix,
+        )
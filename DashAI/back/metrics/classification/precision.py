@@ -1,18 +1,21 @@
 """DashAI precision classification metric implementation."""
 
 import numpy as np
-from sklearn.metrics import precision_score
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.classification_metric import (
     ClassificationMetric,
-    prepare_to_metric,
+    average_class_scores,
+    prepare_confusion_matrix,
+    safe_divide,
 )
 
 
 class Precision(ClassificationMetric):
     """Precision metric to classification tasks."""
 
+    SUPPORTS_CONFUSION_MATRIX: bool = True
+
     @staticmethod
     def score(true_labels: DashAIDataset, probs_pred_labels: np.ndarray) -> float:
         """Calculate precision between true labels and predicted labels.
@@ -31,9 +34,25 @@ class Precision(ClassificationMetric):
         float
             Precision score between true labels and predicted labels
         """
-        true_labels, pred_labels = prepare_to_metric(true_labels, probs_pred_labels)
-        multiclass = len(np.unique(true_labels)) > 2
-        if multiclass:
-            return precision_score(true_labels, pred_labels, average="macro")
-        else:
-            return precision_score(true_labels, pred_labels, average="binary")
+        return Precision.score_confusion_matrix(
+            prepare_confusion_matrix(true_labels, probs_pred_labels)
+        )
+
+    @staticmethod
+    def score_confusion_matrix(matrix: np.ndarray) -> float:
+        """Calculate the precision from a confusion matrix.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            A square matrix where the entry (i, j) is the number of examples of
+            the class i predicted as the class j.
+
+        Returns
+        -------
+        float
+            Precision of the confusion matrix
+        """
+        return average_class_scores(
+            safe_divide(np.diag(matrix), matrix.sum(axis=0)), matrix
+        )
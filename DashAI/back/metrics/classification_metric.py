@@ -1,6 +1,7 @@
-from typing import Tuple
+from typing import Dict, List, Tuple, Type, Union
 
 import numpy as np
+from datasets import ClassLabel
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.base_metric import BaseMetric
@@ -14,6 +15,63 @@ class ClassificationMetric(BaseMetric):
         "ImageClassificationTask",
         "TextClassificationTask",
     ]
+    # Whether the metric implements score_confusion_matrix, so score_batch can
+    # derive it from the shared confusion matrix.
+    SUPPORTS_CONFUSION_MATRIX: bool = False
+
+    @staticmethod
+    def score_confusion_matrix(matrix: np.ndarray) -> float:
+        """Calculate the metric from a confusion matrix.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            A square matrix where the entry (i, j) is the number of examples of
+            the class i predicted as the class j.
+
+        Returns
+        -------
+        float
+            The metric score.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def score_batch(
+        metrics: List[Type["ClassificationMetric"]],
+        true_labels: Union[DashAIDataset, np.ndarray],
+        probs_pred_labels: np.ndarray,
+    ) -> Dict[str, float]:
+        """Calculate several metrics over the same predictions.
+
+        The labels are converted and the confusion matrix is computed once, and
+        every metric that supports it is derived from it. The other metrics are
+        calculated with their score method.
+
+        Parameters
+        ----------
+        metrics : List[Type[ClassificationMetric]]
+            The metrics to calculate.
+        true_labels : Union[DashAIDataset, np.ndarray]
+            A DashAI dataset or an array with the labels.
+        probs_pred_labels : np.ndarray
+            A two-dimensional matrix in which each column represents a class and
+            the row values represent the probability that an example belongs to
+            the class associated with the column.
+
+        Returns
+        -------
+        Dict[str, float]
+            The score of each metric, indexed by the metric name.
+        """
+        matrix = prepare_confusion_matrix(true_labels, probs_pred_labels)
+        scores = {}
+        for metric in metrics:
+            if metric.SUPPORTS_CONFUSION_MATRIX:
+                scores[metric.__name__] = metric.score_confusion_matrix(matrix)
+            else:
+                scores[metric.__name__] = metric.score(true_labels, probs_pred_labels)
+        return scores
 
 
 def validate_inputs(true_labels: np.ndarray, pred_labels: np.ndarray) -> None:
@@ -35,15 +93,16 @@ def validate_inputs(true_labels: np.ndarray, pred_labels: np.ndarray) -> None:
 
 
 def prepare_to_metric(
-    y: DashAIDataset,
+    y: Union[DashAIDataset, np.ndarray],
     probs_pred_labels: np.ndarray,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Prepare true and prediced labels to be used later in metrics.
 
     Parameters
     ----------
-    y : DashAIDataset
-        A DashAIDataset with the output columns of the data.
+    y : Union[DashAIDataset, np.ndarray]
+        A DashAIDataset with the output columns of the data, or an array with the
+        labels.
     probs_pred_labels : np.ndarray
         A two-dimensional matrix in which each column represents a class and the row
         values represent the probability that an example belongs to the class
@@ -54,8 +113,137 @@ def prepare_to_metric(
     Tuple[np.ndarray, np.ndarray]
         A tuple with the true and predicted labels in numpy format.
     """
-    column_name = y.column_names[0]
-    true_labels = np.array(y[column_name])
+    if isinstance(y, np.ndarray):
+        true_labels = y
+    else:
+        # The numpy format reads the arrow column without building a list.
+        column_name = y.column_names[0]
+        true_labels = np.asarray(y.with_format("numpy")[column_name])
     validate_inputs(true_labels, probs_pred_labels)
     pred_labels = np.argmax(probs_pred_labels, axis=1)
     return true_labels, pred_labels
+
+
+def count_classes(
+    y: Union[DashAIDataset, np.ndarray], probs_pred_labels: np.ndarray
+) -> int:
+    """Get the number of classes of the labels.
+
+    Parameters
+    ----------
+    y : Union[DashAIDataset, np.ndarray]
+        A DashAIDataset with the output columns of the data, or an array with the
+        labels.
+    probs_pred_labels : np.ndarray
+        A two-dimensional matrix in which each column represents a class.
+
+    Returns
+    -------
+    int
+        The number of names of the ClassLabel feature of the labels. If the
+        labels are an array or not a ClassLabel, the number of columns of
+        probs_pred_labels.
+    """
+    if not isinstance(y, np.ndarray):
+        feature = y.features[y.column_names[0]]
+        if isinstance(feature, ClassLabel):
+            return feature.num_classes
+    return probs_pred_labels.shape[1]
+
+
+def prepare_confusion_matrix(
+    y: Union[DashAIDataset, np.ndarray], probs_pred_labels: np.ndarray
+) -> np.ndarray:
+    """Compute the confusion matrix of the predictions over all the classes.
+
+    Parameters
+    ----------
+    y : Union[DashAIDataset, np.ndarray]
+        A DashAIDataset with the output columns of the data, or an array with the
+        labels.
+    probs_pred_labels : np.ndarray
+        A two-dimensional matrix in which each column represents a class and the row
+        values represent the probability that an example belongs to the class
+        associated with the column.
+
+    Returns
+    -------
+    np.ndarray
+        A square matrix with a row and a column for each class of the labels, even
+        if it does not appear in them.
+    """
+    true_labels, pred_labels = prepare_to_metric(y, probs_pred_labels)
+    return confusion_matrix(
+        true_labels, pred_labels, count_classes(y, probs_pred_labels)
+    )
+
+
+def confusion_matrix(
+    true_labels: np.ndarray, pred_labels: np.ndarray, n_classes: int = 2
+) -> np.ndarray:
+    """Count the examples of each pair of true and predicted classes.
+
+    Parameters
+    ----------
+    true_labels : np.ndarray
+        The true class indexes.
+    pred_labels : np.ndarray
+        The predicted class indexes.
+    n_classes : int
+        Minimum number of classes of the matrix, by default 2.
+
+    Returns
+    -------
+    np.ndarray
+        A square matrix where the entry (i, j) is the number of examples of the
+        class i predicted as the class j.
+    """
+    true_labels = np.asarray(true_labels, dtype=np.int64)
+    pred_labels = np.asarray(pred_labels, dtype=np.int64)
+    n_classes = max(
+        n_classes,
+        2,
+        int(true_labels.max(initial=-1)) + 1,
+        int(pred_labels.max(initial=-1)) + 1,
+    )
+    counts = np.bincount(
+        true_labels * n_classes + pred_labels, minlength=n_classes * n_classes
+    )
+    return counts.reshape(n_classes, n_classes)
+
+
+def average_class_scores(class_scores: np.ndarray, matrix: np.ndarray) -> float:
+    """Average the scores of each class like the classification metrics do.
+
+    If the matrix has more than two classes, the scores are macro averaged over
+    the classes that appear in the true or the predicted labels. Otherwise, the
+    score of the class 1 is returned, as in a binary average. The classes are
+    those of the labels, so a batch that lacks some class is averaged like the
+    whole dataset.
+
+    Parameters
+    ----------
+    class_scores : np.ndarray
+        The score of each class.
+    matrix : np.ndarray
+        The confusion matrix the scores were calculated from.
+
+    Returns
+    -------
+    float
+        The averaged score.
+    """
+    if len(matrix) > 2:
+        present = (matrix.sum(axis=1) + matrix.sum(axis=0)) > 0
+        return float(class_scores[present].mean())
+    return float(class_scores[1])
+
+
+def safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divide element-wise, taking the divisions by zero as zero."""
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(len(numerator), dtype=float),
+        where=denominator != 0,
+    )
@@ -1,10 +1,9 @@
 """BLEU (bilingual evaluation understudy) metric implementation for DashAI."""
 
-import evaluate
 import numpy as np
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
-from DashAI.back.metrics.translation_metric import TranslationMetric, prepare_to_metric
+from DashAI.back.metrics.translation_metric import TranslationMetric, compute_metric
 
 
 class Bleu(TranslationMetric):
@@ -34,10 +33,7 @@ class Bleu(TranslationMetric):
         float
             The calculated BLEU score ranging between 0 and 1.
         """
-        metric = evaluate.load("bleu")
-        source_sentences, target_sentences = prepare_to_metric(
-            source_sentences, target_sentences
-        )
-        return metric.compute(
-            references=source_sentences, predictions=target_sentences
-        )["bleu"]
+        # sacrebleu scores BLEU as a percentage, computed in log space, so a
+        # perfect score may be slightly over 100.
+        score = compute_metric("bleu", source_sentences, target_sentences)
+        return min(score / 100, 1.0)
@@ -1,10 +1,9 @@
 """TER (Translation Edit Rate) metric implementation for DashAI."""
 
-import evaluate
 import numpy as np
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
-from DashAI.back.metrics.translation_metric import TranslationMetric, prepare_to_metric
+from DashAI.back.metrics.translation_metric import TranslationMetric, compute_metric
 
 
 class Ter(TranslationMetric):
@@ -34,10 +33,4 @@ class Ter(TranslationMetric):
         float
             The calculated score.
         """
-        metric = evaluate.load("ter")
-        source_sentences, target_sentences = prepare_to_metric(
-            source_sentences, target_sentences
-        )
-        return metric.compute(
-            references=source_sentences, predictions=target_sentences
-        )["score"]
+        return compute_metric("ter", source_sentences, target_sentences)
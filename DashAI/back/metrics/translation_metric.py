@@ -1,8 +1,16 @@
-import numpy as np
+import functools
+from typing import Sequence
+
+from sacrebleu.metrics import BLEU, TER
+from sacrebleu.metrics.base import Metric
+from sacrebleu.utils import sum_of_lists
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.metrics.base_metric import BaseMetric
 
+# Sentences whose statistics are computed at a time.
+SENTENCES_BATCH_SIZE = 1000
+
 
 class TranslationMetric(BaseMetric):
     """Class for metrics associated to translation models."""
@@ -24,22 +32,66 @@ def validate_inputs(true_labels: list, pred_labels: list) -> None:
         raise ValueError("The length of the true and predicted labels must be equal.")
 
 
-def prepare_to_metric(y: DashAIDataset, target_sentences: list):
-    """Format labels to be used in metrics.
+@functools.lru_cache(maxsize=None)
+def get_metric(name: str) -> Metric:
+    """Get the sacrebleu metric of a name, creating it the first time it is
+    requested.
+
+    The metrics only keep their configuration, the sentences are given to each
+    computation, so a single metric of each name is shared by the whole process.
+
+    Parameters
+    ----------
+    name : str
+        Name of the metric, "bleu" or "ter".
+
+    Returns
+    -------
+    Metric
+        The metric, configured as the evaluate metric of the same name.
+    """
+    if name == "bleu":
+        return BLEU(smooth_method="none")
+    if name == "ter":
+        return TER()
+    raise ValueError(f"Unknown translation metric {name}.")
+
+
+def compute_metric(
+    name: str, y: DashAIDataset, target_sentences: Sequence[str]
+) -> float:
+    """Compute a sacrebleu metric between the true and the target sentences.
+
+    The sufficient statistics of the metric are computed for
+    SENTENCES_BATCH_SIZE sentences at a time and added up, so the score of the
+    whole corpus is computed without holding all the sentences in a list.
 
     Parameters
     ----------
+    name : str
+        Name of the metric, "bleu" or "ter".
     y : DashAIDataset
         True sentences of the dataset.
-    target_sentences : list
+    target_sentences : Sequence[str]
         Target sentences.
 
     Returns
     -------
-    tuple
-        A tuple with the true and predicted sentences.
+    float
+        The score of the metric over the corpus.
     """
+    validate_inputs(y, target_sentences)
     column_name = y.column_names[0]
-    source_sentences = np.array(y[column_name])
-    validate_inputs(source_sentences, target_sentences)
-    return source_sentences, target_sentences
+    metric = get_metric(name)
+    stats = None
+    for start, batch in zip(
+        range(0, len(y), SENTENCES_BATCH_SIZE), y.iter(SENTENCES_BATCH_SIZE)
+    ):
+        batch_stats = sum_of_lists(
+            metric._extract_corpus_statistics(
+                list(target_sentences[start : start + SENTENCES_BATCH_SIZE]),
+                [batch[column_name]],
+            )
+        )
+        stats = batch_stats if stats is None else sum_of_lists([stats, batch_stats])
+    return metric._compute_score_from_stats(stats).score
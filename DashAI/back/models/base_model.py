@@ -1,7 +1,7 @@
 """Base Model abstract class."""
 
 from abc import ABCMeta, abstractmethod
-from typing import Any, Final
+from typing import Any, Callable, Final
 
 from DashAI.back.config_object import ConfigObject
 
@@ -30,3 +30,19 @@ class BaseModel(ConfigObject, metaclass=ABCMeta):
         filename (Str): Indicates where the model was stored.
         """
         raise NotImplementedError
+
+    def fit_incrementally(self, x: Any, y: Any, on_step: Callable[[int], None]) -> Any:
+        """Fit the model calling on_step after each stage of the training.
+
+        Models trained in stages (more trees, more boosting iterations or more
+        epochs) override this method to call on_step with the number of the
+        finished stage, when the partially trained model is ready to predict. The
+        optimizers use it to score the model during the training, and on_step
+        stops the training raising an exception when the model is not promising.
+        By default, the model is fitted at once and on_step is never called.
+
+        x (Any): The input data of the training.
+        y (Any): The output data of the training.
+        on_step (Callable[[int], None]): Function called after each stage.
+        """
+        return self.fit(x, y)
@@ -1,15 +1,20 @@
 """DashAI implementation of DistilBERT model for english classification."""
 
+import copy
 import shutil
-from typing import Any, Callable, Dict, Optional
+import tempfile
+from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
+import torch
 from datasets import Dataset
 from sklearn.exceptions import NotFittedError
 from transformers import (
+    DataCollatorWithPadding,
     DistilBertForSequenceClassification,
     DistilBertTokenizer,
     Trainer,
+    TrainerCallback,
     TrainingArguments,
 )
 
@@ -20,6 +25,8 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.models.hugging_face import pretrained_cache
+from DashAI.back.models.hugging_face.epoch_end_callback import EpochEndCallback
 from DashAI.back.models.text_classification_model import TextClassificationModel
 
 
@@ -75,6 +82,8 @@ class DistilBertTransformer(TextClassificationModel):
     """
 
     SCHEMA = DistilBertTransformerSchema
+    # Number of sentences classified at a time by predict.
+    PREDICT_BATCH_SIZE: int = 32
 
     def __init__(self, model=None, **kwargs):
         """Initialize the transformer model.
@@ -84,11 +93,15 @@ class DistilBertTransformer(TextClassificationModel):
         """
         kwargs = self.validate_and_transform(kwargs)
         self.model_name = "distilbert-base-uncased"
-        self.tokenizer = DistilBertTokenizer.from_pretrained(self.model_name)
+        self.tokenizer = pretrained_cache.from_pretrained(
+            DistilBertTokenizer, self.model_name
+        )
         self.model = (
             model
             if model is not None
-            else DistilBertForSequenceClassification.from_pretrained(self.model_name)
+            else pretrained_cache.from_pretrained(
+                DistilBertForSequenceClassification, self.model_name
+            )
         )
         self.fitted = model is not None
         if model is None:
@@ -117,33 +130,34 @@ class DistilBertTransformer(TextClassificationModel):
         """
 
         def _tokenize(batch) -> Dict[str, Any]:
-            tokenized_batch = {
-                "input_ids": self.tokenizer(
-                    batch[input_column],
-                    padding="max_length",
-                    truncation=True,
-                    max_length=512,
-                )["input_ids"],
-                "attention_mask": self.tokenizer(
-                    batch[input_column],
-                    padding="max_length",
-                    truncation=True,
-                    max_length=512,
-                )["attention_mask"],
-            }
+            # The sentences are not padded here, each batch is padded up to its
+            # longest sentence when it is collated.
+            tokenized_batch = dict(
+                self.tokenizer(batch[input_column], truncation=True, max_length=512)
+            )
+            tokenized_batch["length"] = [
+                len(input_ids) for input_ids in tokenized_batch["input_ids"]
+            ]
             if output_column:
                 tokenized_batch["labels"] = batch[output_column]
             return tokenized_batch
 
         return _tokenize
 
-    def fit(self, x: Dataset, y: Dataset):
+    def fit(
+        self,
+        x: Dataset,
+        y: Dataset,
+        callbacks: Optional[List[TrainerCallback]] = None,
+    ):
         """Fine-tune the pre-trained model.
 
         Parameters
         ----------
         dataset : DashAIDataset
             DashAIDataset with training data.
+        callbacks : Optional[List[TrainerCallback]]
+            Callbacks of the fine-tuning trainer.
 
         """
         input_column = x.column_names[0]
@@ -151,42 +165,71 @@ class DistilBertTransformer(TextClassificationModel):
         dataset = x.add_column(output_column, y[output_column])
 
         tokenizer_func = self.get_tokenizer(input_column, output_column)
-        dataset = dataset.map(tokenizer_func, batched=True, batch_size=self.batch_size)
-        dataset.set_format("torch", columns=["input_ids", "attention_mask", "labels"])
+        dataset = dataset.map(
+            tokenizer_func, batched=True, remove_columns=dataset.column_names
+        )
+
+        # Each fit gets its own checkpoints directory, since the trials of the
+        # optimizers may fine-tune copies of the model at the same time.
+        checkpoints_path = tempfile.mkdtemp(
+            prefix=f"checkpoints_{self.__class__.__name__}_"
+        )
 
         # Arguments for fine-tuning
         training_args = TrainingArguments(
-            output_dir="DashAI/back/user_models/temp_checkpoints_distilbert",
+            output_dir=checkpoints_path,
             save_steps=1,
             save_total_limit=1,
             per_device_train_batch_size=self.batch_size,
             per_device_eval_batch_size=self.batch_size,
             no_cuda=self.device != "gpu",
+            # Batches of sentences of similar length need less padding.
+            group_by_length=True,
             **self.training_args,
         )
 
+        # The pretrained weights are shared with other models through the cache,
+        # so they are copied before being fine-tuned.
+        if pretrained_cache.is_shared(self.model):
+            self.model = copy.deepcopy(self.model)
+
         # The Trainer class is used for fine-tuning the model.
         trainer = Trainer(
             model=self.model,
             args=training_args,
             train_dataset=dataset,
+            data_collator=DataCollatorWithPadding(self.tokenizer),
+            callbacks=callbacks,
         )
 
-        trainer.train()
+        try:
+            trainer.train()
+        finally:
+            shutil.rmtree(checkpoints_path, ignore_errors=True)
         self.fitted = True
-        shutil.rmtree(
-            "DashAI/back/user_models/temp_checkpoints_distilbert", ignore_errors=True
-        )
 
         return self
 
-    def predict(self, x: Dataset) -> np.array:
+    def fit_incrementally(
+        self,
+        x: Dataset,
+        y: Dataset,
+        on_step: Callable[[int], None],
+    ):
+        return self.fit(x, y, callbacks=[EpochEndCallback(self, on_step)])
+
+    def predict(self, x: Dataset, batch_size: Optional[int] = None) -> np.array:
         """Make a prediction with the fine-tuned model.
 
+        The sentences are sorted by length and classified in batches.
+
         Parameters
         ----------
         x : Dataset
             Dataset with text data.
+        batch_size : Optional[int]
+            Number of sentences classified at a time, PREDICT_BATCH_SIZE by
+            default.
 
         Returns
         -------
@@ -200,36 +243,42 @@ class DistilBertTransformer(TextClassificationModel):
                 "estimator."
             )
 
-        input_column = x.column_names[0]
-        tokenizer_func = self.get_tokenizer(input_column)
-        x = x.map(tokenizer_func, batched=True, batch_size=self.batch_size)
-        x.set_format("torch", columns=["input_ids", "attention_mask"])
+        if batch_size is None:
+            batch_size = self.PREDICT_BATCH_SIZE
+        tokenizer_func = self.get_tokenizer(x.column_names[0])
+        x = x.map(tokenizer_func, batched=True, remove_columns=x.column_names)
+        # Sentences of similar length are classified together, so the batches
+        # are padded only up to their longest sentence.
+        order = np.argsort(x["length"], kind="stable")
+        collator = DataCollatorWithPadding(self.tokenizer, return_tensors="pt")
 
+        self.model.eval()
         probabilities = []
-
-        # Calculate the number of batches
-        num_batches = len(x) // self.batch_size + (len(x) % self.batch_size > 0)
-
-        # Iterate over each batch
-        for i in range(num_batches):
-            start_idx = i * self.batch_size
-            end_idx = start_idx + self.batch_size
-
-            # Extract the batch from the dataset
-            batch = {
-                "input_ids": x["input_ids"][start_idx:end_idx],
-                "attention_mask": x["attention_mask"][start_idx:end_idx],
-            }
-
-            # Make sure that the tensors are in the correct device.
-            batch = {k: v.to(self.model.device) for k, v in batch.items()}
-            outputs = self.model(**batch)
-
-            # Takes the model probability using softmax
-            probs = outputs.logits.softmax(dim=-1)
-            probabilities.extend(probs.detach().cpu().numpy())
-
-        return np.array(probabilities)
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                rows = x[order[start : start + batch_size]]
+                batch = collator(
+                    {
+                        "input_ids": rows["input_ids"],
+                        "attention_mask": rows["attention_mask"],
+                    }
+                )
+
+                # Make sure that the tensors are in the correct device.
+                batch = {k: v.to(self.model.device) for k, v in batch.items()}
+                outputs = self.model(**batch)
+
+                # Takes the model probability using softmax
+                probs = outputs.logits.softmax(dim=-1)
+                probabilities.append(probs.cpu().numpy())
+
+        if not probabilities:
+            return np.empty((0, self.model.config.num_labels))
+        # Restore the order of the sentences.
+        sorted_probabilities = np.concatenate(probabilities)
+        probabilities = np.empty_like(sorted_probabilities)
+        probabilities[order] = sorted_probabilities
+        return probabilities
 
     def save(self, filename: str) -> None:
         self.model.save_pretrained(filename)
@@ -0,0 +1,40 @@
+from typing import Callable
+
+import torch
+from transformers import (
+    TrainerCallback,
+    TrainerControl,
+    TrainerState,
+    TrainingArguments,
+)
+
+from DashAI.back.models.base_model import BaseModel
+
+
+class EpochEndCallback(TrainerCallback):
+    """Trainer callback that calls a function at the end of each epoch.
+
+    It lets the transformer models report their progress in fit_incrementally.
+    While the function runs, the model is marked as fitted and it is in evaluation
+    mode, so the function can predict with the partially trained model.
+    """
+
+    def __init__(self, model: BaseModel, on_step: Callable[[int], None]) -> None:
+        self.model = model
+        self.on_step = on_step
+
+    def on_epoch_end(
+        self,
+        args: TrainingArguments,
+        state: TrainerState,
+        control: TrainerControl,
+        **kwargs,
+    ):
+        torch_model = kwargs["model"]
+        self.model.fitted = True
+        torch_model.eval()
+        try:
+            with torch.no_grad():
+                self.on_step(round(state.epoch) - 1)
+        finally:
+            torch_model.train()
@@ -1,15 +1,20 @@
 """OpusMtEnESTransformer model for english-spanish translation DashAI implementation."""
 
+import copy
 import shutil
-from typing import List, Optional
+import tempfile
+from typing import Callable, List, Optional
 
+import torch
 from datasets import Dataset
 from sklearn.exceptions import NotFittedError
 from transformers import (
     AutoModelForSeq2SeqLM,
     AutoTokenizer,
+    DataCollatorForSeq2Seq,
     Seq2SeqTrainer,
     Seq2SeqTrainingArguments,
+    TrainerCallback,
 )
 
 from DashAI.back.core.schema_fields import (
@@ -19,6 +24,8 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.models.hugging_face import pretrained_cache
+from DashAI.back.models.hugging_face.epoch_end_callback import EpochEndCallback
 from DashAI.back.models.translation_model import TranslationModel
 
 
@@ -65,6 +72,8 @@ class OpusMtEnESTransformer(TranslationModel):
     """
 
     SCHEMA = OpusMtEnESTransformerSchema
+    # Number of sentences translated at a time by predict.
+    PREDICT_BATCH_SIZE: int = 32
 
     def __init__(self, model=None, **kwargs):
         """Initialize the transformer.
@@ -74,7 +83,9 @@ class OpusMtEnESTransformer(TranslationModel):
         """
         kwargs = self.validate_and_transform(kwargs)
         self.model_name = "Helsinki-NLP/opus-mt-en-es"
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self.tokenizer = pretrained_cache.from_pretrained(
+            AutoTokenizer, self.model_name
+        )
         if model is None:
             self.training_args = kwargs
             self.batch_size = kwargs.pop("batch_size", 16)
@@ -82,7 +93,9 @@ class OpusMtEnESTransformer(TranslationModel):
         self.model = (
             model
             if model is not None
-            else AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+            else pretrained_cache.from_pretrained(
+                AutoModelForSeq2SeqLM, self.model_name
+            )
         )
         self.fitted = model is not None
 
@@ -101,43 +114,37 @@ class OpusMtEnESTransformer(TranslationModel):
         Dataset
             Dataset with the processed data.
         """
-        is_y = bool(y)
-        if not y:
-            y = Dataset.from_list([{"foo": 0}] * len(x))
-        # Initialize useful variables
-        dataset = []
-        input_column_name = x.column_names[0]
-        output_column_name = y.column_names[0]
-
-        # Preprocess both datasets
-        for input_sample, output_sample in zip(x, y):  # noqa
-            tokenized_input = self.tokenizer(
-                input_sample[input_column_name],
+        # The sentences are tokenized in a single call per column. They are not
+        # padded here, each batch is padded up to its longest sentence when it is
+        # collated.
+        tokenized_input = self.tokenizer(
+            x[x.column_names[0]],
+            truncation=True,
+            max_length=512,
+        )
+        labels = (
+            self.tokenizer(
+                y[y.column_names[0]],
                 truncation=True,
-                padding="max_length",
                 max_length=512,
-            )
-            tokenized_output = (
-                self.tokenizer(
-                    output_sample[output_column_name],
-                    truncation=True,
-                    padding="max_length",
-                    max_length=512,
-                )
-                if is_y
-                else None
-            )
-            sample = {
+            )["input_ids"]
+            if y
+            else [0] * len(x)
+        )
+        return Dataset.from_dict(
+            {
                 "input_ids": tokenized_input["input_ids"],
                 "attention_mask": tokenized_input["attention_mask"],
-                "labels": tokenized_output["input_ids"]
-                if is_y
-                else y[output_column_name],
+                "labels": labels,
             }
-            dataset.append(sample)
-        return Dataset.from_list(dataset)
+        )
 
-    def fit(self, x_train: Dataset, y_train: Dataset):
+    def fit(
+        self,
+        x_train: Dataset,
+        y_train: Dataset,
+        callbacks: Optional[List[TrainerCallback]] = None,
+    ):
         """Fine-tune the pre-trained model.
 
         Parameters
@@ -146,44 +153,75 @@ class OpusMtEnESTransformer(TranslationModel):
             Dataset with input training data.
         y_train : Dataset
             Dataset with output training data.
+        callbacks : Optional[List[TrainerCallback]]
+            Callbacks of the fine-tuning trainer.
 
         """
 
         dataset = self.tokenize_data(x_train, y_train)
-        dataset.set_format("torch", columns=["input_ids", "attention_mask", "labels"])
+
+        # Each fit gets its own checkpoints directory, since the trials of the
+        # optimizers may fine-tune copies of the model at the same time.
+        checkpoints_path = tempfile.mkdtemp(
+            prefix=f"checkpoints_{self.__class__.__name__}_"
+        )
 
         # Arguments for fine-tuning
         training_args = Seq2SeqTrainingArguments(
-            output_dir="DashAI/back/user_models/temp_checkpoints_opus-mt-en-es",
+            output_dir=checkpoints_path,
             save_steps=1,
             save_total_limit=1,
             per_device_train_batch_size=self.batch_size,
             per_device_eval_batch_size=self.batch_size,
             no_cuda=self.device != "gpu",
+            # Batches of sentences of similar length need less padding.
+            group_by_length=True,
             **self.training_args,
         )
 
+        # The pretrained weights are shared with other models through the cache,
+        # so they are copied before being fine-tuned.
+        if pretrained_cache.is_shared(self.model):
+            self.model = copy.deepcopy(self.model)
+
         # The Trainer class is used for fine-tuning the model.
         trainer = Seq2SeqTrainer(
             model=self.model,
             args=training_args,
             train_dataset=dataset,
+            # Pads the inputs and the labels of each batch, the padded labels are
+            # ignored by the loss.
+            data_collator=DataCollatorForSeq2Seq(self.tokenizer, model=self.model),
+            callbacks=callbacks,
         )
 
-        trainer.train()
+        try:
+            trainer.train()
+        finally:
+            shutil.rmtree(checkpoints_path, ignore_errors=True)
         self.fitted = True
-        shutil.rmtree(
-            "DashAI/back/user_models/temp_checkpoints_opus-mt-en-es", ignore_errors=True
-        )
         return self
 
-    def predict(self, x_pred: Dataset) -> List:
+    def fit_incrementally(
+        self,
+        x_train: Dataset,
+        y_train: Dataset,
+        on_step: Callable[[int], None],
+    ):
+        return self.fit(x_train, y_train, callbacks=[EpochEndCallback(self, on_step)])
+
+    def predict(self, x_pred: Dataset, batch_size: Optional[int] = None) -> List:
         """Predict with the fine-tuned model.
 
+        The sentences are sorted by length and translated in batches.
+
         Parameters
         ----------
         x_pred : Dataset
             Dataset with text data.
+        batch_size : Optional[int]
+            Number of sentences translated at a time, PREDICT_BATCH_SIZE by
+            default.
 
         Returns
         -------
@@ -197,20 +235,32 @@ class OpusMtEnESTransformer(TranslationModel):
                 "estimator."
             )
 
-        dataset = self.tokenize_data(x_pred)
-        dataset.set_format(type="torch", columns=["input_ids", "attention_mask"])
-
-        translations = []
-
-        for example in dataset:
-            inputs = {
-                k: v.unsqueeze(0).to(self.model.device) for k, v in example.items()
-            }
-            outputs = self.model.generate(**inputs)
-            translated_text = self.tokenizer.decode(
-                outputs[0], skip_special_tokens=True
-            )
-            translations.append(translated_text)
+        if batch_size is None:
+            batch_size = self.PREDICT_BATCH_SIZE
+        sentences = x_pred[x_pred.column_names[0]]
+        # Sentences of similar length are translated together, so the batches
+        # are padded only up to their longest sentence.
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i]))
+
+        self.model.eval()
+        translations = [None] * len(sentences)
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                indices = order[start : start + batch_size]
+                inputs = self.tokenizer(
+                    [sentences[i] for i in indices],
+                    truncation=True,
+                    padding=True,
+                    max_length=512,
+                    return_tensors="pt",
+                )
+                outputs = self.model.generate(
+                    input_ids=inputs["input_ids"].to(self.model.device),
+                    attention_mask=inputs["attention_mask"].to(self.model.device),
+                )
+                decoded = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+                for i, translated_text in zip(indices, decoded):
+                    translations[i] = translated_text
 
         return translations
 
@@ -0,0 +1,68 @@
+"""Process-wide cache of the pretrained components of the transformer models.
+
+Only the base checkpoints from the hub are cached here. The fine-tuned models
+saved by the runs are loaded directly, they are cached by the ModelCache.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable
+
+# Maximum number of components (models, tokenizers or feature extractors) kept
+# loaded by the cache.
+CACHE_SIZE: int = 6
+
+_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+_lock = threading.Lock()
+# Every component handed out by the cache, even if it has been evicted, since
+# the models that got it may still be using it.
+_shared = weakref.WeakSet()
+
+
+def from_pretrained(loader_class: Any, name_or_path: str) -> Any:
+    """Get the component loaded by loader_class.from_pretrained(name_or_path).
+
+    The component is loaded the first time and then shared by every caller, so
+    it must not be modified in place. Models use is_shared to copy it before
+    fine-tuning it.
+
+    Parameters
+    ----------
+    loader_class : Any
+        Class with a from_pretrained method, e.g. AutoTokenizer.
+    name_or_path : str
+        Name of the pretrained component in the hub.
+
+    Returns
+    -------
+    Any
+        The loaded component.
+    """
+    key = (loader_class, name_or_path)
+    with _lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    # Loading may take seconds, so it is done without holding the lock.
+    component = loader_class.from_pretrained(name_or_path)
+    with _lock:
+        component = _cache.setdefault(key, component)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+        _shared.add(component)
+    return component
+
+
+def is_shared(component: Any) -> bool:
+    """Check if a component was handed out by the cache."""
+    with _lock:
+        return component in _shared
+
+
+def clear() -> None:
+    """Remove every component from the cache."""
+    with _lock:
+        _cache.clear()
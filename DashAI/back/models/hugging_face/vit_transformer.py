@@ -1,13 +1,18 @@
 """DashAI implementation of DistilBERT model for image classification."""
 
+import copy
 import shutil
-from typing import Optional
+import tempfile
+from typing import Callable, List, Optional
 
 import numpy as np
+import torch
 from datasets import Dataset
 from sklearn.exceptions import NotFittedError
+from torch.utils.data import DataLoader
 from transformers import (
     Trainer,
+    TrainerCallback,
     TrainingArguments,
     ViTFeatureExtractor,
     ViTForImageClassification,
@@ -20,6 +25,8 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
+from DashAI.back.models.hugging_face import pretrained_cache
+from DashAI.back.models.hugging_face.epoch_end_callback import EpochEndCallback
 from DashAI.back.models.image_classification_model import ImageClassificationModel
 
 
@@ -57,6 +64,23 @@ class ViTTransformerSchema(BaseSchema):
     )  # type: ignore
 
 
+class _ImageCollator:
+    """Turn a list of dataset rows into a batch of ViT pixel values.
+
+    It is a class instead of a closure so the DataLoader workers can pickle it
+    without the model.
+    """
+
+    def __init__(self, feature_extractor: ViTFeatureExtractor, column: str) -> None:
+        self.feature_extractor = feature_extractor
+        self.column = column
+
+    def __call__(self, rows: List[dict]) -> torch.Tensor:
+        return self.feature_extractor(
+            images=[row[self.column] for row in rows], return_tensors="pt", size=224
+        )["pixel_values"]
+
+
 class ViTTransformer(ImageClassificationModel):
     """Pre-trained Vision Transformer (ViT) for image classification.
 
@@ -70,6 +94,12 @@ class ViTTransformer(ImageClassificationModel):
     """
 
     SCHEMA = ViTTransformerSchema
+    # Number of images classified at a time by predict.
+    PREDICT_BATCH_SIZE: int = 32
+    # Number of DataLoader processes that preprocess the images in predict. The
+    # images are preprocessed in the predicting thread by default, since the
+    # workers are spawned for each prediction.
+    PREDICT_NUM_WORKERS: int = 0
 
     def __init__(self, model=None, **kwargs):
         """Initialize the transformer.
@@ -79,11 +109,15 @@ class ViTTransformer(ImageClassificationModel):
         """
         kwargs = self.validate_and_transform(kwargs)
         self.model_name = "google/vit-base-patch16-224"
-        self.feature_extractor = ViTFeatureExtractor.from_pretrained(self.model_name)
+        self.feature_extractor = pretrained_cache.from_pretrained(
+            ViTFeatureExtractor, self.model_name
+        )
         self.model = (
             model
             if model is not None
-            else ViTForImageClassification.from_pretrained(self.model_name)
+            else pretrained_cache.from_pretrained(
+                ViTForImageClassification, self.model_name
+            )
         )
         self.fitted = model is not None
         if model is None:
@@ -135,7 +169,12 @@ class ViTTransformer(ImageClassificationModel):
             )
         return Dataset.from_list(dataset)
 
-    def fit(self, x_train: Dataset, y_train: Dataset):
+    def fit(
+        self,
+        x_train: Dataset,
+        y_train: Dataset,
+        callbacks: Optional[List[TrainerCallback]] = None,
+    ):
         """Fine-tune the pre-trained model.
 
         Parameters
@@ -144,13 +183,21 @@ class ViTTransformer(ImageClassificationModel):
             Dataset with input training data.
         y_train: Dataset
             Dataset with output training data.
+        callbacks : Optional[List[TrainerCallback]]
+            Callbacks of the fine-tuning trainer.
 
         """
         dataset = self.preprocess_images(x_train, y_train)
 
+        # Each fit gets its own checkpoints directory, since the trials of the
+        # optimizers may fine-tune copies of the model at the same time.
+        checkpoints_path = tempfile.mkdtemp(
+            prefix=f"checkpoints_{self.__class__.__name__}_"
+        )
+
         # Arguments for fine-tuning
         training_args = TrainingArguments(
-            output_dir="DashAI/back/user_models/temp_checkpoints_vit",
+            output_dir=checkpoints_path,
             save_steps=1,
             save_total_limit=1,
             per_device_train_batch_size=self.batch_size,
@@ -159,26 +206,46 @@ class ViTTransformer(ImageClassificationModel):
             **self.training_args,
         )
 
+        # The pretrained weights are shared with other models through the cache,
+        # so they are copied before being fine-tuned.
+        if pretrained_cache.is_shared(self.model):
+            self.model = copy.deepcopy(self.model)
+
         # The Trainer class is used for fine-tuning the model.
         trainer = Trainer(
             model=self.model,
             args=training_args,
             train_dataset=dataset,
+            callbacks=callbacks,
         )
 
-        trainer.train()
+        try:
+            trainer.train()
+        finally:
+            shutil.rmtree(checkpoints_path, ignore_errors=True)
         self.fitted = True
-        shutil.rmtree(
-            "DashAI/back/user_models/temp_checkpoints_vit", ignore_errors=True
-        )
 
-    def predict(self, x_pred: Dataset) -> np.array:
+    def fit_incrementally(
+        self,
+        x_train: Dataset,
+        y_train: Dataset,
+        on_step: Callable[[int], None],
+    ):
+        return self.fit(x_train, y_train, callbacks=[EpochEndCallback(self, on_step)])
+
+    def predict(self, x_pred: Dataset, batch_size: Optional[int] = None) -> np.array:
         """Make a prediction with the fine-tuned model.
 
+        The images are preprocessed and classified in batches. If
+        PREDICT_NUM_WORKERS is set, the batches after the first one are prepared
+        by DataLoader workers while the model runs.
+
         Parameters
         ----------
         x_pred : Dataset
             Dataset with image data.
+        batch_size : Optional[int]
+            Number of images classified at a time, PREDICT_BATCH_SIZE by default.
 
         Returns
         -------
@@ -191,30 +258,33 @@ class ViTTransformer(ImageClassificationModel):
                 " with appropriate arguments before using this estimator."
             )
 
-        dataset = self.preprocess_images(x_pred)
-        dataset.set_format("torch", columns=["pixel_values", "labels"])
+        if batch_size is None:
+            batch_size = self.PREDICT_BATCH_SIZE
+        # The workers only pay off when there is a next batch to prefetch.
+        num_workers = self.PREDICT_NUM_WORKERS if len(x_pred) > batch_size else 0
+        loader = DataLoader(
+            x_pred,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            collate_fn=_ImageCollator(self.feature_extractor, x_pred.column_names[0]),
+            # Forking a process that runs jobs in threads may copy held locks.
+            multiprocessing_context="spawn" if num_workers > 0 else None,
+        )
 
+        self.model.eval()
         probabilities = []
-
-        # Iterate over each batch in the dataset
-        for i in range(len(dataset)):
-            # Prepare a batch of images for the model
-            batch = dataset[i]
-
-            # Make sure that the tensors are in the correct device.
-            batch = {k: v.to(self.model.device) for k, v in batch.items()}
-
-            if batch["pixel_values"].dim() == 3:
-                batch["pixel_values"] = batch["pixel_values"].unsqueeze(0)
-
-            outputs = self.model(**batch)
-
-            # Takes the model probability using softmax
-            probs = outputs.logits.softmax(dim=-1)
-
-            probabilities.extend(probs.detach().cpu().numpy())
-
-        return np.array(probabilities)
+        with torch.inference_mode():
+            for pixel_values in loader:
+                # Make sure that the tensors are in the correct device.
+                outputs = self.model(pixel_values=pixel_values.to(self.model.device))
+
+                # Takes the model probability using softmax
+                probs = outputs.logits.softmax(dim=-1)
+                probabilities.append(probs.cpu().numpy())
+
+        if not probabilities:
+            return np.empty((0, self.model.config.num_labels))
+        return np.concatenate(probabilities)
 
     def save(self, filename=None):
         self.model.save_pretrained(filename)
@@ -1,7 +1,12 @@
-from typing import Optional
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Union
 
 import numpy as np
 from datasets import Dataset
+from scipy.sparse import csr_matrix
+from sklearn.base import clone
 from sklearn.feature_extraction.text import CountVectorizer
 
 from DashAI.back.core.schema_fields import (
@@ -10,10 +15,11 @@ from DashAI.back.core.schema_fields import (
     int_field,
     schema_field,
 )
-from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.models.scikit_learn.sklearn_like_model import SklearnLikeModel
 from DashAI.back.models.text_classification_model import TextClassificationModel
 
+logger = logging.getLogger(__name__)
+
 
 class BagOfWordsTextClassificationModelSchema(BaseSchema):
     """
@@ -49,6 +55,61 @@ class BagOfWordsTextClassificationModelSchema(BaseSchema):
     )  # type: ignore
 
 
+class _VectorizationCache:
+    """Fitted vectorizers and transformed matrices of a bag of words model.
+
+    Both are kept in least recently used caches of a fixed size. The vectorizers
+    are keyed by the ngram range and the fingerprint of the train dataset, and the
+    matrices by the key of their vectorizer and the fingerprint of the dataset.
+
+    The deep copies of a model, like the ones of the hyperparameter trials, share
+    the cache of the original model. The cache is not saved with the model, it is
+    loaded empty.
+    """
+
+    def __init__(self, vectorizers_size: int, matrices_size: int) -> None:
+        self.vectorizers_size = vectorizers_size
+        self.matrices_size = matrices_size
+        self.lock = threading.Lock()
+        self.vectorizers: "OrderedDict[Hashable, CountVectorizer]" = OrderedDict()
+        self.matrices: "OrderedDict[Hashable, csr_matrix]" = OrderedDict()
+
+    def __deepcopy__(self, memo: dict) -> "_VectorizationCache":
+        return self
+
+    def __reduce__(self):
+        return _VectorizationCache, (self.vectorizers_size, self.matrices_size)
+
+    def _get(
+        self,
+        entries: "OrderedDict[Hashable, Any]",
+        size: int,
+        key: Hashable,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Get an entry, computing it and evicting the oldest ones if missing."""
+        with self.lock:
+            if key in entries:
+                entries.move_to_end(key)
+            else:
+                entries[key] = compute()
+                while len(entries) > size:
+                    entries.popitem(last=False)
+            return entries[key]
+
+    def get_vectorizer(
+        self, key: Hashable, fit: Callable[[], CountVectorizer]
+    ) -> CountVectorizer:
+        """Get the vectorizer of key, fitting it with fit if it is missing."""
+        return self._get(self.vectorizers, self.vectorizers_size, key, fit)
+
+    def get_matrix(
+        self, key: Hashable, transform: Callable[[], csr_matrix]
+    ) -> csr_matrix:
+        """Get the matrix of key, transforming it with transform if it is missing."""
+        return self._get(self.matrices, self.matrices_size, key, transform)
+
+
 class BagOfWordsTextClassificationModel(TextClassificationModel, SklearnLikeModel):
     """Text classification meta-model.
 
@@ -65,66 +126,165 @@ class BagOfWordsTextClassificationModel(TextClassificationModel, SklearnLikeMode
     train dataset.
 
     To predict with the tabular_model the vectorizer is used to transform the dataset.
+
+    The vectorized text is kept as a sparse matrix for the tabular models that accept
+    it, and densified into a numpy array only for the ones that do not. Those models
+    predict DENSE_BATCH_SIZE rows at a time, so only a batch is densified. To train
+    them, the vocabulary is limited to the most frequent words that keep the dense
+    train matrix under MAX_DENSE_SIZE values.
+
+    The last fitted vectorizers and transformed matrices are cached, keyed by the
+    ngram range and the dataset fingerprints, so the hyperparameter trials that only
+    change the tabular_model do not vectorize the datasets again. The cache is shared
+    with the deep copies of the model.
     """
 
     SCHEMA = BagOfWordsTextClassificationModelSchema
+    # Rows predicted at a time by the classifiers without sparse input support.
+    DENSE_BATCH_SIZE: int = 1000
+    # Values of the densified train matrix of the classifiers without sparse input
+    # support, 2 GiB of int64 counts.
+    MAX_DENSE_SIZE: int = 2**28
+    # Number of fitted vectorizers kept in the cache.
+    VECTORIZER_CACHE_SIZE: int = 2
+    # Number of transformed datasets kept in the cache.
+    MATRIX_CACHE_SIZE: int = 4
 
     def __init__(self, sub_model, **kwargs) -> None:
         self.classifier = sub_model
         self.vectorizer = CountVectorizer(
             ngram_range=(kwargs["ngram_min_n"], kwargs["ngram_max_n"])
         )
+        self._vectorizer_key: Optional[Hashable] = None
+        self._cache = self._new_cache()
 
-    def get_vectorizer(self, input_column: str, output_column: Optional[str] = None):
-        """Factory that returns a function to transform a text classification dataset
-        into a tabular classification dataset.
+    def _new_cache(self) -> _VectorizationCache:
+        return _VectorizationCache(self.VECTORIZER_CACHE_SIZE, self.MATRIX_CACHE_SIZE)
+
+    def __setstate__(self, state: dict) -> None:
+        # The models saved before the cache existed have their own matrices.
+        state.pop("_matrices", None)
+        self.__dict__.update(
+            {"_vectorizer_key": None, "_cache": self._new_cache(), **state}
+        )
 
-        To do this, the column "text" is vectorized (using a BagOfWords) into a sparse
-        matrix of size NxM, where N is the number of examples and M is the vocabulary
-        size.
+    def _max_features(self, x: Dataset) -> Optional[int]:
+        """Get the vocabulary size limit of the vectorizer fitted with x.
 
-        Each column of the output matrix will be named using the input_column name as
-        prefix and the column number as suffix.
+        Parameters
+        ----------
+        x : Dataset
+            Dataset with the text column.
 
-        The output_column is not changed.
+        Returns
+        -------
+        Optional[int]
+            None if the classifier accepts sparse input, so the vocabulary is not
+            limited, otherwise the number of words that keep the densified matrix
+            of x under MAX_DENSE_SIZE values.
+        """
+        if self._accepts_sparse_input():
+            return None
+        return max(1, self.MAX_DENSE_SIZE // max(1, len(x)))
+
+    def _fit_vectorizer(self, x: Dataset) -> None:
+        """Fit the vectorizer, unless it is already fitted with the same dataset.
 
         Parameters
         ----------
-        input_column : str
-            name the input column of the dataset. This column will be vectorized.
+        x : Dataset
+            Dataset with the text column.
+        """
+        max_features = self._max_features(x)
+        key = (self.vectorizer.ngram_range, max_features, x._fingerprint)
+        # The cached vectorizers are shared, so they are never refitted.
+        self.vectorizer = self._cache.get_vectorizer(
+            key,
+            lambda: clone(self.vectorizer)
+            .set_params(max_features=max_features)
+            .fit(x[x.column_names[0]]),
+        )
+        self._vectorizer_key = key
+        if max_features == len(self.vectorizer.vocabulary_):
+            logger.warning(
+                "The vocabulary was limited to the %d most frequent terms, since "
+                "%s does not accept sparse input.",
+                max_features,
+                type(self.classifier).__name__,
+            )
 
-        output_column : str
-            name the output column of the dataset.
+    def _vectorize(self, x: Dataset) -> csr_matrix:
+        """Vectorize the text column of a dataset in a single transform call.
+
+        Parameters
+        ----------
+        x : Dataset
+            Dataset with the text column.
 
         Returns
         -------
-        Function
-            Function for vectorize the dataset.
+        csr_matrix
+            Sparse matrix of size NxM, where N is the number of examples and M is
+            the vocabulary size.
         """
+        if self._vectorizer_key is None:
+            # The vectorizer was not fitted by this model, it can not be cached.
+            return self.vectorizer.transform(x[x.column_names[0]])
 
-        def _vectorize(example) -> dict:
-            vectorized_sentence = self.vectorizer.transform(
-                [example[input_column]]
-            ).toarray()
-            output_example = {}
-            for idx in range(np.shape(vectorized_sentence)[1]):
-                output_example[input_column + str(idx)] = vectorized_sentence[0][idx]
-            return output_example
+        return self._cache.get_matrix(
+            (self._vectorizer_key, x._fingerprint),
+            lambda: self.vectorizer.transform(x[x.column_names[0]]),
+        )
 
-        return _vectorize
+    def _accepts_sparse_input(self) -> bool:
+        """Check if the classifier can use the sparse matrices directly."""
+        return getattr(self.classifier, "ACCEPTS_SPARSE_INPUT", False)
 
-    def fit(self, x: Dataset, y: Dataset):
-        input_column = x.column_names[0]
-        self.vectorizer.fit(x[input_column])
-        tokenizer_func = self.get_vectorizer(input_column)
-        tokenized_dataset = x.map(tokenizer_func, remove_columns="text")
+    def _to_classifier_input(self, matrix: csr_matrix) -> Union[csr_matrix, np.ndarray]:
+        """Adapt the vectorized text to the input accepted by the classifier.
 
-        self.classifier.fit(DashAIDataset(tokenized_dataset.data), y)
+        Sparse matrices are passed directly to the classifiers that accept them.
+        Otherwise, the matrix is densified into a numpy array, which the
+        classifier uses without any further conversion.
 
-    def predict(self, x: Dataset):
-        input_column = x.column_names[0]
+        Parameters
+        ----------
+        matrix : csr_matrix
+            The vectorized text.
+
+        Returns
+        -------
+        Union[csr_matrix, np.ndarray]
+            The input of the classifier.
+        """
+        if self._accepts_sparse_input():
+            return matrix
+        return matrix.toarray()
 
-        tokenizer_func = self.get_vectorizer(input_column)
-        tokenized_dataset = x.map(tokenizer_func, remove_columns="text")
+    def fit(self, x: Dataset, y: Dataset):
+        self._fit_vectorizer(x)
+        self.classifier.fit(self._to_classifier_input(self._vectorize(x)), y)
+
+    def fit_incrementally(
+        self, x: Dataset, y: Dataset, on_step: Callable[[int], None]
+    ) -> "BagOfWordsTextClassificationModel":
+        self._fit_vectorizer(x)
+        self.classifier.fit_incrementally(
+            self._to_classifier_input(self._vectorize(x)), y, on_step
+        )
+        return self
 
-        return self.classifier.predict(DashAIDataset(tokenized_dataset.data))
+    def predict(self, x: Dataset):
+        matrix = self._vectorize(x)
+        if self._accepts_sparse_input() or matrix.shape[0] <= self.DENSE_BATCH_SIZE:
+            return self.classifier.predict(self._to_classifier_input(matrix))
+        return np.concatenate(
+            [
+                self.classifier.predict(
+                    self._to_classifier_input(
+                        matrix[start : start + self.DENSE_BATCH_SIZE]
+                    )
+                )
+                for start in range(0, matrix.shape[0], self.DENSE_BATCH_SIZE)
+            ]
+        )
@@ -93,6 +93,8 @@ class HistGradientBoostingClassifier(
     """Scikit-learn's HistGradientBoostingRegressor wrapper for DashAI."""
 
     SCHEMA = HistGradientBoostingClassifierSchema
+    ACCEPTS_SPARSE_INPUT = False
+    INCREMENTAL_PARAMETER = "max_iter"
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -97,6 +97,7 @@ class RandomForestClassifier(
     """Scikit-learn's Random Forest classifier wrapper for DashAI."""
 
     SCHEMA = RandomForestClassifierSchema
+    INCREMENTAL_PARAMETER = "n_estimators"
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
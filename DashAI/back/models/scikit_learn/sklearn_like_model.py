@@ -1,7 +1,9 @@
-from typing import Type, Union
+from typing import Callable, Optional, Type, Union
 
 import joblib
+import numpy as np
 import pandas as pd
+from scipy.sparse import spmatrix
 
 from DashAI.back.dataloaders.classes.dashai_dataset import DashAIDataset
 from DashAI.back.models.base_model import BaseModel
@@ -10,6 +12,14 @@ from DashAI.back.models.base_model import BaseModel
 class SklearnLikeModel(BaseModel):
     """Abstract class to define the way to save sklearn like models."""
 
+    # Whether the estimator can be fitted and can predict with scipy sparse
+    # matrices, besides datasets, dataframes and arrays.
+    ACCEPTS_SPARSE_INPUT: bool = True
+    # Parameter with the size of the estimator, like the number of trees, that can
+    # be grown with warm_start to fit the estimator in stages.
+    INCREMENTAL_PARAMETER: Optional[str] = None
+    INCREMENTAL_STAGES: int = 5
+
     def save(self, filename: str) -> None:
         """Save the model in the specified path."""
         joblib.dump(self, filename)
@@ -23,14 +33,16 @@ class SklearnLikeModel(BaseModel):
     # --- Methods for process the data for sklearn models ---
 
     def fit(
-        self, x_train: DashAIDataset, y_train: DashAIDataset
+        self,
+        x_train: Union[DashAIDataset, np.ndarray, spmatrix],
+        y_train: DashAIDataset,
     ) -> Type["SklearnLikeModel"]:
         """Fit the estimator.
 
         Parameters
         ----------
-        x_train : pd.DataFrame
-            Dataframe with the input data.
+        x_train : Union[DashAIDataset, np.ndarray, spmatrix]
+            Dataset, array or sparse matrix with the input data.
         y_train : pd.DataFrame
             Dataframe with the output data.
 
@@ -39,17 +51,64 @@ class SklearnLikeModel(BaseModel):
         self
             The fitted estimator object.
         """
-        x_pandas = x_train.to_pandas()
+        if isinstance(x_train, DashAIDataset):
+            x_train = x_train.to_pandas()
         y_pandas = y_train.to_pandas()
-        return super().fit(x_pandas, y_pandas)
+        return super().fit(x_train, y_pandas)
+
+    def fit_incrementally(
+        self,
+        x_train: Union[DashAIDataset, np.ndarray, spmatrix],
+        y_train: DashAIDataset,
+        on_step: Callable[[int], None],
+    ) -> Type["SklearnLikeModel"]:
+        """Fit the estimator in stages, growing it with warm_start.
+
+        Parameters
+        ----------
+        x_train : Union[DashAIDataset, np.ndarray, spmatrix]
+            Dataset, array or sparse matrix with the input data.
+        y_train : DashAIDataset
+            Dataset with the output data.
+        on_step : Callable[[int], None]
+            Function called with the number of each finished stage.
+
+        Returns
+        -------
+        self
+            The fitted estimator object.
+        """
+        if self.INCREMENTAL_PARAMETER is None:
+            return super().fit_incrementally(x_train, y_train, on_step)
+
+        if isinstance(x_train, DashAIDataset):
+            x_train = x_train.to_pandas()
+        total_size = getattr(self, self.INCREMENTAL_PARAMETER)
+        warm_start = self.warm_start
+        stage_sizes = sorted(
+            {
+                max(1, round(total_size * stage / self.INCREMENTAL_STAGES))
+                for stage in range(1, self.INCREMENTAL_STAGES + 1)
+            }
+        )
+        self.warm_start = True
+        try:
+            for step, size in enumerate(stage_sizes):
+                setattr(self, self.INCREMENTAL_PARAMETER, size)
+                self.fit(x_train, y_train)
+                on_step(step)
+        finally:
+            setattr(self, self.INCREMENTAL_PARAMETER, total_size)
+            self.warm_start = warm_start
+        return self
 
-    def predict(self, x_pred: Union[DashAIDataset, pd.DataFrame]):
+    def predict(self, x_pred: Union[DashAIDataset, pd.DataFrame, np.ndarray, spmatrix]):
         """Make a prediction with the model.
 
         Parameters
         ----------
-        x_pred : Union[DashAIDataset, pd.DataFrame]
-            Dataset with the input data columns.
+        x_pred : Union[DashAIDataset, pd.DataFrame, np.ndarray, spmatrix]
+            Dataset, dataframe, array or sparse matrix with the input data columns.
 
         Returns
         -------
@@ -1,9 +1,27 @@
+import contextlib
+import copy
 import importlib
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import DefaultDict, Dict, List, Optional, Tuple
 
 import numpy as np
 import plotly
 import plotly.graph_objects as go
-from hyperopt import Trials, fmin, hp, rand, tpe  # noqa: F401
+from hyperopt import (
+    JOB_STATE_DONE,
+    STATUS_FAIL,
+    STATUS_OK,
+    Trials,
+    hp,
+    rand,  # noqa: F401
+    space_eval,
+    tpe,  # noqa: F401
+)
+from hyperopt.base import Domain
+from hyperopt.utils import coarse_utcnow
 
 from DashAI.back.core.schema_fields import (
     BaseSchema,
@@ -27,6 +45,20 @@ class HyperOptSchema(BaseSchema):
         description="Coefficient for 'rbf', 'poly' and 'sigmoid' kernels"
         ". Must be in string format and can be 'scale' or 'auto'.",
     )  # type: ignore
+    pruner: schema_field(
+        enum_field(enum=["MedianPruner", "None"]),
+        placeholder="None",
+        description="The parameter 'pruner' is the rule used to stop the trials "
+        "whose intermediate scores are worse than the median of the previous "
+        "trials. It must be 'MedianPruner' or 'None'.",
+    )  # type: ignore
+    n_jobs: schema_field(
+        int_field(gt=0),
+        placeholder=1,
+        description="The parameter 'n_jobs' is the number of trials evaluated "
+        "at the same time, each one in its own process. It must be of type "
+        "positive integer.",
+    )  # type: ignore
     metric: schema_field(
         enum_field(enum=["Accuracy", "F1", "Precision", "Recall"]),
         placeholder="Accuracy",
@@ -35,6 +67,88 @@ class HyperOptSchema(BaseSchema):
     )  # type: ignore
 
 
+class _TrialPrunedError(Exception):
+    """Raised to stop the training of a hopeless trial."""
+
+    def __init__(self, loss: float) -> None:
+        super().__init__(loss)
+        self.loss = loss
+
+
+class _MedianPruner:
+    """Median stopping rule, like the MedianPruner of Optuna.
+
+    A trial is stopped if its intermediate loss at a step is worse than the median
+    of the losses of the previous trials at the same step.
+    """
+
+    def __init__(self, n_startup_trials: int = 5) -> None:
+        self.n_startup_trials = n_startup_trials
+        self.n_trials = 0
+        self.losses: DefaultDict[int, List[float]] = defaultdict(list)
+
+    def should_prune(self, step: int, loss: float) -> bool:
+        if self.n_trials < self.n_startup_trials or not self.losses[step]:
+            return False
+        return loss > np.median(self.losses[step])
+
+    def add_trial(self, losses: Dict[int, float]) -> None:
+        for step, loss in losses.items():
+            self.losses[step].append(loss)
+        self.n_trials += 1
+
+
+def _set_hyperparameters(model, hyperparameters: dict, task: str) -> None:
+    # The hyperparameters of the text classifiers are the ones of their tabular
+    # classifier.
+    target = model.classifier if task == "TextClassificationTask" else model
+    for hyperparameter, value in hyperparameters.items():
+        setattr(target, hyperparameter, int(value))
+
+
+def _evaluate(
+    model,
+    hyperparameters: dict,
+    task: str,
+    metric,
+    input_dataset: dict,
+    output_dataset: dict,
+    pruner: Optional[_MedianPruner],
+) -> Tuple[float, Dict[int, float], bool]:
+    """Train a model with the given hyperparameters and compute its loss.
+
+    It is a module function so it can be run in the processes of a pool.
+
+    Returns
+    -------
+    Tuple[float, Dict[int, float], bool]
+        The validation loss of the trial, its intermediate losses by step,
+        which are empty if there is no pruner, and whether it was pruned.
+    """
+    _set_hyperparameters(model, hyperparameters, task)
+
+    def validation_loss():
+        y_pred = model.predict(input_dataset["validation"])
+        return -1 * metric.score(output_dataset["validation"], y_pred)
+
+    if pruner is None:
+        model.fit(input_dataset["train"], output_dataset["train"])
+        return validation_loss(), {}, False
+
+    losses = {}
+
+    def report(step):
+        losses[step] = validation_loss()
+        if pruner.should_prune(step, losses[step]):
+            raise _TrialPrunedError(losses[step])
+
+    try:
+        model.fit_incrementally(input_dataset["train"], output_dataset["train"], report)
+        return validation_loss(), losses, False
+    except _TrialPrunedError as pruned:
+        return pruned.loss, losses, True
+
+
 class HyperOptOptimizer(BaseOptimizer):
     SCHEMA = HyperOptSchema
 
@@ -44,8 +158,12 @@ class HyperOptOptimizer(BaseOptimizer):
         "TranslationTask",
     ]
 
-    def __init__(self, max_evals=None, sampler=None, metric=None):
+    def __init__(
+        self, max_evals=None, sampler=None, metric=None, pruner=None, n_jobs=1
+    ):
         self.max_evals = max_evals
+        self.n_jobs = n_jobs
+        self.pruner = _MedianPruner() if pruner == "MedianPruner" else None
         self.sampler = importlib.import_module(f"hyperopt.{sampler}").suggest
         self.metric = metric["class"]
 
@@ -88,55 +206,94 @@ class HyperOptOptimizer(BaseOptimizer):
         self.output_dataset = output_dataset
         self.parameters = parameters
         search_space = self.search_space(self.parameters)
+        # The trials are evaluated by _evaluate, the domain is only used by the
+        # sampler to suggest the hyperparameters.
+        domain = Domain(lambda params: None, search_space)
+        trials = Trials()
+        seed = os.environ.get("HYPEROPT_FMIN_SEED")
+        rstate = np.random.default_rng(int(seed) if seed else None)
 
-        if task == "TextClassificationTask":
-
-            def objective(params):
-                model_eval = self.model
-                for key, value in params.items():
-                    setattr(model_eval, key, value)
-                model_eval.fit(
-                    self.input_dataset["train"], self.output_dataset["train"]
-                )
-                y_pred = model_eval.predict(input_dataset["validation"])
-                score = -1 * self.metric.score(output_dataset["validation"], y_pred)
-                return score
-
-        else:
-
-            def objective(params):
-                model_eval = self.model
-                for key, value in params.items():
-                    int_value = int(value)
-                    setattr(model_eval, key, int_value)
-                model_eval.fit(
-                    self.input_dataset["train"], self.output_dataset["train"]
+        with self._executor() as executor:
+            while len(trials.trials) < self.max_evals:
+                batch_size = min(self.n_jobs, self.max_evals - len(trials.trials))
+                # tpe suggests a single point per call, so the sampler is called
+                # once for each trial of the batch.
+                new_trials = []
+                for new_id in trials.new_trial_ids(batch_size):
+                    new_trials.extend(
+                        self.sampler(
+                            [new_id], domain, trials, rstate.integers(2**31 - 1)
+                        )
+                    )
+                batch_params = [
+                    space_eval(
+                        search_space,
+                        {name: vals[0] for name, vals in trial["misc"]["vals"].items()},
+                    )
+                    for trial in new_trials
+                ]
+                arguments = (
+                    task,
+                    self.metric,
+                    self.input_dataset,
+                    self.output_dataset,
+                    self.pruner,
                 )
-                y_pred = model_eval.predict(input_dataset["validation"])
-                score = -1 * self.metric.score(output_dataset["validation"], y_pred)
-                return score
+                if executor is None:
+                    results = [
+                        _evaluate(copy.deepcopy(self.model), params, *arguments)
+                        for params in batch_params
+                    ]
+                else:
+                    # Each worker unpickles its own copy of the model.
+                    futures = [
+                        executor.submit(_evaluate, self.model, params, *arguments)
+                        for params in batch_params
+                    ]
+                    results = [future.result() for future in futures]
 
-        trials = Trials()
-        best_params = fmin(
-            fn=objective,
-            space=search_space,
-            algo=self.sampler,
-            max_evals=self.max_evals,
-        )
-        self.trials = trials
-        best_model = self.model
-        for hyperparameter, value in best_params.items():
-            setattr(best_model, hyperparameter, value.astype(int))
+                now = coarse_utcnow()
+                for trial, (loss, losses, pruned) in zip(new_trials, results):
+                    trial["state"] = JOB_STATE_DONE
+                    # The loss of a pruned trial comes from an unfinished
+                    # training, so it is kept out of the "loss" key that tpe
+                    # learns from, and argmin skips the failed trials.
+                    trial["result"] = (
+                        {"status": STATUS_FAIL, "pruned_loss": loss}
+                        if pruned
+                        else {"loss": loss, "status": STATUS_OK}
+                    )
+                    trial["book_time"] = trial["refresh_time"] = now
+                    if self.pruner is not None:
+                        self.pruner.add_trial(losses)
+                trials.insert_trial_docs(new_trials)
+                trials.refresh()
 
+        self.trials = trials
+        best_model = copy.deepcopy(self.model)
+        _set_hyperparameters(best_model, trials.argmin, task)
         best_model.fit(self.input_dataset["train"], self.output_dataset["train"])
         self.model = best_model
 
+    def _executor(self):
+        """Pool that evaluates the trials of a batch, None to evaluate them here."""
+        if self.n_jobs == 1:
+            return contextlib.nullcontext()
+        # spawn avoids forking the threads of the job executor.
+        return ProcessPoolExecutor(
+            max_workers=self.n_jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
     def get_model(self):
         return self.model
 
     def get_metrics(self):
         x = list(range(len(self.trials.trials)))
-        y = [self.trials["result"]["loss"] for trial in self.trials.trials]
+        y = [
+            trial["result"].get("loss", trial["result"].get("pruned_loss"))
+            for trial in self.trials.trials
+        ]
         return x, y
 
     def create_plot(self, x, y):
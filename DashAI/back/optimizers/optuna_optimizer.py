@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 import optuna
 import plotly
@@ -31,6 +33,12 @@ class OptunaSchema(BaseSchema):
         description="Coefficient for 'rbf', 'poly' and 'sigmoid' kernels"
         ". Must be in string format and can be 'scale' or 'auto'.",
     )  # type: ignore
+    n_jobs: schema_field(
+        int_field(ge=1),
+        placeholder=1,
+        description="The parameter 'n_jobs' is the quantity of trials run in "
+        "parallel, each one in its own thread. It must be of type positive integer.",
+    )  # type: ignore
     metric: schema_field(
         enum_field(enum=["Accuracy", "F1", "Precision", "Recall"]),
         placeholder="Accuracy",
@@ -48,10 +56,13 @@ class OptunaOptimizer(BaseOptimizer):
         "TranslationTask",
     ]
 
-    def __init__(self, n_trials=None, sampler=None, pruner=None, metric=None):
+    def __init__(self, n_trials=None, sampler=None, pruner=None, metric=None, n_jobs=1):
         self.n_trials = n_trials
+        self.n_jobs = n_jobs
         self.sampler = getattr(optuna.samplers, sampler)
-        self.pruner = pruner
+        self.pruner = (
+            getattr(optuna.pruners, pruner)() if pruner not in (None, "None") else None
+        )
         self.metric = metric
 
     def optimize(self, model, input_dataset, output_dataset, parameters, task):
@@ -84,46 +95,55 @@ class OptunaOptimizer(BaseOptimizer):
 
         self.metric = self.metric["class"]
 
-        if task == "TextClassificationTask":
-
-            def objective(trial):
-                classifier_trial = self.model.classifier
-                for hyperparameter, values in self.parameters.items():
-                    value = trial.suggest_int(hyperparameter, values[0], values[-1])
-                    setattr(classifier_trial, hyperparameter, value)
-
-                model_trial = self.model
-                model_trial.classifier = classifier_trial
-                model_trial.fit(
-                    self.input_dataset["train"], self.output_dataset["train"]
-                )
-                y_pred = model_trial.predict(input_dataset["validation"])
-                score = self.metric.score(output_dataset["validation"], y_pred)
-
-                return score
+        def set_hyperparameters(model_trial, hyperparameters):
+            # The hyperparameters of the text classifiers are the ones of their
+            # tabular classifier.
+            target = (
+                model_trial.classifier
+                if task == "TextClassificationTask"
+                else model_trial
+            )
+            for hyperparameter, value in hyperparameters.items():
+                setattr(target, hyperparameter, value)
+
+        def objective(trial):
+            # Each trial trains its own copy, so the trials can run in parallel.
+            model_trial = copy.deepcopy(self.model)
+            set_hyperparameters(
+                model_trial,
+                {
+                    hyperparameter: trial.suggest_int(
+                        hyperparameter, values[0], values[-1]
+                    )
+                    for hyperparameter, values in self.parameters.items()
+                },
+            )
 
-        else:
+            def validation_score():
+                y_pred = model_trial.predict(self.input_dataset["validation"])
+                return self.metric.score(self.output_dataset["validation"], y_pred)
 
-            def objective(trial):
-                model_trial = self.model
-                for hyperparameter, values in self.parameters.items():
-                    value = trial.suggest_int(hyperparameter, values[0], values[-1])
-                    setattr(model_trial, hyperparameter, value)
+            def report(step):
+                trial.report(validation_score(), step)
+                if trial.should_prune():
+                    raise optuna.TrialPruned
 
+            if self.pruner is None:
                 model_trial.fit(
                     self.input_dataset["train"], self.output_dataset["train"]
                 )
-                y_pred = model_trial.predict(input_dataset["validation"])
-                score = self.metric.score(output_dataset["validation"], y_pred)
-
-                return score
+            else:
+                # The model reports its intermediate scores, so the pruner can
+                # stop the hopeless trials before their training finishes.
+                model_trial.fit_incrementally(
+                    self.input_dataset["train"], self.output_dataset["train"], report
+                )
+            return validation_score()
 
-        study.optimize(objective, n_trials=self.n_trials)
+        study.optimize(objective, n_trials=self.n_trials, n_jobs=self.n_jobs)
 
-        best_params = study.best_params
-        best_model = self.model
-        for hyperparameter, value in best_params.items():
-            setattr(best_model, hyperparameter, value)
+        best_model = copy.deepcopy(self.model)
+        set_hyperparameters(best_model, study.best_params)
         best_model.fit(self.input_dataset["train"], self.output_dataset["train"])
         self.model = best_model
         self.study = study
@@ -132,8 +152,9 @@ class OptunaOptimizer(BaseOptimizer):
         return self.model
 
     def get_metrics(self):
-        x = [trial.number for trial in self.study.trials]
-        y = [trial.value for trial in self.study.trials]
+        trials = self.study.get_trials(states=[optuna.trial.TrialState.COMPLETE])
+        x = [trial.number for trial in trials]
+        y = [trial.value for trial in trials]
         return x, y
 
     def create_plot(self, x, y):
@@ -105,6 +105,29 @@ def test_get_types(client: TestClient):
     }
 
 
+def test_get_info(client: TestClient):
+    response = client.get("/api/v1/dataset/2/info")
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["total_rows"] == 150
+    assert data["total_columns"] == 5
+    assert data["train_size"] + data["test_size"] + data["val_size"] == 150
+
+
+def test_get_sample(client: TestClient):
+    response = client.get("/api/v1/dataset/2/sample")
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert list(data.keys()) == [
+        "SepalLengthCm",
+        "SepalWidthCm",
+        "PetalLengthCm",
+        "PetalWidthCm",
+        "Species",
+    ]
+    assert all(len(values) == 10 for values in data.values())
+
+
 def test_modify_dataset_name(client: TestClient):
     response = client.patch(
         "/api/v1/dataset/2",
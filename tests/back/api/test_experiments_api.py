@@ -1,6 +1,7 @@
 import json
 import os
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
@@ -162,11 +163,27 @@ def test_update_experiment_step(client: TestClient):
     assert response.status_code == 304
 
 
-def test_delete_experiment(client: TestClient):
+def test_experiment_splits_are_saved(client: TestClient, dataset_id: int):
+    """Test that the rows of each split of an experiment are saved."""
+    file_path = client.get(f"/api/v1/dataset/{dataset_id}").json()["file_path"]
+    splits_path = os.path.join(file_path, "splits", "experiment_1")
+
+    indexes = {
+        split: np.load(os.path.join(splits_path, f"{split}.npy"))
+        for split in ["train", "test", "validation"]
+    }
+
+    assert [len(indexes[split]) for split in indexes] == [75, 30, 45]
+    assert len(np.unique(np.concatenate(list(indexes.values())))) == 150
+
+
+def test_delete_experiment(client: TestClient, dataset_id: int):
     """Test that an experiment can be deleted."""
+    file_path = client.get(f"/api/v1/dataset/{dataset_id}").json()["file_path"]
 
     response = client.delete("/api/v1/experiment/1")
     assert response.status_code == 204, response.text
+    assert not os.path.exists(os.path.join(file_path, "splits", "experiment_1"))
 
     response = client.delete("/api/v1/experiment/2")
     assert response.status_code == 204, response.text
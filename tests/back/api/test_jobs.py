@@ -24,6 +24,7 @@ class DummyTask(BaseTask):
 
 class DummyModel(BaseModel):
     COMPATIBLE_COMPONENTS = ["DummyTask"]
+    predicted_splits = 0
 
     def save(self, filename):
         joblib.dump(self, filename)
@@ -32,6 +33,7 @@ class DummyModel(BaseModel):
         return
 
     def predict(self, x):
+        DummyModel.predicted_splits += 1
         return {}
 
     def fit(self, x, y):
@@ -62,6 +64,14 @@ class DummyMetric(BaseMetric):
         return 1
 
 
+class OtherDummyMetric(BaseMetric):
+    COMPATIBLE_COMPONENTS = ["DummyTask"]
+
+    @staticmethod
+    def score(true_labels: list, probs_pred_labels: list):
+        return 0
+
+
 @pytest.fixture(autouse=True, name="test_registry")
 def setup_test_registry(client, monkeypatch: pytest.MonkeyPatch):
     """Setup a test registry with test task, dataloader and model components."""
@@ -73,6 +83,7 @@ def setup_test_registry(client, monkeypatch: pytest.MonkeyPatch):
             DummyModel,
             FailDummyModel,
             DummyMetric,
+            OtherDummyMetric,
             CSVDataLoader,
             ModelJob,
             OptunaOptimizer,
@@ -308,8 +319,11 @@ def test_execute_jobs(client: TestClient, run_id: int, failed_run_id: int):
         assert run["start_time"] is None
         assert run["end_time"] is None
 
+    DummyModel.predicted_splits = 0
     response = client.post("/api/v1/job/start/?stop_when_queue_empties=True")
     assert response.status_code == 202, response.text
+    # Each split is predicted once, whatever the number of metrics.
+    assert DummyModel.predicted_splits == 3
 
     response = client.get(f"/api/v1/run/{run_id}")
     data = response.json()
@@ -322,6 +336,7 @@ def test_execute_jobs(client: TestClient, run_id: int, failed_run_id: int):
     assert data["train_metrics"] == data["test_metrics"]
     assert data["run_path"] is not None
     assert os.path.exists(data["run_path"])
+    assert os.path.exists(data["artifacts"]["predictions_path"])
     assert data["status"] == 3
     assert data["delivery_time"] is not None
     assert data["start_time"] is not None
@@ -3,6 +3,8 @@ import os
 
 import joblib
 import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from fastapi.testclient import TestClient
 
@@ -11,6 +13,7 @@ from DashAI.back.dataloaders.classes.json_dataloader import JSONDataLoader
 from DashAI.back.dependencies.database.models import Experiment, Run
 from DashAI.back.dependencies.registry.component_registry import ComponentRegistry
 from DashAI.back.job.model_job import ModelJob
+from DashAI.back.job.prediction_job import PredictionJob
 from DashAI.back.metrics.base_metric import BaseMetric
 from DashAI.back.models.base_model import BaseModel
 from DashAI.back.optimizers import OptunaOptimizer
@@ -61,6 +64,7 @@ def setup_test_registry(client, monkeypatch: pytest.MonkeyPatch):
             DummyMetric,
             JSONDataLoader,
             ModelJob,
+            PredictionJob,
             OptunaOptimizer,
         ]
     )
@@ -212,6 +216,206 @@ def test_make_prediction(
         assert len(data) == len(json.load(json_file)["data"])
 
 
+def test_repeated_predictions_reuse_the_loaded_model(
+    client: TestClient,
+    trained_run_id: int,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    loaded = []
+    load = DummyModel.load
+    monkeypatch.setattr(
+        DummyModel, "load", lambda filename: loaded.append(filename) or load(filename)
+    )
+    script_dir = os.path.dirname(__file__)
+    abs_file_path = os.path.join(script_dir, "input_iris.json")
+
+    for _ in range(3):
+        with open(abs_file_path, "rb") as json_file:
+            response = client.post(
+                "/api/v1/predict/",
+                params={"run_id": trained_run_id},
+                files={"input_file": ("filename", json_file, "text/json")},
+            )
+        assert response.status_code == 200, response.text
+
+    assert len(loaded) == 1
+
+
+def test_predict_rows(client: TestClient, trained_run_id: int):
+    script_dir = os.path.dirname(__file__)
+    abs_file_path = os.path.join(script_dir, "input_iris.json")
+    with open(abs_file_path, "rb") as json_file:
+        rows = json.load(json_file)["data"]
+    with open(abs_file_path, "rb") as json_file:
+        file_response = client.post(
+            "/api/v1/predict/",
+            params={"run_id": trained_run_id},
+            files={"input_file": ("filename", json_file, "text/json")},
+        )
+
+    response = client.post(
+        "/api/v1/predict/rows/", json={"run_id": trained_run_id, "data": rows}
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json() == file_response.json()
+    assert not os.listdir(
+        client.app.container["config"]["DATASETS_PATH"] / "tmp_predict"
+    )
+
+
+def test_predict_rows_errors(client: TestClient, trained_run_id: int):
+    response = client.post(
+        "/api/v1/predict/rows/", json={"run_id": 31415, "data": [{"feature_0": 1}]}
+    )
+    assert response.status_code == 404, response.text
+
+    response = client.post(
+        "/api/v1/predict/rows/", json={"run_id": trained_run_id, "data": []}
+    )
+    assert response.status_code == 422, response.text
+
+    row = {"feature_0": 4.9, "feature_1": 3.0, "feature_2": 1.4, "feature_3": 0.2}
+    response = client.post(
+        "/api/v1/predict/rows/",
+        json={"run_id": trained_run_id, "data": [row, {"feature_0": 5.7}]},
+    )
+    assert response.status_code == 422, response.text
+    assert "Row 1" in response.json()["detail"]
+
+    response = client.post(
+        "/api/v1/predict/rows/",
+        json={"run_id": trained_run_id, "data": [row, {**row, "feature_0": "a"}]},
+    )
+    assert response.status_code == 422, response.text
+
+
+def _run_bulk_prediction(client, run_id, filename, content, output_format):
+    response = client.post(
+        "/api/v1/predict/bulk/",
+        params={"run_id": run_id, "output_format": output_format},
+        files={"input_file": (filename, content)},
+    )
+    assert response.status_code == 201, response.text
+    prediction_id = response.json()["id"]
+
+    response = client.post(
+        "/api/v1/job/",
+        json={"job_type": "PredictionJob", "kwargs": {"prediction_id": prediction_id}},
+    )
+    assert response.status_code == 201, response.text
+    response = client.post("/api/v1/job/start/?stop_when_queue_empties=True")
+    assert response.status_code == 202, response.text
+
+    response = client.get(f"/api/v1/predict/bulk/{prediction_id}")
+    assert response.status_code == 200, response.text
+    return prediction_id, response.json()
+
+
+@pytest.fixture(name="input_rows")
+def fixture_input_rows():
+    script_dir = os.path.dirname(__file__)
+    with open(os.path.join(script_dir, "input_iris.json"), "rb") as json_file:
+        return pd.DataFrame(json.load(json_file)["data"])
+
+
+def test_bulk_prediction_from_parquet_to_csv(
+    client: TestClient,
+    trained_run_id: int,
+    input_rows: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    monkeypatch.setattr(PredictionJob, "BATCH_SIZE", 2)
+    input_rows.to_parquet(tmp_path / "input.parquet")
+    with open(tmp_path / "input.parquet", "rb") as file:
+        prediction_id, prediction = _run_bulk_prediction(
+            client, trained_run_id, "input.parquet", file, "csv"
+        )
+
+    assert prediction["status"] == 3
+    assert prediction["processed_rows"] == prediction["total_rows"] == len(input_rows)
+    response = client.get(f"/api/v1/predict/bulk/{prediction_id}/file")
+    assert response.status_code == 200, response.text
+    lines = response.text.splitlines()
+    assert lines[0] == '"prediction"'
+    assert len(lines) == len(input_rows) + 1
+
+
+def test_bulk_prediction_from_csv_to_parquet(
+    client: TestClient,
+    trained_run_id: int,
+    input_rows: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    monkeypatch.setattr(PredictionJob, "CSV_BLOCK_SIZE", 64)
+    # The columns are reordered and an extra one is added, only the input columns
+    # of the experiment are used.
+    input_rows = input_rows[input_rows.columns[::-1]].assign(extra=1)
+    prediction_id, prediction = _run_bulk_prediction(
+        client,
+        trained_run_id,
+        "input.csv",
+        input_rows.to_csv(index=False).encode(),
+        "parquet",
+    )
+
+    assert prediction["status"] == 3
+    assert prediction["processed_rows"] == prediction["total_rows"] == len(input_rows)
+    response = client.get(f"/api/v1/predict/bulk/{prediction_id}/file")
+    assert response.status_code == 200, response.text
+    (tmp_path / "predictions.parquet").write_bytes(response.content)
+    predictions = pq.read_table(tmp_path / "predictions.parquet")
+    assert predictions.column_names == ["prediction"]
+    assert predictions.num_rows == len(input_rows)
+
+
+def test_bulk_prediction_csv_uses_the_dataset_types(
+    client: TestClient,
+    trained_run_id: int,
+    input_rows: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(PredictionJob, "CSV_BLOCK_SIZE", 64)
+    # The first block only has integers, the float values come in later blocks.
+    integer_rows = input_rows.round().astype(int).to_csv(index=False)
+    float_rows = input_rows.to_csv(index=False, header=False)
+    prediction_id, prediction = _run_bulk_prediction(
+        client,
+        trained_run_id,
+        "input.csv",
+        (integer_rows + float_rows).encode(),
+        "csv",
+    )
+
+    assert prediction["status"] == 3
+    assert prediction["processed_rows"] == 2 * len(input_rows)
+
+
+def test_bulk_prediction_errors(client: TestClient, trained_run_id: int):
+    response = client.post(
+        "/api/v1/predict/bulk/",
+        params={"run_id": trained_run_id},
+        files={"input_file": ("input.txt", b"")},
+    )
+    assert response.status_code == 400, response.text
+
+    response = client.post(
+        "/api/v1/predict/bulk/",
+        params={"run_id": 31415},
+        files={"input_file": ("input.csv", b"")},
+    )
+    assert response.status_code == 404, response.text
+
+    prediction_id, prediction = _run_bulk_prediction(
+        client, trained_run_id, "input.csv", b"feature_0\n1\n", "csv"
+    )
+    assert prediction["status"] == 4
+    response = client.get(f"/api/v1/predict/bulk/{prediction_id}/file")
+    assert response.status_code == 404, response.text
+
+
 def test_delete_prediction(client: TestClient):
     response = client.delete("/api/v1/predict/")
     assert response.status_code == 501, response.text
@@ -7,6 +7,7 @@ import shutil
 from typing import List
 
 import datasets
+import numpy as np
 import pytest
 from datasets import DatasetDict
 from pyarrow.lib import ArrowInvalid
@@ -14,11 +15,18 @@ from sklearn.datasets import load_iris
 from starlette.datastructures import UploadFile
 
 from DashAI.back.api.api_v1.schemas.datasets_params import ColumnSpecItemParams
+from DashAI.back.dataloaders.classes import dashai_dataset
 from DashAI.back.dataloaders.classes.csv_dataloader import CSVDataLoader
 from DashAI.back.dataloaders.classes.dashai_dataset import (
     DashAIDataset,
+    get_class_label,
     get_column_names_from_indexes,
+    get_columns_spec,
+    get_dataset_info,
+    get_dataset_manifest,
+    invalidate_dataset_cache,
     load_dataset,
+    load_experiment_splits,
     save_dataset,
     select_columns,
     split_dataset,
@@ -28,6 +36,7 @@ from DashAI.back.dataloaders.classes.dashai_dataset import (
     update_dataset_splits,
     validate_inputs_outputs,
 )
+from DashAI.back.tasks.tabular_classification_task import TabularClassificationTask
 from tests.back.test_datasets_generator import CSVTestDatasetGenerator
 
 
@@ -238,6 +247,23 @@ def test_change_columns_type_errors(
             dashai_datasetdict[split].change_columns_type(col_types)
 
 
+def test_change_columns_type_sorts_the_class_names():
+    dataset = DashAIDataset(
+        datasets.Dataset.from_dict({"label": ["b", "c", "a", "b"]}).data
+    )
+    view = dataset.select([0, 1, 3], keep_in_memory=True)
+    view = DashAIDataset(view.data, indices_table=view._indices)
+
+    new_dataset = dataset.change_columns_type({"label": "Categorical"})
+    new_view = view.change_columns_type({"label": "Categorical"})
+
+    assert new_dataset.features["label"].names == ["a", "b", "c"]
+    assert new_dataset["label"] == [1, 2, 0, 1]
+    assert new_view.features["label"].names == ["b", "c"]
+    assert new_view["label"] == [0, 1, 0]
+    assert get_class_label(dataset, "label") is get_class_label(dataset, "label")
+
+
 def test_dashai_datasetdict_change_columns_type_target_col_as_cat(
     dashai_datasetdict: DatasetDict,
 ):
@@ -323,6 +349,25 @@ def test_split_dataset(
     assert totals_rows == train_rows + test_rows + validation_rows
 
 
+def test_split_dataset_keeps_the_rows_of_each_split(dashai_datasetdict: list):
+    initial_dataset = dashai_datasetdict["train"]
+    column = initial_dataset.column_names[0]
+    values = initial_dataset[column]
+
+    split_datasetdict = split_dataset(
+        initial_dataset,
+        train_indexes=np.array([7, 2, 5, 2], dtype=np.int64),
+        test_indexes=list(range(10, 20)),
+        val_indexes=[],
+    )
+
+    # The rows keep the order of the dataset, as a repeated index is ignored.
+    assert split_datasetdict["train"][column] == [values[i] for i in [2, 5, 7]]
+    assert split_datasetdict["test"][column] == values[10:20]
+    assert split_datasetdict["validation"].num_rows == 0
+    assert isinstance(split_datasetdict["train"], DashAIDataset)
+
+
 # ----------------------------------------------------------------------------
 # fixture: split dashai datasetdict
 
@@ -521,6 +566,92 @@ def test_save_to_disk_and_load(
     assert initial_num_rows == loaded_num_rows
 
 
+def test_save_dataset_writes_the_manifest(
+    split_dashai_datasetdict: DatasetDict, test_path: pathlib.Path
+):
+    dataset_path = str(test_path / "dataloaders/dashaidataset/manifest_test")
+    save_dataset(split_dashai_datasetdict, dataset_path)
+
+    manifest = get_dataset_manifest(dataset_path)
+
+    assert manifest["splits"] == {
+        split: {"num_rows": dataset.num_rows}
+        for split, dataset in split_dashai_datasetdict.items()
+    }
+    assert manifest["sample"] == split_dashai_datasetdict["train"][:10]
+    assert manifest["statistics"]["target"] == {
+        "null_count": 0,
+        "min": 0,
+        "max": 2,
+        "mean": 1.0,
+    }
+    assert get_dataset_info(dataset_path) == {
+        "total_rows": 150,
+        "total_columns": 5,
+        "train_size": split_dashai_datasetdict["train"].num_rows,
+        "test_size": split_dashai_datasetdict["test"].num_rows,
+        "val_size": split_dashai_datasetdict["validation"].num_rows,
+    }
+    assert get_columns_spec(dataset_path)["target"] == {
+        "type": "Value",
+        "dtype": "int64",
+    }
+
+
+def test_manifest_is_written_again_when_invalidated(
+    split_dashai_datasetdict: DatasetDict, test_path: pathlib.Path
+):
+    dataset_path = str(test_path / "dataloaders/dashaidataset/invalidate_test")
+    save_dataset(split_dashai_datasetdict, dataset_path)
+    manifest = get_dataset_manifest(dataset_path)
+
+    update_columns_spec(
+        dataset_path,
+        columns={"target": ColumnSpecItemParams(type="Value", dtype="float64")},
+    )
+
+    assert not (pathlib.Path(dataset_path) / "manifest.json").exists()
+    assert get_dataset_manifest(dataset_path) == manifest
+    assert (pathlib.Path(dataset_path) / "manifest.json").exists()
+
+
+def test_load_dataset_reuses_the_opened_dataset(
+    split_dashai_datasetdict: DatasetDict,
+    test_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    dataset_path = str(test_path / "dataloaders/dashaidataset/cache_test")
+    save_dataset(split_dashai_datasetdict, dataset_path)
+    loaded_paths = []
+
+    def _load_from_disk(dataset_path):
+        loaded_paths.append(dataset_path)
+        return datasets.load_from_disk(dataset_path)
+
+    monkeypatch.setattr(dashai_dataset, "load_from_disk", _load_from_disk)
+
+    first = load_dataset(dataset_path)
+    second = load_dataset(dataset_path)
+
+    assert len(loaded_paths) == 1
+    assert first["train"] is not second["train"]
+    # Both share the memory map of the data.
+    first_buffers = first["train"].data.column(0).chunk(0).buffers()
+    second_buffers = second["train"].data.column(0).chunk(0).buffers()
+    assert first_buffers[1].address == second_buffers[1].address
+    first["train"] = first["train"].remove_columns("target")
+    assert "target" in second["train"].column_names
+
+    # The dataset is loaded again once it is saved again.
+    save_dataset(split_dashai_datasetdict, dataset_path)
+    load_dataset(dataset_path)
+    assert len(loaded_paths) == 2
+
+    invalidate_dataset_cache(dataset_path)
+    load_dataset(dataset_path)
+    assert len(loaded_paths) == 3
+
+
 @pytest.fixture(name="split_dashai_datasetdict_two_class_cols")
 def split_dashai_datasetdict_two_class_cols(test_datasetdict):
     """A split DashAIDataset with two target columns."""
@@ -725,3 +856,101 @@ def test_update_splits_by_specific_rows(split_dashai_datasetdict):
     assert len(new_dataset["train"]) == 100
     assert len(new_dataset["test"]) == 30
     assert len(new_dataset["validation"]) == 20
+
+
+def test_load_experiment_splits(split_dashai_datasetdict, tmp_path):
+    splits_path = str(tmp_path / "splits")
+    splits = {
+        "train": [5, 1, 3],
+        "test": list(range(100, 130)),
+        "validation": [149],
+        "is_random": False,
+        "has_changed": True,
+    }
+
+    new_dataset = load_experiment_splits(split_dashai_datasetdict, splits, splits_path)
+
+    assert isinstance(new_dataset["train"], DashAIDataset)
+    assert [len(new_dataset[split]) for split in new_dataset] == [3, 30, 1]
+    assert np.load(f"{splits_path}/train.npy").tolist() == [1, 3, 5]
+
+    # The saved indexes are used even if the configuration is not the same.
+    splits["train"] = [0]
+    new_dataset = load_experiment_splits(split_dashai_datasetdict, splits, splits_path)
+    assert len(new_dataset["train"]) == 3
+
+
+def test_load_experiment_splits_keeps_the_dataset_splits(
+    split_dashai_datasetdict, tmp_path
+):
+    splits_path = str(tmp_path / "splits")
+    splits = {"is_random": True, "has_changed": False}
+
+    new_dataset = load_experiment_splits(split_dashai_datasetdict, splits, splits_path)
+
+    assert new_dataset is split_dashai_datasetdict
+    assert not (tmp_path / "splits").exists()
+
+
+@pytest.fixture(name="text_label_datasetdict")
+def text_label_datasetdict() -> DatasetDict:
+    dataset = DashAIDataset(
+        datasets.Dataset.from_dict(
+            {
+                "x": np.arange(20, dtype=float),
+                "label": [["b", "a", "c"][i % 3] for i in range(20)],
+            }
+        ).data
+    )
+    return split_dataset(
+        dataset,
+        train_indexes=list(range(10)),
+        test_indexes=list(range(10, 15)),
+        val_indexes=list(range(15, 20)),
+    )
+
+
+def test_prepare_experiment_splits_with_text_labels(text_label_datasetdict, tmp_path):
+    splits = {
+        "train": [3, 0, 2, 1],
+        "test": [12, 17],
+        "validation": [5, 14],
+        "is_random": False,
+        "has_changed": True,
+    }
+    new_dataset = load_experiment_splits(
+        text_label_datasetdict, splits, str(tmp_path / "splits")
+    )
+
+    prepared = TabularClassificationTask().prepare_for_task(new_dataset, ["label"])
+
+    assert prepared["train"].features["label"].names == ["a", "b", "c"]
+    assert prepared["train"]["x"] == [0.0, 1.0, 2.0, 3.0]
+    assert prepared["train"]["label"] == [1, 0, 2, 1]
+
+
+def test_experiment_splits_are_selected_after_prepared(
+    text_label_datasetdict, tmp_path
+):
+    splits = {
+        "train": 0.6,
+        "test": 0.2,
+        "validation": 0.2,
+        "is_random": True,
+        "has_changed": True,
+    }
+    new_dataset = load_experiment_splits(
+        text_label_datasetdict, splits, str(tmp_path / "splits")
+    )
+    # The views share the table of the dataset, which is not concatenated with
+    # itself for each split.
+    assert len(new_dataset["train"].data) == 20
+
+    prepared = TabularClassificationTask().prepare_for_task(new_dataset, ["label"])
+    x, y = select_columns(prepared, ["x"], ["label"])
+
+    for split in ["train", "test", "validation"]:
+        names = y[split].features["label"].names
+        labels = [["b", "a", "c"][int(row) % 3] for row in x[split]["x"]]
+        assert [names[label] for label in y[split]["label"]] == labels
+        assert x[split]["x"] == new_dataset[split]["x"]
@@ -0,0 +1,189 @@
+import asyncio
+import threading
+
+import pytest
+
+from DashAI.back.dependencies.job_executors import BaseJobExecutor, ThreadJobExecutor
+from DashAI.back.dependencies.job_queues import BaseJobQueue, SimpleJobQueue
+from DashAI.back.dependencies.job_queues.job_queue import job_queue_loop
+from DashAI.back.job.base_job import BaseJob, JobError
+
+
+class BarrierJob(BaseJob):
+    """Job that only finishes when all the jobs of its barrier are running."""
+
+    def run(self) -> None:
+        self.kwargs["barrier"].wait()
+        self.kwargs["finished"].append(self.id)
+
+    def set_status_as_delivered(self) -> None:
+        return None
+
+    def set_status_as_error(self) -> None:
+        return None
+
+
+class FailJob(BaseJob):
+    def run(self) -> None:
+        raise JobError("Always fails")
+
+    def set_status_as_delivered(self) -> None:
+        return None
+
+    def set_status_as_error(self) -> None:
+        return None
+
+
+class CrashJob(BaseJob):
+    """Job that fails with an unexpected error."""
+
+    def run(self) -> None:
+        raise RuntimeError("Unexpected failure")
+
+    def set_status_as_delivered(self) -> None:
+        return None
+
+    def set_status_as_error(self) -> None:
+        self.kwargs["failed"].append(self.id)
+
+
+class InFlightJobExecutor(ThreadJobExecutor):
+    """Executor that records the most jobs submitted at the same time."""
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers=max_workers)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def submit(self, job: BaseJob) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await super().submit(job)
+        finally:
+            self.in_flight -= 1
+
+
+class AfterRunJob(BaseJob):
+    """Job that records the threads of its run and after_run calls."""
+
+    def run(self) -> None:
+        self.kwargs["threads"].append(("run", threading.current_thread()))
+
+    def after_run(self) -> None:
+        self.kwargs["threads"].append(("after_run", threading.current_thread()))
+
+    def set_status_as_delivered(self) -> None:
+        return None
+
+    def set_status_as_error(self) -> None:
+        return None
+
+
+@pytest.fixture(name="job_queue")
+def fixture_job_queue() -> BaseJobQueue:
+    queue = SimpleJobQueue()
+    yield queue
+    while not queue.is_empty():
+        queue.get()
+
+
+def _run_loop(job_queue: BaseJobQueue, job_executor: BaseJobExecutor) -> None:
+    asyncio.run(
+        job_queue_loop(
+            stop_when_queue_empties=True,
+            job_queue=job_queue,
+            job_executor=job_executor,
+        )
+    )
+    job_executor.shutdown()
+
+
+def test_executor_invalid_workers():
+    with pytest.raises(ValueError, match="max_workers"):
+        ThreadJobExecutor(max_workers=0)
+
+
+def test_loop_runs_jobs_in_worker_threads(job_queue: BaseJobQueue):
+    finished = []
+    barrier = threading.Barrier(1, timeout=5)
+    job_1_id = job_queue.put(BarrierJob(barrier=barrier, finished=finished))
+    job_2_id = job_queue.put(BarrierJob(barrier=barrier, finished=finished))
+
+    _run_loop(job_queue, ThreadJobExecutor(max_workers=1))
+
+    assert finished == [job_1_id, job_2_id]
+    assert job_queue.is_empty()
+
+
+def test_loop_runs_jobs_concurrently(job_queue: BaseJobQueue):
+    finished = []
+    # The barrier breaks (raising an error) unless both jobs run at the same time.
+    barrier = threading.Barrier(2, timeout=5)
+    job_queue.put(BarrierJob(barrier=barrier, finished=finished))
+    job_queue.put(BarrierJob(barrier=barrier, finished=finished))
+
+    _run_loop(job_queue, ThreadJobExecutor(max_workers=2))
+
+    assert len(finished) == 2
+    assert job_queue.is_empty()
+
+
+def test_loop_continues_after_failed_job(job_queue: BaseJobQueue):
+    finished = []
+    barrier = threading.Barrier(1, timeout=5)
+    job_queue.put(FailJob())
+    job_id = job_queue.put(BarrierJob(barrier=barrier, finished=finished))
+
+    _run_loop(job_queue, ThreadJobExecutor(max_workers=1))
+
+    assert finished == [job_id]
+
+
+def test_loop_marks_unexpected_failures_as_errors(job_queue: BaseJobQueue):
+    failed, finished = [], []
+    barrier = threading.Barrier(1, timeout=5)
+    crash_job_id = job_queue.put(CrashJob(failed=failed))
+    job_id = job_queue.put(BarrierJob(barrier=barrier, finished=finished))
+
+    _run_loop(job_queue, ThreadJobExecutor(max_workers=1))
+
+    assert failed == [crash_job_id]
+    assert finished == [job_id]
+
+
+def test_loop_calls_after_run_in_the_loop_thread(job_queue: BaseJobQueue):
+    threads = []
+    job_queue.put(AfterRunJob(threads=threads))
+
+    _run_loop(job_queue, ThreadJobExecutor(max_workers=1))
+
+    assert [step for step, _ in threads] == ["run", "after_run"]
+    assert threads[0][1] is not threading.current_thread()
+    assert threads[1][1] is threading.current_thread()
+
+
+def test_loops_share_the_free_workers(job_queue: BaseJobQueue):
+    finished = []
+    barrier = threading.Barrier(1, timeout=5)
+    for _ in range(4):
+        job_queue.put(BarrierJob(barrier=barrier, finished=finished))
+    job_executor = InFlightJobExecutor(max_workers=1)
+
+    async def run_two_loops() -> None:
+        await asyncio.gather(
+            *(
+                job_queue_loop(
+                    stop_when_queue_empties=True,
+                    job_queue=job_queue,
+                    job_executor=job_executor,
+                )
+                for _ in range(2)
+            )
+        )
+
+    asyncio.run(run_two_loops())
+    job_executor.shutdown()
+
+    assert job_executor.max_in_flight == 1
+    assert len(finished) == 4
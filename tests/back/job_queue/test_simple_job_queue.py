@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from DashAI.back.dependencies.job_queues import BaseJobQueue, SimpleJobQueue
@@ -12,6 +14,12 @@ class DummyJob(BaseJob):
     def set_status_as_delivered(self) -> None:
         return None
 
+    def set_status_as_error(self) -> None:
+        return None
+
+    def get_group(self):
+        return self.kwargs.get("group")
+
 
 @pytest.fixture(name="job_queue")
 def fixture_job_queue() -> BaseJobQueue:
@@ -134,3 +142,64 @@ def test_peek_nonexistent_job(job_queue: BaseJobQueue):
     job_queue.put(job)
     with pytest.raises(JobQueueError):
         job_queue.peek(job_id=-1)
+
+
+def test_cancel_job_keeps_order(job_queue: BaseJobQueue):
+    job_ids = [job_queue.put(DummyJob()) for _ in range(4)]
+
+    assert job_queue.get(job_ids[1]).id == job_ids[1]
+    assert job_queue.peek(job_ids[2]).id == job_ids[2]
+
+    assert [job.id for job in job_queue.to_list()] == [
+        job_ids[0],
+        job_ids[2],
+        job_ids[3],
+    ]
+    assert job_queue.get().id == job_ids[0]
+
+
+def test_async_get_waits_for_job(job_queue: BaseJobQueue):
+    async def put_later():
+        await asyncio.sleep(0.01)
+        return job_queue.put(DummyJob())
+
+    async def get_and_put():
+        job, job_id = await asyncio.gather(job_queue.async_get(), put_later())
+        return job, job_id
+
+    job, job_id = asyncio.run(get_and_put())
+    assert job.id == job_id
+    assert job_queue.is_empty()
+
+
+def test_get_jobs_by_priority(job_queue):
+    low_id = job_queue.put(DummyJob())
+    high_id = job_queue.put(DummyJob(priority=5))
+    default_id = job_queue.put(DummyJob())
+
+    assert job_queue.peek().id == high_id
+    assert [job_queue.get().id for _ in range(3)] == [high_id, low_id, default_id]
+
+
+def test_get_jobs_sharing_groups(job_queue):
+    a_1_id = job_queue.put(DummyJob(group="a"))
+    a_2_id = job_queue.put(DummyJob(group="a"))
+    a_3_id = job_queue.put(DummyJob(group="a"))
+    b_1_id = job_queue.put(DummyJob(group="b"))
+    b_2_id = job_queue.put(DummyJob(group="b"))
+
+    assert [job_queue.get().id for _ in range(5)] == [
+        a_1_id,
+        b_1_id,
+        a_2_id,
+        b_2_id,
+        a_3_id,
+    ]
+
+
+def test_get_cheapest_job_of_group(job_queue):
+    unknown_id = job_queue.put(DummyJob())
+    long_id = job_queue.put(DummyJob(estimated_cost=100.0))
+    short_id = job_queue.put(DummyJob(estimated_cost=1.0))
+
+    assert [job_queue.get().id for _ in range(3)] == [short_id, long_id, unknown_id]
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+
+import pytest
+from kink import di
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from DashAI.back.dependencies.database import setup_sqlite_db
+from DashAI.back.dependencies.database.models import Base
+from DashAI.back.dependencies.job_queues import SQLiteJobQueue
+from DashAI.back.dependencies.job_queues.base_job_queue import JobQueueError
+from DashAI.back.dependencies.registry import ComponentRegistry
+from DashAI.back.job.base_job import BaseJob
+
+
+class DummyJob(BaseJob):
+    def run(self) -> None:
+        return None
+
+    def set_status_as_delivered(self) -> None:
+        return None
+
+    def set_status_as_error(self) -> None:
+        return None
+
+    def get_group(self):
+        return self.kwargs.get("group")
+
+
+@pytest.fixture(name="session_factory")
+def fixture_session_factory(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(
+        di._services,
+        "component_registry",
+        ComponentRegistry(initial_components=[DummyJob]),
+    )
+    engine, session_factory = setup_sqlite_db(
+        {
+            "SQLITE_DB_PATH": tmp_path / "db.sqlite",
+            "LOGGING_LEVEL": logging.ERROR,
+        }
+    )
+    Base.metadata.create_all(bind=engine)
+    yield session_factory
+    engine.dispose()
+
+
+@pytest.fixture(name="job_queue")
+def fixture_job_queue(session_factory) -> SQLiteJobQueue:
+    return SQLiteJobQueue(session_factory=session_factory, poll_interval=0.01)
+
+
+def test_put_and_list_jobs(job_queue: SQLiteJobQueue):
+    assert job_queue.is_empty()
+    assert job_queue.to_list() == []
+
+    job_1_id = job_queue.put(DummyJob(run_id=1))
+    job_2_id = job_queue.put(DummyJob(run_id=2))
+
+    assert not job_queue.is_empty()
+    jobs = job_queue.to_list()
+    assert [job.id for job in jobs] == [job_1_id, job_2_id]
+    assert jobs[0].kwargs == {"run_id": 1}
+    assert isinstance(jobs[0], DummyJob)
+
+
+def test_put_does_not_store_the_session(job_queue: SQLiteJobQueue, session_factory):
+    job = DummyJob(run_id=1, db=session_factory())
+    job_id = job_queue.put(job)
+    assert "db" not in job.kwargs
+    assert "db" not in job_queue.peek(job_id).kwargs
+
+
+def test_get_claims_jobs(job_queue: SQLiteJobQueue):
+    job_1_id = job_queue.put(DummyJob(run_id=1))
+    job_2_id = job_queue.put(DummyJob(run_id=2))
+
+    job = job_queue.get()
+    assert job.id == job_1_id
+    job_session = job.kwargs["db"]
+    assert isinstance(job_session, Session)
+    assert [job.id for job in job_queue.to_list()] == [job_2_id]
+
+    job_session.execute(select(1))
+    assert job_session.in_transaction()
+    job_queue.task_done(job)
+    assert not job_session.in_transaction()
+    assert "db" not in job.kwargs
+    assert job_queue.get().id == job_2_id
+    assert job_queue.is_empty()
+
+
+def test_cancel_and_peek_jobs(job_queue: SQLiteJobQueue):
+    job_1_id = job_queue.put(DummyJob(run_id=1))
+    job_2_id = job_queue.put(DummyJob(run_id=2))
+
+    assert job_queue.peek().id == job_1_id
+    assert job_queue.peek(job_2_id).id == job_2_id
+    assert job_queue.get(job_2_id).id == job_2_id
+    assert [job.id for job in job_queue.to_list()] == [job_1_id]
+
+    with pytest.raises(JobQueueError):
+        job_queue.get(job_2_id)
+    with pytest.raises(JobQueueError):
+        job_queue.peek(job_2_id)
+
+
+def test_empty_queue_errors(job_queue: SQLiteJobQueue):
+    with pytest.raises(JobQueueError):
+        job_queue.get()
+    with pytest.raises(JobQueueError):
+        job_queue.peek()
+
+
+def test_jobs_persist_and_recover(job_queue: SQLiteJobQueue, session_factory):
+    job_1_id = job_queue.put(DummyJob(run_id=1))
+    job_2_id = job_queue.put(DummyJob(run_id=2))
+    # The first job was running when the application stopped.
+    job_queue.get()
+
+    restarted_queue = SQLiteJobQueue(session_factory=session_factory)
+    assert [job.id for job in restarted_queue.to_list()] == [job_2_id]
+    assert restarted_queue.recover() == 1
+    assert [job.id for job in restarted_queue.to_list()] == [job_1_id, job_2_id]
+
+
+def test_async_get_job(job_queue: SQLiteJobQueue):
+    job_id = job_queue.put(DummyJob(run_id=1))
+    job = asyncio.run(job_queue.async_get())
+    assert job.id == job_id
+    assert job_queue.is_empty()
+
+
+def test_get_jobs_by_priority(job_queue):
+    low_id = job_queue.put(DummyJob())
+    high_id = job_queue.put(DummyJob(priority=5))
+    default_id = job_queue.put(DummyJob())
+
+    assert job_queue.peek().id == high_id
+    assert [job_queue.get().id for _ in range(3)] == [high_id, low_id, default_id]
+
+
+def test_get_jobs_sharing_groups(job_queue):
+    a_1_id = job_queue.put(DummyJob(group="a"))
+    a_2_id = job_queue.put(DummyJob(group="a"))
+    a_3_id = job_queue.put(DummyJob(group="a"))
+    b_1_id = job_queue.put(DummyJob(group="b"))
+    b_2_id = job_queue.put(DummyJob(group="b"))
+
+    assert [job_queue.get().id for _ in range(5)] == [
+        a_1_id,
+        b_1_id,
+        a_2_id,
+        b_2_id,
+        a_3_id,
+    ]
+
+
+def test_get_cheapest_job_of_group(job_queue):
+    unknown_id = job_queue.put(DummyJob())
+    long_id = job_queue.put(DummyJob(estimated_cost=100.0))
+    short_id = job_queue.put(DummyJob(estimated_cost=1.0))
+
+    assert [job_queue.get().id for _ in range(3)] == [short_id, long_id, unknown_id]
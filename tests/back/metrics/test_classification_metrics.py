@@ -2,12 +2,17 @@ from typing import Dict, List
 
 import numpy as np
 import pytest
-from datasets import Dataset
+from datasets import ClassLabel, Dataset, Features
+from sklearn import metrics as sklearn_metrics
 
 from DashAI.back.metrics.classification.accuracy import Accuracy
 from DashAI.back.metrics.classification.f1 import F1
 from DashAI.back.metrics.classification.precision import Precision
 from DashAI.back.metrics.classification.recall import Recall
+from DashAI.back.metrics.classification_metric import (
+    ClassificationMetric,
+    confusion_matrix,
+)
 
 
 @pytest.fixture(scope="module", name="metric_input")
@@ -80,3 +85,71 @@ def test_metrics_different_input_sizes(metric_input: Dict[str, List[int]]):
         match=error_pattern,
     ):
         F1.score(metric_input["true_labels"], metric_input["wrong_size_labels"])
+
+
+def test_confusion_matrix():
+    matrix = confusion_matrix(np.array([0, 1, 2, 2]), np.array([0, 2, 2, 1]), 3)
+
+    assert matrix.tolist() == [[1, 0, 0], [0, 0, 1], [0, 1, 1]]
+
+
+def test_score_batch(metric_input: Dict[str, List[int]]):
+    metrics = [Accuracy, Precision, Recall, F1]
+    scores = ClassificationMetric.score_batch(
+        metrics, metric_input["true_labels"], metric_input["pred_labels"]
+    )
+
+    assert list(scores) == ["Accuracy", "Precision", "Recall", "F1"]
+    for metric in metrics:
+        assert scores[metric.__name__] == pytest.approx(
+            metric.score(metric_input["true_labels"], metric_input["pred_labels"])
+        )
+
+
+def test_score_batch_binary_labels():
+    true_labels = np.array([0, 1, 1, 0, 1])
+    probs = np.array([[0.9, 0.1], [0.2, 0.8], [0.7, 0.3], [0.4, 0.6], [0.1, 0.9]])
+
+    scores = ClassificationMetric.score_batch(
+        [Accuracy, Precision, Recall, F1], true_labels, probs
+    )
+
+    assert scores == pytest.approx(
+        {"Accuracy": 0.6, "Precision": 2 / 3, "Recall": 2 / 3, "F1": 2 / 3}
+    )
+
+
+def test_score_batch_lacking_a_class_matches_sklearn():
+    # The dataset has three classes, but the batch has no example of the last one.
+    true_labels = Dataset.from_dict(
+        {"foo": [0, 1, 0, 1, 1]},
+        features=Features({"foo": ClassLabel(names=["a", "b", "c"])}),
+    )
+    probs = np.array(
+        [
+            [0.8, 0.1, 0.1],
+            [0.1, 0.8, 0.1],
+            [0.3, 0.6, 0.1],
+            [0.2, 0.7, 0.1],
+            [0.6, 0.3, 0.1],
+        ]
+    )
+    pred_labels = np.argmax(probs, axis=1)
+
+    scores = ClassificationMetric.score_batch(
+        [Accuracy, Precision, Recall, F1], true_labels, probs
+    )
+
+    labels = true_labels["foo"]
+    assert scores == pytest.approx(
+        {
+            "Accuracy": sklearn_metrics.accuracy_score(labels, pred_labels),
+            "Precision": sklearn_metrics.precision_score(
+                labels, pred_labels, average="macro"
+            ),
+            "Recall": sklearn_metrics.recall_score(
+                labels, pred_labels, average="macro"
+            ),
+            "F1": sklearn_metrics.f1_score(labels, pred_labels, average="macro"),
+        }
+    )
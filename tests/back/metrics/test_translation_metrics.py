@@ -3,6 +3,7 @@
 import pytest
 from datasets import Dataset
 
+from DashAI.back.metrics import translation_metric
 from DashAI.back.metrics.translation.bleu import Bleu
 from DashAI.back.metrics.translation.ter import Ter
 
@@ -41,3 +42,35 @@ def test_metrics_different_input_sizes(metric_input: dict):
 
     with pytest.raises(ValueError, match=err_pattern):
         Ter.score(metric_input["true_sentences"], metric_input["wrong_size_sentences"])
+
+
+def test_metrics_computed_in_batches(monkeypatch: pytest.MonkeyPatch):
+    references = [
+        "the cat sat on the mat today",
+        "a dog ran away from the big house",
+        "hello there my good friend .",
+    ]
+    hypotheses = [
+        "the cat sat on a mat today",
+        "a dog ran from the house",
+        "hello there my friend !",
+    ]
+    dataset = Dataset.from_list([{"foo": sentence} for sentence in references])
+    bleu = Bleu.score(dataset, hypotheses)
+    ter = Ter.score(dataset, hypotheses)
+
+    monkeypatch.setattr(translation_metric, "SENTENCES_BATCH_SIZE", 2)
+
+    assert Bleu.score(dataset, hypotheses) == pytest.approx(bleu)
+    assert Ter.score(dataset, hypotheses) == pytest.approx(ter)
+    assert 0.0 < bleu < 1.0
+    assert ter > 0.0
+
+
+def test_metrics_loaded_once():
+    assert translation_metric.get_metric("bleu") is translation_metric.get_metric(
+        "bleu"
+    )
+    assert translation_metric.get_metric("ter") is not translation_metric.get_metric(
+        "bleu"
+    )
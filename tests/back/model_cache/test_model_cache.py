@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from DashAI.back.dependencies.model_cache import ModelCache
+
+
+class DummyModel:
+    loaded = []
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    @classmethod
+    def load(cls, filename):
+        cls.loaded.append(filename)
+        return cls(filename)
+
+
+@pytest.fixture(name="saved_models")
+def fixture_saved_models(tmp_path):
+    DummyModel.loaded = []
+    paths = []
+    for run_id in range(3):
+        path = tmp_path / str(run_id)
+        path.write_bytes(b"0" * 10)
+        paths.append(str(path))
+    return paths
+
+
+def test_models_are_loaded_once(saved_models):
+    cache = ModelCache(max_size=100)
+
+    first = cache.get(0, saved_models[0], DummyModel)
+    second = cache.get(0, saved_models[0], DummyModel)
+
+    assert first is second
+    assert DummyModel.loaded == [saved_models[0]]
+    assert cache.size == 10
+
+
+def test_least_recently_used_models_are_evicted(saved_models):
+    cache = ModelCache(max_size=25)
+
+    cache.get(0, saved_models[0], DummyModel)
+    cache.get(1, saved_models[1], DummyModel)
+    cache.get(0, saved_models[0], DummyModel)
+    cache.get(2, saved_models[2], DummyModel)
+    cache.get(0, saved_models[0], DummyModel)
+    cache.get(1, saved_models[1], DummyModel)
+
+    assert DummyModel.loaded == [saved_models[i] for i in (0, 1, 2, 1)]
+    assert cache.size == 20
+
+
+def test_models_larger_than_the_cache_are_not_cached(saved_models):
+    cache = ModelCache(max_size=5)
+
+    cache.get(0, saved_models[0], DummyModel)
+    cache.get(0, saved_models[0], DummyModel)
+
+    assert DummyModel.loaded == [saved_models[0]] * 2
+    assert cache.size == 0
+
+
+def test_retrained_models_are_reloaded(saved_models):
+    cache = ModelCache(max_size=100)
+    first = cache.get(0, saved_models[0], DummyModel)
+
+    with open(saved_models[0], "wb") as file:
+        file.write(b"1" * 20)
+    mtime = os.stat(saved_models[0]).st_mtime_ns + 1_000_000
+    os.utime(saved_models[0], ns=(mtime, mtime))
+
+    assert cache.get(0, saved_models[0], DummyModel) is not first
+    assert cache.size == 20
+
+
+def test_saved_directories_are_versioned_by_their_files(tmp_path):
+    DummyModel.loaded = []
+    (tmp_path / "config.json").write_text("{}")
+    weights = tmp_path / "model.safetensors"
+    weights.write_bytes(b"0" * 10)
+    cache = ModelCache(max_size=100)
+
+    first = cache.get(0, str(tmp_path), DummyModel)
+    assert cache.get(0, str(tmp_path), DummyModel) is first
+    assert cache.size == 12
+
+    weights.write_bytes(b"1" * 10)
+    mtime = os.stat(weights).st_mtime_ns + 1_000_000
+    os.utime(weights, ns=(mtime, mtime))
+
+    assert cache.get(0, str(tmp_path), DummyModel) is not first
+
+
+def test_invalidate(saved_models):
+    cache = ModelCache(max_size=100)
+    cache.get(0, saved_models[0], DummyModel)
+
+    cache.invalidate(0)
+    cache.invalidate(1)
+    cache.get(0, saved_models[0], DummyModel)
+
+    assert DummyModel.loaded == [saved_models[0]] * 2
+    assert cache.size == 10
@@ -1,9 +1,12 @@
+import copy
 import io
 import os
 
 import numpy as np
 import pytest
 from datasets import DatasetDict
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import CountVectorizer
 from starlette.datastructures import UploadFile
 
 from DashAI.back.dataloaders.classes.dashai_dataset import (
@@ -13,7 +16,7 @@ from DashAI.back.dataloaders.classes.dashai_dataset import (
     to_dashai_dataset,
 )
 from DashAI.back.dataloaders.classes.json_dataloader import JSONDataLoader
-from DashAI.back.models import RandomForestClassifier
+from DashAI.back.models import HistGradientBoostingClassifier, RandomForestClassifier
 from DashAI.back.models.scikit_learn.bow_text_classification_model import (
     BagOfWordsTextClassificationModel,
 )
@@ -92,6 +95,111 @@ def test_predict_tabular_models(splited_dataset: DatasetDict, model_params: dict
     assert y["test"].num_rows == len(y_pred_bowtcm)
 
 
+def test_sparse_input_for_sparse_classifiers(
+    splited_dataset: DatasetDict, model_params: dict
+):
+    x, _ = splited_dataset
+    submodel = RandomForestClassifier(**model_params["tabular_classifier"]["params"])
+    bowtc_model = BagOfWordsTextClassificationModel(submodel, **model_params)
+    bowtc_model.vectorizer.fit(x["train"]["text"])
+
+    matrix = bowtc_model._vectorize(x["test"])
+    classifier_input = bowtc_model._to_classifier_input(matrix)
+
+    assert isinstance(classifier_input, csr_matrix)
+    assert classifier_input.shape == (
+        x["test"].num_rows,
+        len(bowtc_model.vectorizer.vocabulary_),
+    )
+
+
+def test_dense_input_for_dense_classifiers(
+    splited_dataset: DatasetDict, model_params: dict
+):
+    x, y = splited_dataset
+    submodel = HistGradientBoostingClassifier(max_iter=2)
+    bowtc_model = BagOfWordsTextClassificationModel(submodel, **model_params)
+    bowtc_model.DENSE_BATCH_SIZE = 2
+    bowtc_model.fit(x["train"], y["train"])
+
+    matrix = bowtc_model._vectorize(x["test"])
+    classifier_input = bowtc_model._to_classifier_input(matrix)
+    y_pred_bowtcm = bowtc_model.predict(x["test"])
+
+    assert isinstance(classifier_input, np.ndarray)
+    assert np.array_equal(classifier_input, matrix.toarray())
+    # The rows are predicted in batches of DENSE_BATCH_SIZE.
+    assert np.allclose(y_pred_bowtcm, submodel.predict(classifier_input))
+    assert y["test"].num_rows == len(y_pred_bowtcm)
+
+
+def test_vocabulary_limited_for_dense_classifiers(
+    splited_dataset: DatasetDict, model_params: dict
+):
+    x, y = splited_dataset
+    sparse_model = BagOfWordsTextClassificationModel(
+        RandomForestClassifier(**model_params["tabular_classifier"]["params"]),
+        **model_params,
+    )
+    sparse_model.fit(x["train"], y["train"])
+    vocabulary_size = len(sparse_model.vectorizer.vocabulary_)
+    dense_model = BagOfWordsTextClassificationModel(
+        HistGradientBoostingClassifier(max_iter=2), **model_params
+    )
+    dense_model.MAX_DENSE_SIZE = (vocabulary_size - 1) * x["train"].num_rows
+    dense_model.fit(x["train"], y["train"])
+
+    assert len(dense_model.vectorizer.vocabulary_) == vocabulary_size - 1
+    assert len(dense_model.predict(x["test"])) == x["test"].num_rows
+
+
+def test_vectorizer_cached_between_fits(
+    splited_dataset: DatasetDict, model_params: dict, monkeypatch: pytest.MonkeyPatch
+):
+    x, y = splited_dataset
+    submodel = RandomForestClassifier(**model_params["tabular_classifier"]["params"])
+    bowtc_model = BagOfWordsTextClassificationModel(submodel, **model_params)
+    vectorizer_fits = []
+    fit = CountVectorizer.fit
+    monkeypatch.setattr(
+        CountVectorizer,
+        "fit",
+        lambda self, raw_documents: vectorizer_fits.append(1)
+        or fit(self, raw_documents),
+    )
+
+    bowtc_model.fit(x["train"], y["train"])
+    matrix = bowtc_model._vectorize(x["validation"])
+    trial_model = copy.deepcopy(bowtc_model)
+    trial_model.classifier.n_estimators = 2
+    trial_model.fit(x["train"], y["train"])
+
+    assert len(vectorizer_fits) == 1
+    assert trial_model._vectorize(x["validation"]) is matrix
+
+    bowtc_model.vectorizer.ngram_range = (1, 2)
+    bowtc_model.fit(x["train"], y["train"])
+
+    assert len(vectorizer_fits) == 2
+    assert bowtc_model._vectorize(x["validation"]) is not matrix
+
+
+def test_vectorizer_cache_is_bounded(
+    splited_dataset: DatasetDict, model_params: dict, monkeypatch: pytest.MonkeyPatch
+):
+    x, y = splited_dataset
+    monkeypatch.setattr(BagOfWordsTextClassificationModel, "VECTORIZER_CACHE_SIZE", 2)
+    submodel = RandomForestClassifier(**model_params["tabular_classifier"]["params"])
+    bowtc_model = BagOfWordsTextClassificationModel(submodel, **model_params)
+
+    for ngram_max_n in [1, 2, 3]:
+        bowtc_model.vectorizer.ngram_range = (1, ngram_max_n)
+        bowtc_model.fit(x["train"], y["train"])
+
+    assert [key[0] for key in bowtc_model._cache.vectorizers] == [(1, 2), (1, 3)]
+    assert len(bowtc_model._cache.matrices) <= bowtc_model.MATRIX_CACHE_SIZE
+
+
 def test_save_and_load_model(splited_dataset: DatasetDict, model_params: dict):
     x, y = splited_dataset
     submodel = RandomForestClassifier(**model_params["tabular_classifier"]["params"])
@@ -102,6 +210,9 @@ def test_save_and_load_model(splited_dataset: DatasetDict, model_params: dict):
     bowtc_model.save(nwft_filename)
     loaded_model = SklearnLikeModel.load(nwft_filename)
 
+    assert len(loaded_model._cache.vectorizers) == 0
+    assert len(loaded_model._cache.matrices) == 0
+
     y_pred_bowtcm = loaded_model.predict(x["test"])
 
     assert isinstance(y_pred_bowtcm, np.ndarray)
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+import torch
+from datasets import Dataset, Features, Image
+from PIL import Image as PILImage
+from transformers import (
+    BertTokenizer,
+    DistilBertConfig,
+    DistilBertForSequenceClassification,
+    DistilBertTokenizer,
+    MarianConfig,
+    MarianMTModel,
+    ViTConfig,
+    ViTFeatureExtractor,
+    ViTForImageClassification,
+)
+
+from DashAI.back.models import (
+    DistilBertTransformer,
+    OpusMtEnESTransformer,
+    ViTTransformer,
+)
+
+WORDS = ["the", "cat", "dog", "sat", "on", "a", "mat", "and", "ran", "away"]
+SENTENCES = [
+    "the cat sat on the mat and ran away",
+    "a dog",
+    "the dog sat on a mat",
+    "cat",
+    "the cat and the dog ran away on a mat",
+]
+
+
+@pytest.fixture(name="vocab_file")
+def fixture_vocab_file(tmp_path) -> str:
+    vocab_file = tmp_path / "vocab.txt"
+    special_tokens = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    vocab_file.write_text("\n".join(special_tokens + WORDS))
+    return str(vocab_file)
+
+
+@pytest.fixture(name="sentences")
+def fixture_sentences() -> Dataset:
+    return Dataset.from_dict({"text": SENTENCES})
+
+
+def _fitted(model_class, **attributes):
+    """Build a fitted model from tiny components, without the hub checkpoints."""
+    model = object.__new__(model_class)
+    model.fitted = True
+    for name, value in attributes.items():
+        setattr(model, name, value)
+    return model
+
+
+def test_distilbert_predict_keeps_the_order(vocab_file: str, sentences: Dataset):
+    torch.manual_seed(0)
+    model = _fitted(
+        DistilBertTransformer,
+        tokenizer=DistilBertTokenizer(vocab_file),
+        model=DistilBertForSequenceClassification(
+            DistilBertConfig(
+                vocab_size=len(WORDS) + 5,
+                dim=16,
+                n_layers=1,
+                n_heads=2,
+                hidden_dim=32,
+                num_labels=3,
+            )
+        ),
+    )
+
+    probabilities = model.predict(sentences, batch_size=2)
+
+    assert probabilities.shape == (len(SENTENCES), 3)
+    for i in range(len(SENTENCES)):
+        assert probabilities[i] == pytest.approx(
+            model.predict(sentences.select([i]))[0], abs=1e-5
+        )
+
+
+def test_opus_mt_predict_keeps_the_order(vocab_file: str, sentences: Dataset):
+    torch.manual_seed(0)
+    tokenizer = BertTokenizer(vocab_file)
+    model = _fitted(
+        OpusMtEnESTransformer,
+        tokenizer=tokenizer,
+        model=MarianMTModel(
+            MarianConfig(
+                vocab_size=tokenizer.vocab_size,
+                d_model=16,
+                encoder_layers=1,
+                decoder_layers=1,
+                encoder_attention_heads=2,
+                decoder_attention_heads=2,
+                encoder_ffn_dim=32,
+                decoder_ffn_dim=32,
+                max_position_embeddings=64,
+                pad_token_id=tokenizer.pad_token_id,
+                eos_token_id=tokenizer.sep_token_id,
+                decoder_start_token_id=tokenizer.pad_token_id,
+                max_length=8,
+            )
+        ),
+    )
+
+    translations = model.predict(sentences, batch_size=2)
+
+    assert len(translations) == len(SENTENCES)
+    # The sentences get different translations, so a wrong order is noticed.
+    assert len(set(translations)) > 1
+    for i in range(len(SENTENCES)):
+        assert translations[i] == model.predict(sentences.select([i]))[0]
+
+
+@pytest.mark.parametrize("num_workers", [0, 1])
+def test_vit_predict_keeps_the_order(num_workers: int, monkeypatch):
+    torch.manual_seed(0)
+    monkeypatch.setattr(ViTTransformer, "PREDICT_NUM_WORKERS", num_workers)
+    rng = np.random.default_rng(0)
+    images = Dataset.from_dict(
+        {
+            "image": [
+                PILImage.fromarray(
+                    rng.integers(0, 256, size=(16 + 8 * i, 24, 3), dtype=np.uint8)
+                )
+                for i in range(5)
+            ]
+        },
+        features=Features({"image": Image()}),
+    )
+    model = _fitted(
+        ViTTransformer,
+        feature_extractor=ViTFeatureExtractor(),
+        model=ViTForImageClassification(
+            ViTConfig(
+                image_size=224,
+                patch_size=32,
+                hidden_size=16,
+                num_hidden_layers=1,
+                num_attention_heads=2,
+                intermediate_size=32,
+                num_labels=3,
+            )
+        ),
+    )
+
+    probabilities = model.predict(images, batch_size=2)
+
+    assert probabilities.shape == (len(images), 3)
+    for i in range(len(images)):
+        assert probabilities[i] == pytest.approx(
+            model.predict(images.select([i]))[0], abs=1e-5
+        )
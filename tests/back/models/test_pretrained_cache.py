@@ -0,0 +1,47 @@
+import pytest
+
+from DashAI.back.models.hugging_face import pretrained_cache
+
+
+class DummyPretrained:
+    loaded = []
+
+    def __init__(self, name_or_path):
+        self.name_or_path = name_or_path
+
+    @classmethod
+    def from_pretrained(cls, name_or_path):
+        cls.loaded.append(name_or_path)
+        return cls(name_or_path)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    pretrained_cache.clear()
+    DummyPretrained.loaded = []
+    yield
+    pretrained_cache.clear()
+
+
+def test_components_are_loaded_once():
+    first = pretrained_cache.from_pretrained(DummyPretrained, "model")
+    second = pretrained_cache.from_pretrained(DummyPretrained, "model")
+
+    assert first is second
+    assert DummyPretrained.loaded == ["model"]
+    assert pretrained_cache.is_shared(first)
+    assert not pretrained_cache.is_shared(DummyPretrained("model"))
+
+
+def test_least_recently_used_component_is_evicted(monkeypatch):
+    monkeypatch.setattr(pretrained_cache, "CACHE_SIZE", 2)
+    evicted = pretrained_cache.from_pretrained(DummyPretrained, "a")
+    pretrained_cache.from_pretrained(DummyPretrained, "b")
+    pretrained_cache.from_pretrained(DummyPretrained, "a")
+    pretrained_cache.from_pretrained(DummyPretrained, "c")
+    pretrained_cache.from_pretrained(DummyPretrained, "a")
+    pretrained_cache.from_pretrained(DummyPretrained, "b")
+
+    assert DummyPretrained.loaded == ["a", "b", "c", "b"]
+    # Models that got an evicted component may still be using it.
+    assert pretrained_cache.is_shared(evicted)
@@ -142,6 +142,26 @@ def test_predict_tabular_models(
     assert divided_dataset[0]["test"].num_rows == len(y_pred_svm)
 
 
+def test_fit_incrementally(
+    divided_dataset: Tuple[DatasetDict, DatasetDict], model_params: dict
+):
+    rf_model = RandomForestClassifier(**{**model_params["rf"], "n_estimators": 10})
+    grown_estimators = []
+
+    rf_model.fit_incrementally(
+        divided_dataset[0]["train"],
+        divided_dataset[1]["train"],
+        lambda step: grown_estimators.append((step, len(rf_model.estimators_))),
+    )
+
+    assert grown_estimators == [(0, 2), (1, 4), (2, 6), (3, 8), (4, 10)]
+    assert rf_model.n_estimators == 10
+    assert not rf_model.warm_start
+    assert divided_dataset[0]["test"].num_rows == len(
+        rf_model.predict(divided_dataset[0]["test"])
+    )
+
+
 def test_not_fitted_model(
     divided_dataset: Tuple[DatasetDict, DatasetDict], model_params: dict
 ):
@@ -0,0 +1,138 @@
+import numpy as np
+
+from DashAI.back.optimizers import HyperOptOptimizer
+
+
+class DummyModel:
+    def __init__(self, depth: int = 1):
+        self.depth = depth
+        self.fitted_depth = None
+        self.trained_steps = 0
+
+    def fit(self, x, y):
+        self.fitted_depth = self.depth
+        return self
+
+    def fit_incrementally(self, x, y, on_step):
+        for step in range(3):
+            self.fitted_depth = self.depth
+            self.trained_steps += 1
+            on_step(step)
+        return self
+
+    def predict(self, x):
+        return np.full(len(x), self.fitted_depth)
+
+
+class DummyMetric:
+    @staticmethod
+    def score(true_labels, pred_labels):
+        return -abs(float(pred_labels[0]) - 3)
+
+
+def test_trials_do_not_share_the_model():
+    model = DummyModel()
+    optimizer = HyperOptOptimizer(
+        max_evals=8, sampler="tpe", metric={"name": "Accuracy", "class": DummyMetric}
+    )
+    data = {"train": [0] * 4, "validation": [0] * 4}
+
+    optimizer.optimize(
+        model, data, data, {"depth": (1, 9)}, "TabularClassificationTask"
+    )
+
+    assert model.fitted_depth is None
+    x, y = optimizer.get_metrics()
+    assert len(x) == len(y) == 8
+    best_model = optimizer.get_model()
+    assert best_model.fitted_depth == best_model.depth
+    assert -abs(best_model.depth - 3) == -min(y)
+
+
+def test_median_pruner_stops_bad_trials(monkeypatch):
+    trained_steps = []
+    fit_incrementally = DummyModel.fit_incrementally
+
+    def counting_fit_incrementally(self, x, y, on_step):
+        try:
+            return fit_incrementally(self, x, y, on_step)
+        finally:
+            trained_steps.append(self.trained_steps)
+
+    monkeypatch.setattr(DummyModel, "fit_incrementally", counting_fit_incrementally)
+    monkeypatch.setenv("HYPEROPT_FMIN_SEED", "0")
+    optimizer = HyperOptOptimizer(
+        max_evals=20,
+        sampler="rand",
+        metric={"name": "Accuracy", "class": DummyMetric},
+        pruner="MedianPruner",
+    )
+    data = {"train": [0] * 4, "validation": [0] * 4}
+
+    optimizer.optimize(
+        DummyModel(), data, data, {"depth": (1, 9)}, "TabularClassificationTask"
+    )
+
+    assert len(trained_steps) == 20
+    assert trained_steps[:5] == [3] * 5
+    assert min(trained_steps) == 1
+
+
+def test_pruned_trials_are_never_the_best(monkeypatch):
+    # The losses of the first step are lower than the final ones, so the partial
+    # loss of any pruned trial is better than the loss of the completed trials.
+    def fit_incrementally(self, x, y, on_step):
+        for step in range(3):
+            self.fitted_depth = self.depth if step == 0 else self.depth + 20
+            on_step(step)
+        return self
+
+    monkeypatch.setattr(DummyModel, "fit_incrementally", fit_incrementally)
+    monkeypatch.setenv("HYPEROPT_FMIN_SEED", "0")
+    optimizer = HyperOptOptimizer(
+        max_evals=12,
+        sampler="rand",
+        metric={"name": "Accuracy", "class": DummyMetric},
+        pruner="MedianPruner",
+    )
+    optimizer.pruner.n_startup_trials = 1
+    optimizer.pruner.add_trial({0: 1.0})
+    data = {"train": [0] * 4, "validation": [0] * 4}
+
+    optimizer.optimize(
+        DummyModel(), data, data, {"depth": (1, 9)}, "TabularClassificationTask"
+    )
+
+    results = [trial["result"] for trial in optimizer.trials.trials]
+    pruned_losses = [r["pruned_loss"] for r in results if r["status"] == "fail"]
+    completed_losses = [r["loss"] for r in results if r["status"] == "ok"]
+    assert pruned_losses
+    assert completed_losses
+    assert max(pruned_losses) < min(completed_losses)
+    assert optimizer.trials.best_trial["result"]["loss"] == min(completed_losses)
+    best_model = optimizer.get_model()
+    assert best_model.depth + 17 == min(completed_losses)
+
+
+def test_parallel_trials_record_the_history():
+    model = DummyModel()
+    optimizer = HyperOptOptimizer(
+        max_evals=6,
+        sampler="tpe",
+        metric={"name": "Accuracy", "class": DummyMetric},
+        n_jobs=2,
+    )
+    data = {"train": [0] * 4, "validation": [0] * 4}
+
+    optimizer.optimize(
+        model, data, data, {"depth": (1, 9)}, "TabularClassificationTask"
+    )
+
+    assert model.fitted_depth is None
+    x, y = optimizer.get_metrics()
+    assert x == list(range(6))
+    depths = [trial["misc"]["vals"]["depth"][0] for trial in optimizer.trials]
+    assert y == [abs(depth - 3) for depth in depths]
+    best_model = optimizer.get_model()
+    assert best_model.depth == depths[int(np.argmin(y))]
+    assert best_model.fitted_depth == best_model.depth
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import numpy as np
+import optuna
+
+from DashAI.back.optimizers import OptunaOptimizer
+
+
+class DummyModel:
+    def __init__(self, depth: int = 1):
+        self.depth = depth
+        self.fitted_depth = None
+
+    def fit(self, x, y):
+        # Lets the other trials start while this one is running.
+        time.sleep(0.01)
+        self.fitted_depth = self.depth
+        return self
+
+    def fit_incrementally(self, x, y, on_step):
+        for step in range(3):
+            self.fitted_depth = self.depth
+            on_step(step)
+        return self
+
+    def predict(self, x):
+        return np.full(len(x), self.fitted_depth)
+
+
+class DummyMetric:
+    threads = set()
+
+    @staticmethod
+    def score(true_labels, pred_labels):
+        DummyMetric.threads.add(threading.get_ident())
+        return -abs(float(pred_labels[0]) - 3)
+
+
+def test_parallel_trials_do_not_share_the_model():
+    model = DummyModel()
+    optimizer = OptunaOptimizer(
+        n_trials=12,
+        sampler="TPESampler",
+        pruner=None,
+        metric={"name": "Accuracy", "class": DummyMetric},
+        n_jobs=4,
+    )
+    data = {"train": [0] * 4, "validation": [0] * 4}
+
+    optimizer.optimize(
+        model, data, data, {"depth": (1, 5)}, "TabularClassificationTask"
+    )
+
+    assert len(optimizer.study.trials) == 12
+    assert len(DummyMetric.threads) > 1
+    assert model.fitted_depth is None
+    best_model = optimizer.get_model()
+    assert best_model is not model
+    assert best_model.depth == optimizer.study.best_params["depth"]
+    assert best_model.fitted_depth == best_model.depth
+
+
+def test_median_pruner_stops_bad_trials(monkeypatch):
+    sampler = optuna.samplers.TPESampler
+    monkeypatch.setattr(
+        optuna.samplers, "TPESampler", lambda **kwargs: sampler(seed=0, **kwargs)
+    )
+    optimizer = OptunaOptimizer(
+        n_trials=20,
+        sampler="TPESampler",
+        pruner="MedianPruner",
+        metric={"name": "Accuracy", "class": DummyMetric},
+    )
+    data = {"train": [0] * 4, "validation": [0] * 4}
+
+    optimizer.optimize(
+        DummyModel(), data, data, {"depth": (1, 9)}, "TabularClassificationTask"
+    )
+
+    states = [trial.state for trial in optimizer.study.trials]
+    assert optuna.trial.TrialState.PRUNED in states
+    x, y = optimizer.get_metrics()
+    assert len(x) == states.count(optuna.trial.TrialState.COMPLETE)
+    assert None not in y
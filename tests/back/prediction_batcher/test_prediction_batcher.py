@@ -0,0 +1,125 @@
+import asyncio
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from DashAI.back.dependencies.prediction_batcher import PredictionBatcher
+
+
+class DummyModel:
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, x):
+        values = x["value"]
+        self.batches.append(values)
+        if None in values:
+            raise ValueError("Missing value")
+        return np.array(values, dtype=object) * 2
+
+
+def _rows(*values):
+    return pa.table({"value": list(values)})
+
+
+def test_concurrent_requests_are_predicted_together():
+    model = DummyModel()
+    batcher = PredictionBatcher(max_batch_size=10, max_delay=0.05)
+
+    async def predict_concurrently():
+        return await asyncio.gather(
+            batcher.predict(model, _rows(1)),
+            batcher.predict(model, _rows(2, 3)),
+            batcher.predict(model, _rows(4.5)),
+        )
+
+    results = asyncio.run(predict_concurrently())
+
+    assert [result.tolist() for result in results] == [[2], [4, 6], [9]]
+    assert model.batches == [[1, 2, 3, 4.5]]
+
+
+def test_batches_are_predicted_when_they_are_full():
+    model = DummyModel()
+    batcher = PredictionBatcher(max_batch_size=2, max_delay=60)
+
+    async def predict_concurrently():
+        return await asyncio.wait_for(
+            asyncio.gather(*(batcher.predict(model, _rows(i)) for i in range(4))),
+            timeout=5,
+        )
+
+    results = asyncio.run(predict_concurrently())
+
+    assert [result.tolist() for result in results] == [[0], [2], [4], [6]]
+    assert model.batches == [[0, 1], [2, 3]]
+
+
+def test_batch_size_one_predicts_each_request():
+    model = DummyModel()
+    batcher = PredictionBatcher(max_batch_size=1, max_delay=60)
+
+    async def predict_concurrently():
+        return await asyncio.wait_for(
+            asyncio.gather(
+                batcher.predict(model, _rows(1)), batcher.predict(model, _rows(2))
+            ),
+            timeout=5,
+        )
+
+    asyncio.run(predict_concurrently())
+
+    assert sorted(model.batches) == [[1], [2]]
+
+
+def test_different_models_are_not_batched_together():
+    models = [DummyModel(), DummyModel()]
+    batcher = PredictionBatcher(max_batch_size=10, max_delay=0.01)
+
+    async def predict_concurrently():
+        return await asyncio.gather(
+            batcher.predict(models[0], _rows(1)),
+            batcher.predict(models[1], _rows(2)),
+        )
+
+    asyncio.run(predict_concurrently())
+
+    assert [model.batches for model in models] == [[[1]], [[2]]]
+
+
+def test_errors_are_raised_to_every_request():
+    model = DummyModel()
+    batcher = PredictionBatcher(max_batch_size=10, max_delay=0.01)
+
+    async def predict_concurrently():
+        return await asyncio.gather(
+            batcher.predict(model, _rows(1)),
+            batcher.predict(model, _rows(None)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(predict_concurrently())
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_incompatible_requests_are_predicted_separately():
+    model = DummyModel()
+    batcher = PredictionBatcher(max_batch_size=10, max_delay=0.01)
+
+    async def predict_concurrently():
+        return await asyncio.gather(
+            batcher.predict(model, _rows(1)),
+            batcher.predict(model, _rows("a")),
+        )
+
+    results = asyncio.run(predict_concurrently())
+
+    assert [result.tolist() for result in results] == [[2], ["aa"]]
+    assert model.batches == [[1], ["a"]]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError, match="max_batch_size"):
+        PredictionBatcher(max_batch_size=0)